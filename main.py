@@ -1,12 +1,45 @@
 # main.py
 
 import argparse
+import contextlib
 import json
 import os
 from datetime import datetime
 
+from src.cache.stage_cache import StageCache
+from src.checkpoint.checkpoint import CheckpointStore
+from src.coverage.suite_minimizer import SuiteMinimizer
+from src.metrics.instrumentation import Metrics
+from src.metrics.profiling import StageProfiler
 from src.pipeline.orchestrator import Orchestrator
-from src.visualisation.visualisations import generate_all_visualisations
+from src.sharding.shards import (
+    load_partials,
+    merge_partials,
+    parse_shard_spec,
+    partial_path,
+    run_shard,
+    write_partial,
+)
+from src.utils.fileio import atomic_write_json, atomic_write_text, file_sha256
+
+# Arguments that shape a run's outputs: recorded in the checkpoint manifest
+# and restored by --resume
+RESUMED_ARGS = (
+    "file",
+    "minimise",
+    "cache_dir",
+    "no_cache",
+    "no_metrics",
+    "profile",
+    "columnar",
+    "store",
+    "no_plots",
+    "plot_points",
+    "plot_workers",
+)
+
+# Heavy modules (matplotlib, torch, faiss) are imported only by the stages
+# that need them, keeping --help and JSON-only runs fast to start.
 
 
 # ---------------------------------------------------------
@@ -23,8 +56,7 @@ def load_test_cases(path: str):
 # ---------------------------------------------------------
 def save_text_report(report_text: str, out_dir: str):
     path = os.path.join(out_dir, "report.md")
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(report_text)
+    atomic_write_text(path, report_text)
     print(f"[OK] Saved text report → {path}")
 
 
@@ -33,11 +65,27 @@ def save_text_report(report_text: str, out_dir: str):
 # ---------------------------------------------------------
 def save_json(name: str, data, out_dir: str):
     path = os.path.join(out_dir, f"{name}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    atomic_write_json(path, data, indent=4)
     print(f"[OK] Saved {name} → {path}")
 
 
+# ---------------------------------------------------------
+# SAVE ALL REPORT ARTIFACTS
+# ---------------------------------------------------------
+def save_artifacts(report, out_dir: str):
+    # Readable report
+    save_text_report(report["text_report"], out_dir)
+
+    # Case ids + raw + validated + optimized steps
+    save_json("cases", report.get("cases", []), out_dir)
+    save_json("steps_raw", report.get("steps_raw", []), out_dir)
+    save_json("steps_validated", report.get("steps_validated", []), out_dir)
+    save_json("steps_optimized", report.get("steps", []), out_dir)
+
+    # Issues
+    save_json("issues", report.get("issues", []), out_dir)
+
+
 # ---------------------------------------------------------
 # MAIN PIPELINE ENTRY POINT
 # ---------------------------------------------------------
@@ -47,16 +95,139 @@ def main():
         "--file", default="data/test_cases.json", help="Path to test cases JSON"
     )
     parser.add_argument("--run_name", default=None, help="Name of the test run folder")
+    parser.add_argument(
+        "--minimise",
+        action="store_true",
+        help="Only run a near-minimal subset of cases preserving transition coverage",
+    )
+    parser.add_argument(
+        "--cache_dir", default=".avtc_cache/stages", help="Per-case stage cache folder"
+    )
+    parser.add_argument(
+        "--no_cache", action="store_true", help="Bypass the per-case stage cache"
+    )
+    parser.add_argument(
+        "--clear_cache",
+        action="store_true",
+        help="Delete the per-case stage cache before running",
+    )
+    parser.add_argument(
+        "--no_metrics",
+        action="store_true",
+        help="Disable per-stage timing / counters (metrics.json + metrics.prom)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=StageProfiler.MODES,
+        default=None,
+        help="Profile every stage: cpu (cProfile + collapsed stacks) or mem (tracemalloc)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream cases through the stages with bounded queues (async)",
+    )
+    parser.add_argument(
+        "--batch_size", type=int, default=32, help="Cases per NLP batch in --stream mode"
+    )
+    parser.add_argument(
+        "--queue_size",
+        type=int,
+        default=4,
+        help="Max batches buffered between stages in --stream mode",
+    )
+    parser.add_argument(
+        "--stream_report",
+        action="store_true",
+        help="Write report.md + JSON Lines artifacts while streaming (implies --stream)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Also write the step artifacts as memory-mappable columns (reports/columnar/)",
+    )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help="Move the run's artifacts into the deduplicated store (reports/.store)",
+    )
+    parser.add_argument(
+        "--no_plots",
+        "--no-plots",
+        action="store_true",
+        help="Skip the PNG visualisations (matplotlib is never imported)",
+    )
+    parser.add_argument(
+        "--plot_points",
+        type=int,
+        default=5000,
+        help="Max points drawn per plot; longer timelines are downsampled (0 = all)",
+    )
+    parser.add_argument(
+        "--plot_workers",
+        type=int,
+        default=None,
+        help="Worker processes for plot rendering (default: automatic, 1 = in-process)",
+    )
+    parser.add_argument(
+        "--shard",
+        default=None,
+        help="Run only shard i/N (NLP + Reasoner) and write a mergeable partial",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge reports/<run_name>/shards/* into a full run",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="RUN_NAME",
+        help="Resume an interrupted run from its checkpoints",
+    )
+    parser.add_argument(
+        "--checkpoint_batch",
+        type=int,
+        default=256,
+        help="Cases per checkpointed NLP + Reasoner batch",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Checkpoint every stage so an interrupted run can be resumed",
+    )
     args = parser.parse_args()
 
-    # 1. Load test cases
-    test_cases = load_test_cases(args.file)
+    if args.stream_report:
+        args.stream = True
+
+    if args.resume:
+        if args.run_name and args.run_name != args.resume:
+            parser.error("--resume already names the run; drop --run_name")
+        if args.shard or args.merge or args.stream:
+            parser.error("--resume only applies to checkpointed batch runs")
+        args.run_name = args.resume
+        args.checkpoint = True
+
+    if args.stream and args.profile:
+        parser.error("--profile is not supported together with --stream")
+    if (args.shard or args.merge) and not args.run_name:
+        parser.error("--shard / --merge need an explicit --run_name shared by all nodes")
+    if args.shard and (args.merge or args.minimise or args.stream):
+        parser.error("--shard cannot be combined with --merge, --minimise or --stream")
+    if args.merge and args.minimise:
+        parser.error("--merge cannot be combined with --minimise")
+    if args.checkpoint and (args.shard or args.merge or args.stream):
+        parser.error("--checkpoint only applies to batch runs")
 
-    # 2. Run orchestrator
-    orch = Orchestrator()
-    report = orch.process_test_descriptions(test_cases)
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard_spec(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
 
-    # 3. Prepare output directory
+    # 1. Prepare output directory
     if args.run_name:
         run_folder = args.run_name
     else:
@@ -67,19 +238,186 @@ def main():
 
     os.makedirs(reports_dir, exist_ok=True)
 
-    # 4. Save readable report
-    save_text_report(report["text_report"], reports_dir)
+    # Shard nodes keep their metrics / profiles next to their partial
+    metrics_dir = reports_dir
+    if shard is not None:
+        metrics_dir = os.path.splitext(partial_path(base_dir, *shard))[0]
+        os.makedirs(metrics_dir, exist_ok=True)
+
+    # 2. Checkpoints (opt-in, batch runs only): start fresh or pick up a resumed run
+    checkpoints = None
+    if args.checkpoint:
+        checkpoints = CheckpointStore(base_dir, batch_size=args.checkpoint_batch)
+
+        if args.resume:
+            if not checkpoints.exists():
+                raise SystemExit(f"[ERROR] No checkpoints to resume in {base_dir}")
+            inputs = checkpoints.resume()
+            if checkpoints.is_done("complete"):
+                print(f"[OK] Run {args.resume} already completed, nothing to resume.")
+                return
+            if file_sha256(inputs["file"]) != inputs["file_sha256"]:
+                raise SystemExit(f"[ERROR] {inputs['file']} changed since the run started")
+            # Same outputs as the interrupted run, whatever this invocation says
+            for name in RESUMED_ARGS:
+                if name in inputs:
+                    setattr(args, name, inputs[name])
+            print(f"[OK] Resuming {args.resume} (done: {checkpoints.manifest['stages']})")
+        else:
+            inputs = {name: getattr(args, name) for name in RESUMED_ARGS}
+            checkpoints.start({**inputs, "file_sha256": file_sha256(args.file)})
+
+    profiler = None
+    if args.profile:
+        profiler = StageProfiler(args.profile, os.path.join(metrics_dir, "profile"))
+    metrics = Metrics(enabled=not args.no_metrics, profiler=profiler)
+
+    # 3. Load test cases (a merge reads shard partials instead)
+    if checkpoints is not None and checkpoints.is_done("suite"):
+        test_cases = checkpoints.load("suite")
+    else:
+        test_cases = [] if args.merge else load_test_cases(args.file)
+
+    # 4. Run orchestrator (optionally on the minimised suite)
+    cache = StageCache(args.cache_dir, enabled=not args.no_cache)
+    if args.clear_cache:
+        cache.clear()
+
+    with metrics.timer("startup"):
+        orch = Orchestrator(cache=cache, metrics=metrics)
+
+    if args.minimise and not (checkpoints and checkpoints.is_done("suite")):
+        with metrics.timer("minimise"):
+            minimised = SuiteMinimizer(orch.nlp, orch.reasoner).minimise(test_cases)
+        summary = minimised["summary"]
+        test_cases = minimised["selected"]
+
+        save_json("suite_minimised", {"tests": test_cases}, reports_dir)
+        save_json("coverage", summary, reports_dir)
+        print(
+            f"[OK] Minimised suite: {summary['selected_cases']}/{summary['total_cases']} "
+            f"cases cover {summary['covered_transitions']}/{summary['total_transitions']} transitions"
+        )
+
+    if checkpoints is not None and not checkpoints.is_done("suite"):
+        checkpoints.save("suite", test_cases)
+        checkpoints.mark_done("suite")
+
+    # 4a. Sharded node: per-case stages only, then stop
+    if shard is not None:
+        partial = run_shard(orch, test_cases, *shard)
+        write_partial(base_dir, partial)
+        metrics.write(metrics_dir)
+        if profiler is not None:
+            profiler.write()
+        print(f"\n[✓] Shard {args.shard}: {len(partial['cases'])} cases processed.")
+        return
+
+    if args.merge:
+        with metrics.timer("merge"):
+            try:
+                merged = merge_partials(load_partials(base_dir))
+            except (FileNotFoundError, ValueError) as e:
+                raise SystemExit(f"[ERROR] Cannot merge shards: {e}")
+        save_json("coverage", merged["coverage"], reports_dir)
+        print(
+            f"[OK] Merged {merged['coverage']['num_shards']} shards, "
+            f"{len(merged['records'])} cases"
+        )
+        report = orch.assemble_report(merged["records"])
+    elif args.stream:
+        from src.pipeline.streaming import StreamingPipeline
+
+        writer = None
+        if args.stream_report:
+            from src.reporting.stream_writer import StreamingReportWriter
+
+            writer = StreamingReportWriter(reports_dir, reporting=orch.reporting)
+
+        pipeline = StreamingPipeline(
+            orch, batch_size=args.batch_size, queue_size=args.queue_size, writer=writer
+        )
+        # A failed run removes the writer's partial files
+        with writer or contextlib.nullcontext():
+            report = pipeline.process_test_descriptions(test_cases)
+    elif checkpoints is not None:
+        if checkpoints.is_done("report"):
+            report = checkpoints.load("report")
+        else:
+            records = checkpoints.process_cases(orch, test_cases)
+            report = orch.assemble_report(records)
+            checkpoints.save("report", report)
+            checkpoints.mark_done("report")
+    else:
+        report = orch.process_test_descriptions(test_cases)
+
+    # 5-7. Save report, steps and issues (already written by --stream_report)
+    if "artifacts" in report:
+        for name, path in report["artifacts"].items():
+            print(f"[OK] Streamed {name} → {path}")
+    elif not (checkpoints and checkpoints.is_done("artifacts")):
+        with metrics.timer("write_artifacts"):
+            save_artifacts(report, reports_dir)
+        if checkpoints is not None:
+            checkpoints.mark_done("artifacts")
+
+    if args.columnar and not (checkpoints and checkpoints.is_done("columnar")):
+        with metrics.timer("write_columnar"):
+            from src.artifacts.columnar import convert_run, write_run_columnar
+
+            if "artifacts" in report:
+                written = convert_run(reports_dir)
+            else:
+                written = write_run_columnar(report, os.path.join(reports_dir, "columnar"))
+        for name in written:
+            print(f"[OK] Saved columnar {name} → {os.path.join(reports_dir, 'columnar', name)}")
+        if checkpoints is not None:
+            checkpoints.mark_done("columnar")
+
+    # 8. Generate visualisations (rich colours + legends)
+    if not args.no_plots and not (checkpoints and checkpoints.is_done("plots")):
+        with metrics.timer("visualisation"):
+            from src.visualisation.visualisations import generate_all_visualisations
+
+            if "artifacts" in report:
+                # Plots need the whole timeline: read it back from disk
+                from src.reporting.stream_writer import read_jsonl
+
+                steps = list(read_jsonl(report["artifacts"]["steps_optimized"]))
+            else:
+                steps = report["steps"]
+            timings = generate_all_visualisations(
+                steps, reports_dir, args.plot_points, args.plot_workers
+            )
+        for name, seconds in timings.items():
+            metrics.record_time(f"plot_{name}", seconds)
+        if checkpoints is not None:
+            checkpoints.mark_done("plots")
+
+    if cache.enabled:
+        stats = cache.stats()
+        print(
+            f"\n[OK] Stage cache: {stats['hits']} hits / {stats['misses']} misses "
+            f"(hit ratio {stats['hit_ratio']:.1%})"
+        )
+
+    # 9. Save run metrics + profiles
+    metrics.write(metrics_dir)
+    if profiler is not None:
+        profiler.write()
 
-    # 5. Save raw + validated + optimized steps
-    save_json("steps_raw", report.get("steps_raw", []), reports_dir)
-    save_json("steps_validated", report.get("steps_validated", []), reports_dir)
-    save_json("steps_optimized", report.get("steps", []), reports_dir)
+    # 10. Deduplicate into the content-addressed store (leaves manifest.json)
+    if args.store:
+        from src.artifacts.store import ArtifactStore, store_run
 
-    # 6. Save issues
-    save_json("issues", report.get("issues", []), reports_dir)
+        manifest = store_run(reports_dir, ArtifactStore(os.path.join("reports", ".store")))
+        print(
+            f"[OK] Stored {len(manifest['files'])} artifacts "
+            f"({manifest['new_blobs']} new blobs) → reports/.store"
+        )
 
-    # 7. Generate visualisations (rich colours + legends)
-    generate_all_visualisations(report["steps"], reports_dir)
+    if checkpoints is not None:
+        checkpoints.finish()
 
     print("\n[✓] All outputs generated successfully.")
     print(f"Saved in folder: {reports_dir}")
@@ -0,0 +1,409 @@
+# src/artifacts/columnar.py
+
+import argparse
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.steps.actions import ACTIONS
+from src.utils.fileio import atomic_write_json
+
+# Bump when the on-disk layout changes
+FORMAT = "avtc-columnar-v1"
+
+# int32 sentinel for "no value" (step without "value" / None state field)
+NO_VALUE = int(np.iinfo(np.int32).min)
+_INT32_MAX = int(np.iinfo(np.int32).max)
+
+# JSON artifact → table kind
+STEP_ARTIFACTS = {
+    "steps_raw": "cases",
+    "steps_validated": "cases",
+    "steps_optimized": "formatted",
+}
+
+
+# ---------------------------------------------------------
+# COLUMN CODECS
+# ---------------------------------------------------------
+def _is_int32(v) -> bool:
+    return type(v) is int and NO_VALUE < v <= _INT32_MAX
+
+
+def _code_dtype(size: int):
+    if size <= 1 << 8:
+        return np.uint8
+    if size <= 1 << 16:
+        return np.uint16
+    return np.uint32
+
+
+def encode_column(values: List[Any]) -> Tuple[np.ndarray | None, Dict[str, Any]]:
+    """
+    Picks the most compact codec for a list of JSON scalars:
+    bool → uint8, int / None → int32, str / None → dictionary codes,
+    anything else → JSON fallback (array is None).
+    """
+    if all(type(v) is bool for v in values):
+        return np.array(values, dtype=np.uint8), {"codec": "bool"}
+
+    if all(v is None or _is_int32(v) for v in values):
+        return (
+            np.array([NO_VALUE if v is None else v for v in values], dtype=np.int32),
+            {"codec": "int"},
+        )
+
+    if all(v is None or isinstance(v, str) for v in values):
+        codes: Dict[Any, int] = {}
+        encoded = [codes.setdefault(v, len(codes)) for v in values]
+        return (
+            np.array(encoded, dtype=_code_dtype(len(codes))),
+            {"codec": "dict", "vocab": list(codes)},
+        )
+
+    return None, {"codec": "json"}
+
+
+def decode_column(array, spec: Dict[str, Any], values=None) -> List[Any]:
+    codec = spec["codec"]
+    if codec == "json":
+        return list(values)
+    if codec == "bool":
+        return [bool(v) for v in array.tolist()]
+    if codec == "int":
+        return [None if v == NO_VALUE else v for v in array.tolist()]
+    vocab = spec["vocab"]
+    return [vocab[c] for c in array.tolist()]
+
+
+def encode_steps(pairs: Iterable[Tuple[str, Dict]]) -> Dict[str, Any]:
+    """
+    (action, params) pairs → action codes + int32 value column.
+    Params other than {} / {"value": <int32>} are kept verbatim in `extra`.
+    Action codes follow src.steps.actions; unknown names extend the vocabulary.
+    """
+    vocab = list(ACTIONS)
+    codes = {name: code for code, name in enumerate(vocab)}
+    actions: List[int] = []
+    values: List[int] = []
+    extra: Dict[str, Any] = {}
+
+    for row, (name, params) in enumerate(pairs):
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(vocab)
+            vocab.append(name)
+        actions.append(code)
+
+        if params == {}:
+            values.append(NO_VALUE)
+        elif isinstance(params, dict) and len(params) == 1 and _is_int32(params.get("value")):
+            values.append(params["value"])
+        else:
+            values.append(NO_VALUE)
+            extra[str(row)] = params
+
+    return {
+        "action": np.array(actions, dtype=_code_dtype(len(vocab))),
+        "value": np.array(values, dtype=np.int32),
+        "actions": vocab,
+        "extra": extra,
+    }
+
+
+def decode_params(values: List[int], extra: Dict[str, Any], offset: int = 0) -> List[Dict]:
+    params = [{} if v == NO_VALUE else {"value": v} for v in values]
+    for row, p in extra.items():
+        row = int(row) - offset
+        if 0 <= row < len(params):
+            params[row] = p
+    return params
+
+
+def _unpack(step: Dict):
+    # Empty steps ({}) are stored under the action name None
+    if not step:
+        return None, {}
+    [(action, params)] = step.items()
+    return action, params
+
+
+def _pack(action, params) -> Dict:
+    return {} if action is None else {action: params}
+
+
+# ---------------------------------------------------------
+# WRITERS
+# ---------------------------------------------------------
+def _write_table(path: str, kind: str, columns: Dict[str, np.ndarray], meta: Dict[str, Any]):
+    """
+    One .npy file per column plus meta.json, built in a temp folder and
+    renamed into place so readers never see a partial table.
+    """
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    for name, array in columns.items():
+        np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+    atomic_write_json(
+        os.path.join(tmp_path, "meta.json"),
+        {"format": FORMAT, "kind": kind, "columns": sorted(columns), **meta},
+    )
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+
+
+def write_steps(path: str, data: List, kind: str):
+    """
+    kind "cases":     list of cases, each a list of {action: params}
+                      (steps_raw / steps_validated)
+    kind "steps":     flat list of {action: params}
+    kind "formatted": flat list of {"index", "action", "params"} (steps_optimized)
+    """
+    columns: Dict[str, np.ndarray] = {}
+    meta: Dict[str, Any] = {}
+
+    if kind == "cases":
+        pairs = [_unpack(step) for case in data for step in case]
+        columns["offsets"] = np.cumsum([0] + [len(case) for case in data], dtype=np.int64)
+    elif kind == "steps":
+        pairs = [_unpack(step) for step in data]
+    elif kind == "formatted":
+        pairs = [(s["action"], s["params"]) for s in data]
+        indexes = [s["index"] for s in data]
+        # Indexes are 1..n in practice; only store them when they are not
+        meta["sequential_index"] = indexes == list(range(1, len(data) + 1))
+        if not meta["sequential_index"]:
+            columns["index"] = np.array(indexes, dtype=np.int64)
+    else:
+        raise ValueError(f"Unknown step table kind {kind!r}")
+
+    encoded = encode_steps(pairs)
+    columns["action"] = encoded["action"]
+    columns["value"] = encoded["value"]
+    meta.update({"rows": len(pairs), "actions": encoded["actions"], "extra": encoded["extra"]})
+
+    _write_table(path, kind, columns, meta)
+
+
+def write_state_trace(path: str, trace: List[Dict]):
+    """
+    Entries {"step", "ok", "message", "state"}: step as action / value
+    columns, ok / message / every state field as its own column.
+    """
+    state_keys = list(trace[0]["state"]) if trace else []
+    regular = all(
+        list(e) == ["step", "ok", "message", "state"] and list(e["state"]) == state_keys
+        for e in trace
+    )
+    if not regular:
+        raise ValueError("State trace entries do not share one layout")
+
+    encoded = encode_steps(_unpack(e["step"]) for e in trace)
+    columns = {"action": encoded["action"], "value": encoded["value"]}
+    specs: Dict[str, Any] = {}
+    json_values: Dict[str, List[Any]] = {}
+
+    fields = [("ok", [e["ok"] for e in trace]), ("message", [e["message"] for e in trace])]
+    fields += [(f"state.{k}", [e["state"][k] for e in trace]) for k in state_keys]
+    for name, values in fields:
+        array, spec = encode_column(values)
+        specs[name] = spec
+        if array is None:
+            json_values[name] = values
+        else:
+            columns[name] = array
+
+    meta = {
+        "rows": len(trace),
+        "actions": encoded["actions"],
+        "extra": encoded["extra"],
+        "state_keys": state_keys,
+        "fields": specs,
+        "json_fields": json_values,
+    }
+    _write_table(path, "state_trace", columns, meta)
+
+
+def write_run_columnar(report: Dict[str, Any], out_dir: str) -> List[str]:
+    """
+    Columnar copies of a run's step artifacts (+ state trace) under out_dir.
+    Returns the written artifact names.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    report_keys = {"steps_raw": "steps_raw", "steps_validated": "steps_validated", "steps_optimized": "steps"}
+    written = []
+    for name, kind in STEP_ARTIFACTS.items():
+        write_steps(os.path.join(out_dir, name), report.get(report_keys[name], []), kind)
+        written.append(name)
+    if report.get("state_trace"):
+        write_state_trace(os.path.join(out_dir, "state_trace"), report["state_trace"])
+        written.append("state_trace")
+    return written
+
+
+# ---------------------------------------------------------
+# READERS
+# ---------------------------------------------------------
+class ColumnarTable:
+    """
+    Memory-mapped view of a table folder; columns are loaded on first use.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("format") != FORMAT:
+            raise ValueError(f"{path}: unsupported format {self.meta.get('format')!r}")
+        self.kind = self.meta["kind"]
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def column(self, name: str) -> np.ndarray:
+        array = self._columns.get(name)
+        if array is None:
+            array = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+            self._columns[name] = array
+        return array
+
+    @property
+    def actions(self) -> List[str]:
+        return self.meta["actions"]
+
+    def action_names(self, start: int = 0, stop: int | None = None) -> List[str]:
+        names = self.actions
+        return [names[c] for c in self.column("action")[start:stop].tolist()]
+
+    def params(self, start: int = 0, stop: int | None = None) -> List[Dict]:
+        values = self.column("value")[start:stop].tolist()
+        return decode_params(values, self.meta["extra"], offset=start)
+
+
+class StepTable(ColumnarTable):
+    """
+    Step artifact: rows are steps; "cases" tables add per-case offsets.
+    """
+
+    @property
+    def num_cases(self) -> int:
+        return len(self.column("offsets")) - 1 if self.kind == "cases" else 0
+
+    def step(self, row: int) -> Dict:
+        return self._steps(row, row + 1)[0]
+
+    def case(self, number: int) -> List[Dict]:
+        offsets = self.column("offsets")
+        return self._steps(int(offsets[number]), int(offsets[number + 1]))
+
+    def to_list(self) -> List:
+        """
+        The original JSON structure of the artifact.
+        """
+        steps = self._steps(0, len(self))
+        if self.kind != "cases":
+            return steps
+        offsets = self.column("offsets").tolist()
+        return [steps[a:b] for a, b in zip(offsets, offsets[1:])]
+
+    def _steps(self, start: int, stop: int) -> List[Dict]:
+        names = self.action_names(start, stop)
+        params = self.params(start, stop)
+
+        if self.kind != "formatted":
+            return [_pack(a, p) for a, p in zip(names, params)]
+
+        if self.meta["sequential_index"]:
+            indexes = range(start + 1, stop + 1)
+        else:
+            indexes = self.column("index")[start:stop].tolist()
+        return [
+            {"index": i, "action": a, "params": p}
+            for i, a, p in zip(indexes, names, params)
+        ]
+
+
+class StateTraceTable(ColumnarTable):
+    def field(self, name: str) -> List[Any]:
+        """
+        Decoded values of one field ("ok", "message", "state.speed", ...).
+        """
+        spec = self.meta["fields"][name]
+        if spec["codec"] == "json":
+            return decode_column(None, spec, self.meta["json_fields"][name])
+        return decode_column(self.column(name), spec)
+
+    def to_list(self) -> List[Dict]:
+        steps = [_pack(a, p) for a, p in zip(self.action_names(), self.params())]
+        ok, message = self.field("ok"), self.field("message")
+        keys = self.meta["state_keys"]
+        state_columns = [self.field(f"state.{k}") for k in keys]
+        return [
+            {
+                "step": steps[i],
+                "ok": ok[i],
+                "message": message[i],
+                "state": {k: col[i] for k, col in zip(keys, state_columns)},
+            }
+            for i in range(len(self))
+        ]
+
+
+def open_table(path: str) -> ColumnarTable:
+    table = ColumnarTable(path)
+    return StateTraceTable(path) if table.kind == "state_trace" else StepTable(path)
+
+
+# ---------------------------------------------------------
+# CONVERT EXISTING RUNS
+# ---------------------------------------------------------
+def convert_run(reports_dir: str) -> List[str]:
+    """
+    Writes reports_dir/columnar/ from a run's JSON (or streamed JSONL)
+    artifacts. Returns the converted artifact names.
+    """
+    from src.reporting.stream_writer import read_jsonl
+
+    out_dir = os.path.join(reports_dir, "columnar")
+    converted = []
+
+    for name, kind in STEP_ARTIFACTS.items():
+        json_path = os.path.join(reports_dir, f"{name}.json")
+        jsonl_path = os.path.join(reports_dir, f"{name}.jsonl")
+        if os.path.exists(json_path):
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        elif os.path.exists(jsonl_path):
+            data = list(read_jsonl(jsonl_path))
+        else:
+            continue
+        write_steps(os.path.join(out_dir, name), data, kind)
+        converted.append(name)
+
+    trace_path = os.path.join(reports_dir, "state_trace.jsonl")
+    if os.path.exists(trace_path):
+        write_state_trace(os.path.join(out_dir, "state_trace"), list(read_jsonl(trace_path)))
+        converted.append("state_trace")
+
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert run artifacts to the columnar format")
+    parser.add_argument("reports_dirs", nargs="+", help="reports/<run>/reports folders")
+    args = parser.parse_args()
+
+    for reports_dir in args.reports_dirs:
+        converted = convert_run(reports_dir)
+        print(f"[OK] {reports_dir}: {', '.join(converted) or 'nothing to convert'}")
+
+
+if __name__ == "__main__":
+    main()
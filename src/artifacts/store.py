@@ -0,0 +1,359 @@
+# src/artifacts/store.py
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+from src.utils.fileio import atomic_write_json
+
+STORE_FORMAT = "avtc-store-v1"
+MANIFEST = "manifest.json"
+DEFAULT_STORE = os.path.join("reports", ".store")
+
+# Already-compressed formats are stored as-is
+RAW_SUFFIXES = (".png", ".jpg", ".jpeg", ".gz", ".zip", ".npz")
+CHUNK = 1 << 20
+
+
+class ArtifactStore:
+    """
+    Content-addressed blobs: objects/<sha[:2]>/<sha>[.gz], keyed by the
+    sha256 of the *uncompressed* bytes so identical outputs of different
+    runs are stored once.
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+
+    def blob_path(self, digest: str) -> str | None:
+        base = os.path.join(self.objects, digest[:2], digest)
+        for path in (base + ".gz", base):
+            if os.path.exists(path):
+                return path
+        return None
+
+    def has(self, digest: str) -> bool:
+        return self.blob_path(digest) is not None
+
+    def put(self, path: str) -> Dict[str, Any]:
+        """
+        Adds one file; returns {"sha256", "size", "stored"} where stored is
+        False when the blob already existed.
+        """
+        h = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK), b""):
+                h.update(chunk)
+                size += len(chunk)
+        digest = h.hexdigest()
+        entry = {"sha256": digest, "size": size, "stored": False}
+        if self.has(digest):
+            return entry
+
+        compress = not path.lower().endswith(RAW_SUFFIXES)
+        folder = os.path.join(self.objects, digest[:2])
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as out, open(path, "rb") as src:
+                if compress:
+                    # mtime=0 keeps blobs byte-identical across runs
+                    with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6, mtime=0) as gz:
+                        shutil.copyfileobj(src, gz, CHUNK)
+                else:
+                    shutil.copyfileobj(src, out, CHUNK)
+            os.replace(tmp_path, os.path.join(folder, digest + (".gz" if compress else "")))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        entry["stored"] = True
+        return entry
+
+    def open(self, digest: str) -> IO[bytes]:
+        path = self.blob_path(digest)
+        if path is None:
+            raise FileNotFoundError(f"{self.root}: missing blob {digest}")
+        return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+    def read(self, digest: str) -> bytes:
+        with self.open(digest) as f:
+            return f.read()
+
+    def restore(self, digest: str, dest: str):
+        os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+        with self.open(digest) as src, open(dest, "wb") as out:
+            shutil.copyfileobj(src, out, CHUNK)
+
+    def blobs(self) -> Iterator[Tuple[str | None, str]]:
+        """
+        (digest, path) for every blob; leftover temp files are yielded with
+        digest None so gc can sweep them.
+        """
+        if not os.path.isdir(self.objects):
+            return
+        for prefix in os.listdir(self.objects):
+            folder = os.path.join(self.objects, prefix)
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                digest = None if name.startswith(".tmp_") else name.split(".", 1)[0]
+                yield digest, path
+
+
+# ---------------------------------------------------------
+# RUN FOLDERS
+# ---------------------------------------------------------
+def load_manifest(reports_dir: str) -> Dict[str, Any] | None:
+    path = os.path.join(reports_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return manifest if manifest.get("format") == STORE_FORMAT else None
+
+
+def run_files(reports_dir: str) -> List[str]:
+    """
+    Relative paths of every artifact under a run's reports/ folder.
+    """
+    files = []
+    for folder, _, names in os.walk(reports_dir):
+        for name in names:
+            rel = os.path.relpath(os.path.join(folder, name), reports_dir)
+            if rel != MANIFEST and not name.startswith(".tmp_"):
+                files.append(rel.replace(os.sep, "/"))
+    return sorted(files)
+
+
+def store_run(reports_dir: str, store: ArtifactStore, keep_files: bool = False) -> Dict[str, Any]:
+    """
+    Moves a run's artifacts into the store and leaves manifest.json behind
+    (merged with an existing manifest, so re-storing a resumed run works).
+    """
+    manifest = load_manifest(reports_dir) or {
+        "format": STORE_FORMAT,
+        "store": os.path.relpath(store.root, reports_dir).replace(os.sep, "/"),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": {},
+    }
+    new_blobs = 0
+    for rel in run_files(reports_dir):
+        entry = store.put(os.path.join(reports_dir, rel))
+        new_blobs += entry.pop("stored")
+        manifest["files"][rel] = entry
+
+    # Manifest first: files are only deleted once they are recoverable
+    atomic_write_json(os.path.join(reports_dir, MANIFEST), manifest, indent=2)
+    if not keep_files:
+        for rel in manifest["files"]:
+            path = os.path.join(reports_dir, rel)
+            if os.path.exists(path):
+                os.remove(path)
+        for folder, _, _ in os.walk(reports_dir, topdown=False):
+            if folder != reports_dir and not os.listdir(folder):
+                os.rmdir(folder)
+
+    manifest["new_blobs"] = new_blobs
+    return manifest
+
+
+def run_store(reports_dir: str, manifest: Dict[str, Any]) -> ArtifactStore:
+    return ArtifactStore(os.path.normpath(os.path.join(reports_dir, manifest["store"])))
+
+
+def checkout_run(reports_dir: str, store: ArtifactStore | None = None) -> List[str]:
+    """
+    Restores a stored run's files next to its manifest. Returns the paths
+    that were written (files already present with the right size are kept).
+    """
+    manifest = load_manifest(reports_dir)
+    if manifest is None:
+        return []
+    store = store or run_store(reports_dir, manifest)
+    written = []
+    for rel, entry in manifest["files"].items():
+        dest = os.path.join(reports_dir, rel)
+        if os.path.exists(dest) and os.path.getsize(dest) == entry["size"]:
+            continue
+        store.restore(entry["sha256"], dest)
+        written.append(dest)
+    return written
+
+
+def has_run_file(reports_dir: str, rel: str) -> bool:
+    if os.path.exists(os.path.join(reports_dir, rel)):
+        return True
+    manifest = load_manifest(reports_dir)
+    return manifest is not None and rel in manifest["files"]
+
+
+def open_run_file(reports_dir: str, rel: str) -> IO[bytes]:
+    """
+    Opens an artifact from the run folder, or from the store when the run
+    folder only holds a manifest.
+    """
+    path = os.path.join(reports_dir, rel)
+    if os.path.exists(path):
+        return open(path, "rb")
+    manifest = load_manifest(reports_dir)
+    if manifest is None or rel not in manifest["files"]:
+        raise FileNotFoundError(path)
+    return run_store(reports_dir, manifest).open(manifest["files"][rel]["sha256"])
+
+
+def open_run_text(reports_dir: str, rel: str) -> IO[str]:
+    return io.TextIOWrapper(open_run_file(reports_dir, rel), encoding="utf-8")
+
+
+# ---------------------------------------------------------
+# GARBAGE COLLECTION
+# ---------------------------------------------------------
+def run_folders(reports_root: str) -> List[str]:
+    """
+    Run folders under reports_root, oldest first (by folder mtime).
+    """
+    runs = [
+        os.path.join(reports_root, name)
+        for name in os.listdir(reports_root)
+        if not name.startswith(".") and os.path.isdir(os.path.join(reports_root, name))
+    ]
+    return sorted(runs, key=os.path.getmtime)
+
+
+def gc(
+    reports_root: str = "reports",
+    store: ArtifactStore | None = None,
+    keep_last: int | None = None,
+    older_than_days: float | None = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Deletes run folders beyond keep_last / older than older_than_days, then
+    sweeps blobs no remaining manifest references (mark and sweep).
+    """
+    store = store or ArtifactStore(os.path.join(reports_root, ".store"))
+    runs = run_folders(reports_root)
+
+    expired = set()
+    if keep_last is not None:
+        expired.update(runs[: max(len(runs) - keep_last, 0)])
+    if older_than_days is not None:
+        cutoff = time.time() - older_than_days * 86400
+        expired.update(r for r in runs if os.path.getmtime(r) < cutoff)
+
+    live = set()
+    for run in runs:
+        if run in expired:
+            continue
+        manifest = load_manifest(os.path.join(run, "reports"))
+        if manifest is not None:
+            live.update(e["sha256"] for e in manifest["files"].values())
+
+    removed_runs = sorted(expired)
+    removed_blobs, freed = 0, 0
+    for run in removed_runs:
+        if not dry_run:
+            shutil.rmtree(run)
+    for digest, path in list(store.blobs()):
+        if digest in live:
+            continue
+        removed_blobs += 1
+        freed += os.path.getsize(path)
+        if not dry_run:
+            os.remove(path)
+
+    return {
+        "removed_runs": removed_runs,
+        "removed_blobs": removed_blobs,
+        "freed_bytes": freed,
+        "live_blobs": len(live),
+    }
+
+
+def store_stats(reports_root: str = "reports", store: ArtifactStore | None = None) -> Dict[str, Any]:
+    store = store or ArtifactStore(os.path.join(reports_root, ".store"))
+    logical = stored_runs = 0
+    for run in run_folders(reports_root):
+        manifest = load_manifest(os.path.join(run, "reports"))
+        if manifest is not None:
+            stored_runs += 1
+            logical += sum(e["size"] for e in manifest["files"].values())
+    blobs = [path for digest, path in store.blobs() if digest]
+    physical = sum(os.path.getsize(p) for p in blobs)
+    return {
+        "stored_runs": stored_runs,
+        "blobs": len(blobs),
+        "logical_bytes": logical,
+        "store_bytes": physical,
+        "ratio": round(logical / physical, 1) if physical else None,
+    }
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed artifact store for run folders")
+    parser.add_argument("--reports", default="reports", help="Folder holding run folders")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("put", help="Move run folders into the store")
+    p.add_argument("runs", nargs="*", help="reports/<run> folders (default: every unstored run)")
+    p.add_argument("--keep_files", action="store_true", help="Store but keep the plain files")
+
+    p = sub.add_parser("checkout", help="Restore a stored run's files")
+    p.add_argument("runs", nargs="+")
+
+    p = sub.add_parser("gc", help="Delete old runs and unreferenced blobs")
+    p.add_argument("--keep_last", type=int, default=None, help="Keep only the N newest runs")
+    p.add_argument("--older_than", type=float, default=None, help="Delete runs older than N days")
+    p.add_argument("--dry_run", action="store_true")
+
+    sub.add_parser("stats", help="Logical vs stored bytes")
+
+    args = parser.parse_args()
+    store = ArtifactStore(os.path.join(args.reports, ".store"))
+
+    if args.command == "put":
+        runs = args.runs or [
+            r for r in run_folders(args.reports)
+            if os.path.isdir(os.path.join(r, "reports"))
+            and load_manifest(os.path.join(r, "reports")) is None
+        ]
+        for run in runs:
+            manifest = store_run(os.path.join(run, "reports"), store, keep_files=args.keep_files)
+            print(f"[OK] Stored {run}: {len(manifest['files'])} files, {manifest['new_blobs']} new blobs")
+    elif args.command == "checkout":
+        for run in args.runs:
+            written = checkout_run(os.path.join(run, "reports"))
+            print(f"[OK] Restored {len(written)} files → {os.path.join(run, 'reports')}")
+    elif args.command == "gc":
+        result = gc(args.reports, store, args.keep_last, args.older_than, args.dry_run)
+        verb = "Would remove" if args.dry_run else "Removed"
+        for run in result["removed_runs"]:
+            print(f"[GC] {verb} {run}")
+        print(
+            f"[GC] {verb} {result['removed_blobs']} blobs ({result['freed_bytes'] / 1e6:.1f} MB), "
+            f"{result['live_blobs']} still referenced"
+        )
+    elif args.command == "stats":
+        s = store_stats(args.reports, store)
+        print(
+            f"{s['stored_runs']} stored runs, {s['blobs']} blobs: "
+            f"{s['logical_bytes'] / 1e6:.1f} MB logical → {s['store_bytes'] / 1e6:.1f} MB on disk"
+            + (f" ({s['ratio']}x)" if s["ratio"] else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
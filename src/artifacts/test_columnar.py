@@ -0,0 +1,133 @@
+# src/artifacts/test_columnar.py
+
+import json
+import os
+import tempfile
+
+from src.artifacts.columnar import (
+    StateTraceTable,
+    StepTable,
+    convert_run,
+    open_table,
+    write_run_columnar,
+    write_state_trace,
+    write_steps,
+)
+from src.reporting.reporting_engine import ReportingEngine
+from src.state_machine.state_machine import StateMachine
+
+CASE = [
+    {"SET_SPEED": {"value": 80}},
+    {"ACC_ON": {}},
+    {"INDICATOR_LEFT": {}},
+    {"LANE_CHANGE_LEFT": {}},
+    {"APPLY_BRAKE": {}},
+    {"SET_SPEED": {"value": 40}},
+]
+# Params the value column cannot hold end up in the table's `extra`
+ODD_CASE = [
+    {},
+    {"SET_SPEED": {"value": 2**40}},
+    {"SET_SPEED": {"value": 55.5}},
+    {"SET_SPEED": {"value": 60, "unit": "kmh"}},
+    {"CUSTOM_ACTION": None},
+    {"ACC_OFF": {}},
+]
+
+
+def state_trace(steps):
+    machine = StateMachine()
+    trace = []
+    for step in steps:
+        ok, message = machine.apply_step(step)
+        trace.append(
+            {"step": step, "ok": ok, "message": message, "state": machine.get_state()}
+        )
+    return trace
+
+
+def main():
+    cases = [CASE] * 500 + [ODD_CASE, []]
+
+    with tempfile.TemporaryDirectory() as root:
+        # Step tables round trip in every layout
+        write_steps(os.path.join(root, "cases"), cases, "cases")
+        table = open_table(os.path.join(root, "cases"))
+        assert isinstance(table, StepTable)
+        assert table.num_cases == len(cases)
+        assert len(table) == 500 * len(CASE) + len(ODD_CASE)
+        assert table.to_list() == cases
+        assert table.case(500) == ODD_CASE and table.case(501) == []
+        assert table.step(0) == CASE[0] and table.step(500 * len(CASE)) == {}
+        print(f"[OK] {table.num_cases} cases / {len(table)} steps round trip")
+
+        flat = CASE + ODD_CASE
+        write_steps(os.path.join(root, "steps"), flat, "steps")
+        assert open_table(os.path.join(root, "steps")).to_list() == flat
+
+        formatted = ReportingEngine().build_report(steps=flat, issues=[])["steps"]
+        assert formatted[len(CASE)] == {
+            "index": len(CASE) + 1,
+            "action": None,
+            "params": {},
+        }
+        write_steps(os.path.join(root, "formatted"), formatted, "formatted")
+        assert open_table(os.path.join(root, "formatted")).to_list() == formatted
+
+        shuffled = [dict(s, index=i * 10) for i, s in enumerate(formatted)]
+        write_steps(os.path.join(root, "shuffled"), shuffled, "formatted")
+        assert open_table(os.path.join(root, "shuffled")).to_list() == shuffled
+        print("[OK] Flat, formatted and re-indexed steps round trip")
+
+        for kind in ("cases", "steps"):
+            write_steps(os.path.join(root, f"empty_{kind}"), [], kind)
+            assert open_table(os.path.join(root, f"empty_{kind}")).to_list() == []
+        print("[OK] Empty tables")
+
+        # State trace: bool / int / str state fields get their own codecs
+        trace = state_trace(CASE * 50)
+        write_state_trace(os.path.join(root, "state_trace"), trace)
+        table = open_table(os.path.join(root, "state_trace"))
+        assert isinstance(table, StateTraceTable)
+        assert table.to_list() == trace
+        assert table.field("state.speed")[:2] == [80, 80]
+        # Repeated left lane changes are rejected by the state machine
+        assert False in table.field("ok") and True in table.field("ok")
+        codecs = {name: spec["codec"] for name, spec in table.meta["fields"].items()}
+        print(f"[OK] State trace round trip ({len(table)} rows, codecs {codecs})")
+
+        # A run folder converts to the same tables the pipeline writes
+        report = ReportingEngine().build_report(
+            steps=flat,
+            issues=[],
+            state_trace=trace,
+            raw_steps=cases,
+            validated_steps=cases,
+        )
+        written = write_run_columnar(report, os.path.join(root, "direct"))
+        run_dir = os.path.join(root, "run")
+        os.makedirs(run_dir)
+        for name, key in (
+            ("steps_raw", "steps_raw"),
+            ("steps_validated", "steps_validated"),
+            ("steps_optimized", "steps"),
+        ):
+            with open(
+                os.path.join(run_dir, f"{name}.json"), "w", encoding="utf-8"
+            ) as f:
+                json.dump(report[key], f)
+        with open(
+            os.path.join(run_dir, "state_trace.jsonl"), "w", encoding="utf-8"
+        ) as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in trace)
+        assert convert_run(run_dir) == written
+        for name in written:
+            direct = open_table(os.path.join(root, "direct", name)).to_list()
+            assert (
+                open_table(os.path.join(run_dir, "columnar", name)).to_list() == direct
+            )
+        print(f"[OK] convert_run matches the pipeline writer ({', '.join(written)})")
+
+
+if __name__ == "__main__":
+    main()
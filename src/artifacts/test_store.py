@@ -0,0 +1,77 @@
+# src/artifacts/test_store.py
+
+import json
+import os
+import random
+import tempfile
+
+from src.artifacts.store import ArtifactStore, checkout_run, gc, store_run, store_stats
+from src.diff.run_diff import load_artifact
+
+
+def write_run(root: str, name: str, changed_case: int | None, seed: int = 5):
+    """A run folder whose artifacts only differ from the others in one case."""
+    rng = random.Random(seed)
+    steps = [[{"SET_SPEED": {"value": rng.randrange(30, 181, 10)}}, {"ACC_ON": {}}] for _ in range(5000)]
+    if changed_case is not None:
+        steps[changed_case].append({"APPLY_BRAKE": {}})
+
+    folder = os.path.join(root, name, "reports")
+    os.makedirs(os.path.join(folder, "columnar"))
+    with open(os.path.join(folder, "steps_validated.json"), "w", encoding="utf-8") as f:
+        json.dump(steps, f, indent=4)
+    with open(os.path.join(folder, "report.md"), "w", encoding="utf-8") as f:
+        f.write("# Test Report\n" + "\n".join(str(s) for s in steps))
+    # Plots are byte-identical between runs with the same timeline
+    with open(os.path.join(folder, "speed_profile.png"), "wb") as f:
+        f.write(random.Random(1).randbytes(200_000))
+    with open(os.path.join(folder, "columnar", "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"run": name}, f)
+    return steps
+
+
+def folder_bytes(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(d, n)) for d, _, names in os.walk(path) for n in names
+    )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as root:
+        store = ArtifactStore(os.path.join(root, ".store"))
+        expected = {}
+        for i in range(6):
+            name = f"run_{i}"
+            expected[name] = write_run(root, name, changed_case=None if i < 3 else i)
+            os.utime(os.path.join(root, name), (i, i))  # oldest first
+        plain = folder_bytes(root)
+
+        for name in expected:
+            manifest = store_run(os.path.join(root, name, "reports"), store)
+            print(f"{name}: {len(manifest['files'])} files, {manifest['new_blobs']} new blobs")
+
+        stats = store_stats(root, store)
+        print(f"\nPlain run folders : {plain / 1e6:.1f} MB")
+        print(f"Store + manifests : {folder_bytes(root) / 1e6:.1f} MB ({stats['blobs']} blobs)")
+
+        # Readers resolve stored artifacts through the manifest
+        for name, steps in expected.items():
+            assert load_artifact(os.path.join(root, name, "reports"), "steps_validated") == steps
+        print("[OK] Stored artifacts load through the manifest")
+
+        restored = checkout_run(os.path.join(root, "run_4", "reports"))
+        with open(os.path.join(root, "run_4", "reports", "steps_validated.json"), encoding="utf-8") as f:
+            assert json.load(f) == expected["run_4"]
+        print(f"[OK] Checkout restored {len(restored)} files")
+
+        result = gc(root, store, keep_last=2)
+        print(f"\nGC: removed {[os.path.basename(r) for r in result['removed_runs']]}, "
+              f"{result['removed_blobs']} blobs ({result['freed_bytes'] / 1e6:.2f} MB)")
+        assert sorted(os.listdir(root)) == [".store", "run_4", "run_5"]
+        for name in ("run_4", "run_5"):
+            assert load_artifact(os.path.join(root, name, "reports"), "steps_validated") == expected[name]
+        print("[OK] Remaining runs intact after GC")
+
+
+if __name__ == "__main__":
+    main()
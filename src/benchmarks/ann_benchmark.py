@@ -0,0 +1,171 @@
+# src/benchmarks/ann_benchmark.py
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.rag.vector_store import VectorStore
+
+# (label, VectorStore options) compared against the exact flat index
+DEFAULT_CONFIGS = [
+    ("flat", {"index_type": "flat"}),
+    ("flat-cosine", {"index_type": "flat", "metric": "cosine"}),
+    ("ivf", {"index_type": "ivf", "nprobe": 8}),
+    ("ivf-nprobe32", {"index_type": "ivf", "nprobe": 32}),
+    ("hnsw", {"index_type": "hnsw", "hnsw_m": 32, "ef_search": 64}),
+    ("hnsw-ef256", {"index_type": "hnsw", "hnsw_m": 32, "ef_search": 256}),
+    ("ivfpq", {"index_type": "ivfpq", "nprobe": 16}),
+]
+
+
+# ---------------------------------------------------------
+# SYNTHETIC CORPUS
+# ---------------------------------------------------------
+def synthetic_embeddings(num_docs: int, num_queries: int, dim: int, seed: int = 0):
+    """
+    Clustered unit vectors standing in for MiniLM chunk embeddings
+    (rules about the same feature sit close together). Queries are
+    perturbed copies of random documents.
+    """
+    rng = np.random.default_rng(seed)
+    num_topics = max(1, num_docs // 1000)
+    num_subtopics = max(1, num_docs // 20)
+
+    # feature (ACC, LKA, ...) → requirement group → individual rule
+    topics = rng.standard_normal((num_topics, dim)).astype("float32")
+    subtopics = topics[rng.integers(0, num_topics, num_subtopics)]
+    subtopics += 0.5 * rng.standard_normal((num_subtopics, dim)).astype("float32")
+    docs = subtopics[rng.integers(0, num_subtopics, num_docs)]
+    docs += 0.25 * rng.standard_normal((num_docs, dim)).astype("float32")
+    docs /= np.linalg.norm(docs, axis=1, keepdims=True)
+
+    queries = docs[rng.integers(0, num_docs, num_queries)]
+    queries = queries + 0.1 * rng.standard_normal((num_queries, dim)).astype("float32")
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    return docs, queries
+
+
+# ---------------------------------------------------------
+# MEASUREMENTS
+# ---------------------------------------------------------
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found.tolist(), truth.tolist()))
+    return hits / truth.size
+
+
+def index_bytes(store: VectorStore) -> int:
+    import faiss
+
+    return int(faiss.serialize_index(store.index).nbytes)
+
+
+def bench_config(options: Dict[str, Any], docs, queries, truth, k: int, latency_queries: int):
+    store = VectorStore(**options)
+    placeholders = [{"text": "", "source": "synthetic"}] * len(docs)
+
+    start = time.perf_counter()
+    store.add_embeddings(docs, placeholders)
+    build_s = time.perf_counter() - start
+
+    # Batched: one FAISS call for every query
+    start = time.perf_counter()
+    _, found = store.search_embeddings(queries, k)
+    batch_s = time.perf_counter() - start
+
+    # Single-query latency, as seen by one retrieve() call
+    latencies = []
+    for q in queries[:latency_queries]:
+        start = time.perf_counter()
+        store.search_embeddings(q[None, :], k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    return {
+        "index_spec": store.index_spec,
+        "build_s": round(build_s, 3),
+        "recall_at_k": round(recall_at_k(found, truth), 4),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies), 4),
+            "p95": round(latencies[int(0.95 * (len(latencies) - 1))], 4),
+        },
+        "batch_qps": round(len(queries) / batch_s, 1),
+        "index_mb": round(index_bytes(store) / 1e6, 2),
+    }
+
+
+# ---------------------------------------------------------
+# BENCHMARK
+# ---------------------------------------------------------
+def run_benchmark(
+    num_docs: int = 100_000,
+    num_queries: int = 1000,
+    dim: int = 384,
+    k: int = 10,
+    latency_queries: int = 200,
+    configs: List | None = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    docs, queries = synthetic_embeddings(num_docs, num_queries, dim, seed)
+
+    # Ground truth: exact nearest neighbours
+    exact = VectorStore(index_type="flat")
+    exact.add_embeddings(docs, [None] * len(docs))
+    _, truth = exact.search_embeddings(queries, k)
+
+    results = {}
+    for label, options in configs or DEFAULT_CONFIGS:
+        results[label] = bench_config(options, docs, queries, truth, k, latency_queries)
+
+    return {
+        "num_docs": num_docs,
+        "num_queries": num_queries,
+        "dim": dim,
+        "k": k,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ANN index recall / latency / memory benchmark")
+    parser.add_argument("--num_docs", type=int, default=100_000, help="Synthetic corpus size")
+    parser.add_argument("--num_queries", type=int, default=1000, help="Queries for recall / throughput")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding size (MiniLM: 384)")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    result = run_benchmark(
+        num_docs=args.num_docs,
+        num_queries=args.num_queries,
+        dim=args.dim,
+        k=args.k,
+        seed=args.seed,
+    )
+
+    print("\n================ ANN INDEXES ================\n")
+    print(f"{result['num_docs']} docs × {result['dim']} dims, {result['num_queries']} queries, k={result['k']}\n")
+    print(
+        f"  {'index':<14}{'spec':<18}{'recall@k':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'batch qps':>11}{'MB':>9}{'build s':>9}"
+    )
+    for label, r in result["results"].items():
+        print(
+            f"  {label:<14}{r['index_spec']:<18}{r['recall_at_k']:>9.3f}"
+            f"{r['latency_ms']['p50']:>9.3f}{r['latency_ms']['p95']:>9.3f}"
+            f"{r['batch_qps']:>11.0f}{r['index_mb']:>9.1f}{r['build_s']:>9.2f}"
+        )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"\n[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# src/benchmarks/columnar_benchmark.py
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.artifacts.columnar import open_table, write_steps
+from src.steps.actions import action_code
+
+CASE_ACTIONS = ["ACC_ON", "ACC_OFF", "LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT", "APPLY_BRAKE"]
+
+
+# ---------------------------------------------------------
+# SYNTHETIC CAMPAIGN
+# ---------------------------------------------------------
+def synthetic_cases(num_cases: int, seed: int = 0) -> List[List[Dict]]:
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(num_cases):
+        case = [{"SET_SPEED": {"value": 0}}]
+        for _ in range(rng.randint(3, 9)):
+            if rng.random() < 0.4:
+                case.append({"SET_SPEED": {"value": rng.randrange(0, 181, 10)}})
+            else:
+                case.append({rng.choice(CASE_ACTIONS): {}})
+        cases.append(case)
+    return cases
+
+
+def formatted(cases: List[List[Dict]]) -> List[Dict]:
+    steps = [s for case in cases for s in case]
+    return [
+        {"index": i, "action": a, "params": p}
+        for i, step in enumerate(steps, start=1)
+        for a, p in step.items()
+    ]
+
+
+# ---------------------------------------------------------
+# MEASUREMENTS
+# ---------------------------------------------------------
+def folder_bytes(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def bench_artifact(name: str, data, kind: str, tmp: str) -> Dict[str, Any]:
+    json_path = os.path.join(tmp, f"{name}.json")
+    cols_path = os.path.join(tmp, name)
+
+    def write_json():
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+    def load_json():
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    _, json_write_s = timed(write_json)
+    _, cols_write_s = timed(lambda: write_steps(cols_path, data, kind))
+
+    loaded, json_load_s = timed(load_json)
+    restored, cols_full_s = timed(lambda: open_table(cols_path).to_list())
+    assert restored == loaded
+
+    # Typical analysis query: distribution of SET_SPEED targets
+    def speeds_json():
+        steps = load_json()
+        if kind == "cases":
+            steps = [s for case in steps for s in case]
+            return [p["value"] for s in steps for a, p in s.items() if a == "SET_SPEED"]
+        return [s["params"]["value"] for s in steps if s["action"] == "SET_SPEED"]
+
+    def speeds_columnar():
+        table = open_table(cols_path)
+        actions, values = table.column("action"), table.column("value")
+        return values[actions == action_code("SET_SPEED")]
+
+    json_speeds, json_query_s = timed(speeds_json)
+    cols_speeds, cols_query_s = timed(speeds_columnar)
+    assert json_speeds == np.asarray(cols_speeds).tolist()
+
+    json_bytes, cols_bytes = folder_bytes(json_path), folder_bytes(cols_path)
+    return {
+        "json_mb": round(json_bytes / 1e6, 2),
+        "columnar_mb": round(cols_bytes / 1e6, 2),
+        "size_ratio": round(json_bytes / cols_bytes, 1),
+        "write_s": {"json": round(json_write_s, 3), "columnar": round(cols_write_s, 3)},
+        "full_load_s": {"json": round(json_load_s, 3), "columnar": round(cols_full_s, 3)},
+        "speed_query_s": {"json": round(json_query_s, 3), "columnar": round(cols_query_s, 4)},
+    }
+
+
+def run_benchmark(num_cases: int = 50_000, seed: int = 0) -> Dict[str, Any]:
+    cases = synthetic_cases(num_cases, seed)
+    artifacts = {
+        "steps_validated": (cases, "cases"),
+        "steps_optimized": (formatted(cases), "formatted"),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            name: bench_artifact(name, data, kind, tmp)
+            for name, (data, kind) in artifacts.items()
+        }
+
+    return {
+        "num_cases": num_cases,
+        "num_steps": sum(len(c) for c in cases),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON vs columnar artifact size / load time")
+    parser.add_argument("--num_cases", type=int, default=50_000, help="Synthetic cases")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.num_cases, args.seed)
+
+    print("\n================ COLUMNAR ARTIFACTS ================\n")
+    print(f"{result['num_cases']} cases, {result['num_steps']} steps\n")
+    for name, r in result["results"].items():
+        print(f"{name}")
+        print(f"  size        : JSON {r['json_mb']} MB vs columnar {r['columnar_mb']} MB ({r['size_ratio']}x)")
+        for label, key in (("write", "write_s"), ("full load", "full_load_s"), ("speed query", "speed_query_s")):
+            print(f"  {label:<12}: JSON {r[key]['json']} s vs columnar {r[key]['columnar']} s")
+        print()
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
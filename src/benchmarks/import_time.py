@@ -0,0 +1,148 @@
+# src/benchmarks/import_time.py
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Modules that must not be imported just to start the CLI
+HEAVY_MODULES = ["torch", "sentence_transformers", "faiss", "matplotlib", "transformers"]
+
+DEFAULT_TARGET_MS = 300.0
+
+
+# ---------------------------------------------------------
+# MEASUREMENTS
+# ---------------------------------------------------------
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parses `python -X importtime` output lines:
+        import time: self [us] | cumulative | imported package
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return entries
+
+
+def measure_importtime(module: str) -> List[Dict[str, Any]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def measure_cold_start(argv: List[str], repeats: int) -> List[float]:
+    """
+    Wall-clock milliseconds for a fresh interpreter running `argv`.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *argv], capture_output=True, check=True
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+# ---------------------------------------------------------
+# BENCHMARK
+# ---------------------------------------------------------
+def run_benchmark(
+    module: str = "main",
+    argv: List[str] | None = None,
+    repeats: int = 5,
+    target_ms: float = DEFAULT_TARGET_MS,
+    top: int = 10,
+) -> Dict[str, Any]:
+    argv = argv or ["main.py", "--help"]
+
+    entries = measure_importtime(module)
+    imported = {e["module"] for e in entries}
+    total_us = sum(e["self_us"] for e in entries)
+
+    timings = measure_cold_start(argv, repeats)
+    median_ms = statistics.median(timings)
+
+    return {
+        "module": module,
+        "import_total_ms": round(total_us / 1000, 2),
+        "top_imports": [
+            {
+                "module": e["module"],
+                "self_ms": round(e["self_us"] / 1000, 2),
+                "cumulative_ms": round(e["cumulative_us"] / 1000, 2),
+            }
+            for e in sorted(entries, key=lambda e: e["self_us"], reverse=True)[:top]
+        ],
+        "heavy_modules_imported": [m for m in HEAVY_MODULES if m in imported],
+        "cold_start_cmd": " ".join(argv),
+        "cold_start_ms": {
+            "median": round(median_ms, 2),
+            "min": round(min(timings), 2),
+            "max": round(max(timings), 2),
+        },
+        "target_ms": target_ms,
+        "passed": median_ms <= target_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI import-time / cold-start benchmark")
+    parser.add_argument("--module", default="main", help="Module imported under -X importtime")
+    parser.add_argument("--repeats", type=int, default=5, help="Cold-start repetitions")
+    parser.add_argument(
+        "--target_ms",
+        type=float,
+        default=DEFAULT_TARGET_MS,
+        help="Cold-start budget for `python main.py --help` (median)",
+    )
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.module, repeats=args.repeats, target_ms=args.target_ms)
+
+    print("\n================ IMPORT TIME ================\n")
+    print(f"import {result['module']}: {result['import_total_ms']} ms (sum of self times)")
+    print(f"  {'self ms':>9}  {'cum. ms':>9}  module")
+    for e in result["top_imports"]:
+        print(f"  {e['self_ms']:>9.2f}  {e['cumulative_ms']:>9.2f}  {e['module']}")
+
+    if result["heavy_modules_imported"]:
+        print(f"\n[WARN] Heavy modules imported at startup: {result['heavy_modules_imported']}")
+
+    cs = result["cold_start_ms"]
+    status = "OK" if result["passed"] else "FAIL"
+    print(
+        f"\n[{status}] `python {result['cold_start_cmd']}` median {cs['median']} ms "
+        f"(min {cs['min']}, max {cs['max']}), target {result['target_ms']} ms"
+    )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"[OK] Saved results → {args.out}")
+
+    if not result["passed"] or result["heavy_modules_imported"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
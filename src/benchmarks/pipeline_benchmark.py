@@ -0,0 +1,336 @@
+# src/benchmarks/pipeline_benchmark.py
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from src.metrics.instrumentation import Metrics
+from src.nlp.nlp_processor import NLPProcessor
+from src.pipeline.orchestrator import Orchestrator
+from src.pipeline.resources import PipelineResources
+
+# Compared against when it exists; --save_baseline (re)writes it
+DEFAULT_BASELINE = ".avtc_cache/pipeline_baseline.json"
+# Relative slowdown (per stage / throughput) reported as a regression
+DEFAULT_TOLERANCE = 0.25
+# Stages / runs shorter than this are timer noise and never compared
+MIN_COMPARE_SECONDS = 0.01
+
+BACK_HALF_STAGES = ("chaining", "optimizer", "state_machine", "reporting")
+STAGES = ("nlp", "reasoner") + BACK_HALF_STAGES
+
+CONNECTORS = [", then ", " and ", " and then ", ", after that ", "; next ", ", "]
+SPEEDS = list(range(0, 201, 10))
+
+
+# ---------------------------------------------------------
+# SYNTHETIC SUITE
+# ---------------------------------------------------------
+def generate_descriptions(
+    num_cases: int,
+    seed: int = 0,
+    templates: Dict[str, List[str]] | None = None,
+    max_clauses: int = 4,
+) -> List[Dict[str, str]]:
+    """
+    Seeded test descriptions built from the NLP keyword_templates phrases:
+    1..max_clauses clauses (SET_SPEED phrases get a speed) joined by the
+    connectors the NLP splits on.
+    """
+    templates = templates or NLPProcessor().keyword_templates
+    rng = random.Random(seed)
+    actions = sorted(templates)
+
+    cases = []
+    for i in range(num_cases):
+        clauses = []
+        for _ in range(rng.randint(1, max_clauses)):
+            action = rng.choice(actions)
+            phrase = rng.choice(templates[action])
+            if action == "SET_SPEED":
+                phrase = f"{phrase} {rng.choice(SPEEDS)}"
+            clauses.append(phrase)
+
+        text = clauses[0]
+        for clause in clauses[1:]:
+            text += rng.choice(CONNECTORS) + clause
+        cases.append({"id": f"bench_{i + 1:06d}", "description": text[0].upper() + text[1:] + "."})
+    return cases
+
+
+# ---------------------------------------------------------
+# MEASUREMENT
+# ---------------------------------------------------------
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    p50 / p90 / p99 / max in milliseconds (nearest rank).
+    """
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    rank = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "p50_ms": round(rank(0.50) * 1000, 3),
+        "p90_ms": round(rank(0.90) * 1000, 3),
+        "p99_ms": round(rank(0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Process peak RSS so far (Linux / macOS); None where unavailable.
+    A high-water mark over the whole process (models included), so it
+    is reported once per benchmark, not per suite size.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1 << 20) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def bench_size(
+    resources: PipelineResources,
+    num_cases: int,
+    seed: int,
+    trace_memory: bool = False,
+) -> Dict[str, Any]:
+    """
+    One suite through the Orchestrator's per-case stages (NLP, Reasoner;
+    timed per case) and its back half (assemble_report; timed per stage).
+    trace_memory adds the suite's tracemalloc peak (and skews the timings).
+    """
+    descriptions = generate_descriptions(num_cases, seed, resources.nlp.keyword_templates)
+    metrics = Metrics()
+    orch = Orchestrator(metrics=metrics, resources=resources)
+    nlp_samples, reasoner_samples = [], []
+
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    records = []
+    for idx, case in enumerate(descriptions):
+        t0 = time.perf_counter()
+        record = orch.parse_case(idx, case)
+        t1 = time.perf_counter()
+        orch.validate_case(record)
+        t2 = time.perf_counter()
+        nlp_samples.append(t1 - t0)
+        reasoner_samples.append(t2 - t1)
+        records.append(record)
+    metrics.record_time("nlp", sum(nlp_samples))
+    metrics.record_time("reasoner", sum(reasoner_samples))
+
+    report = orch.assemble_report(records)
+    end_to_end = time.perf_counter() - start
+
+    traced_peak = None
+    if trace_memory:
+        traced_peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+
+    stages = {}
+    for name in STAGES:
+        seconds = metrics.timers.get(name, {}).get("seconds", 0.0)
+        stages[name] = {
+            "seconds": round(seconds, 4),
+            "share": round(seconds / end_to_end, 3) if end_to_end else 0.0,
+        }
+
+    result = {
+        "num_cases": num_cases,
+        "steps_raw": int(metrics.counters.get("steps_raw", 0)),
+        "steps_chained": int(metrics.counters.get("steps_chained", 0)),
+        "steps_optimized": report["summary"]["total_steps"],
+        "issues": int(metrics.counters.get("issues", 0)),
+        "end_to_end_s": round(end_to_end, 4),
+        "cases_per_s": round(num_cases / end_to_end, 1) if end_to_end else None,
+        "stages": stages,
+        "case_latency": {
+            "nlp": percentiles(nlp_samples),
+            "reasoner": percentiles(reasoner_samples),
+            "case": percentiles([a + b for a, b in zip(nlp_samples, reasoner_samples)]),
+        },
+    }
+    if traced_peak is not None:
+        result["peak_traced_mb"] = round(traced_peak, 2)
+    return result
+
+
+def run_benchmark(
+    sizes: List[int], seed: int = 0, repeats: int = 3, memory: bool = True
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    resources = PipelineResources()
+    # Model + template embeddings + RAG index load outside the timed runs
+    resources.nlp.template_embeddings
+    resources.reasoner.rag.retrieve("ACC minimum speed", top_k=1)
+    startup_s = time.perf_counter() - start
+
+    # Warm-up: first-call costs (regex compilation, lazy imports)
+    bench_size(resources, 5, seed + 1)
+
+    results = []
+    for n in sorted(sizes):
+        # Fastest of `repeats` runs per size
+        result = min(
+            (bench_size(resources, n, seed) for _ in range(repeats)),
+            key=lambda r: r["end_to_end_s"],
+        )
+        if memory:
+            # Separate pass: tracemalloc would slow down the timed runs
+            traced = bench_size(resources, n, seed, trace_memory=True)
+            result["peak_traced_mb"] = traced["peak_traced_mb"]
+        results.append(result)
+
+    return {
+        "meta": {
+            "seed": seed,
+            "repeats": repeats,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "startup_s": round(startup_s, 3),
+            "peak_rss_mb": peak_rss_mb(),
+        },
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------
+# BASELINE COMPARISON
+# ---------------------------------------------------------
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict]:
+    """
+    Regressions of `current` against `baseline`, per suite size present
+    in both: throughput drops and stage slowdowns beyond `tolerance`.
+    """
+    old_by_size = {r["num_cases"]: r for r in baseline.get("results", [])}
+    regressions = []
+
+    for new in current["results"]:
+        old = old_by_size.get(new["num_cases"])
+        if old is None:
+            continue
+
+        slowest = max(old.get("end_to_end_s", 0), new["end_to_end_s"])
+        if old.get("cases_per_s") and new["cases_per_s"] and slowest >= MIN_COMPARE_SECONDS:
+            change = new["cases_per_s"] / old["cases_per_s"] - 1
+            if change < -tolerance:
+                regressions.append(
+                    {
+                        "num_cases": new["num_cases"],
+                        "metric": "cases_per_s",
+                        "baseline": old["cases_per_s"],
+                        "current": new["cases_per_s"],
+                        "change": round(change, 3),
+                    }
+                )
+
+        for name, stage in new["stages"].items():
+            before = old.get("stages", {}).get(name, {}).get("seconds")
+            if not before or max(before, stage["seconds"]) < MIN_COMPARE_SECONDS:
+                continue
+            change = stage["seconds"] / before - 1
+            if change > tolerance:
+                regressions.append(
+                    {
+                        "num_cases": new["num_cases"],
+                        "metric": f"{name}_seconds",
+                        "baseline": before,
+                        "current": stage["seconds"],
+                        "change": round(change, 3),
+                    }
+                )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage pipeline throughput benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Suite sizes (cases)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per size (fastest kept)")
+    parser.add_argument(
+        "--no_memory",
+        action="store_true",
+        help="Skip the extra tracemalloc pass that measures each suite's peak memory",
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results JSON")
+    parser.add_argument(
+        "--save_baseline", action="store_true", help="Store this run as the baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.sizes, args.seed, args.repeats, not args.no_memory)
+
+    print("\n================ PIPELINE BENCHMARK ================\n")
+    print(f"Startup (models + RAG index): {result['meta']['startup_s']:.2f} s\n")
+    print(
+        f"{'cases':>7}  {'steps':>8}  {'total':>9}  {'cases/s':>9}  "
+        + "  ".join(f"{name:>13}" for name in STAGES)
+        + f"  {'case p50/p99 ms':>17}  {'peak MB':>7}"
+    )
+    for r in result["results"]:
+        latency = r["case_latency"]["case"]
+        print(
+            f"{r['num_cases']:>7}  {r['steps_raw']:>8}  {r['end_to_end_s']:>8.3f}s  "
+            f"{r['cases_per_s']:>9.1f}  "
+            + "  ".join(f"{r['stages'][name]['seconds']:>12.4f}s" for name in STAGES)
+            + f"  {latency['p50_ms']:>8.2f}/{latency['p99_ms']:<8.2f}"
+            + f"  {r.get('peak_traced_mb', '-'):>7}"
+        )
+    print(
+        "\npeak MB: Python allocations while running that suite (tracemalloc). "
+        f"Process peak RSS, models included: {result['meta']['peak_rss_mb']} MB"
+    )
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(result, baseline, args.tolerance)
+        result["baseline"] = {"path": args.baseline, "tolerance": args.tolerance}
+        result["regressions"] = regressions
+
+        if regressions:
+            print(f"\n[FAIL] {len(regressions)} regression(s) vs {args.baseline}:")
+            for reg in regressions:
+                print(
+                    f"  {reg['num_cases']:>7} cases  {reg['metric']:<22} "
+                    f"{reg['baseline']} → {reg['current']} ({reg['change']:+.0%})"
+                )
+        else:
+            print(f"\n[OK] No regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"\n[OK] Saved baseline → {args.baseline}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"[OK] Saved results → {args.out}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# src/benchmarks/plot_benchmark.py
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from src.benchmarks.timeline_benchmark import synthetic_steps
+from src.steps.timeline import extract_timelines
+from src.visualisation.visualisations import (
+    PLOT_MAX_POINTS,
+    available_cpus,
+    generate_all_visualisations,
+)
+
+
+# ---------------------------------------------------------
+# REFERENCE: pyplot, every point, markers on the speed plot
+# ---------------------------------------------------------
+def legacy_plots(timelines, out_dir: str) -> Dict[str, float]:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    timings = {}
+    for name, signal, figsize in (
+        ("speed_profile", timelines.speed.tolist(), (10, 4)),
+        ("acc_timeline", timelines.acc.tolist(), (10, 2.5)),
+        ("lane_timeline", timelines.lane.tolist(), (10, 3)),
+    ):
+        start = time.perf_counter()
+        plt.figure(figsize=figsize)
+        if name == "speed_profile":
+            plt.plot(signal, marker="o", linewidth=2)
+        else:
+            plt.step(range(len(signal)), signal, where="mid", linewidth=2)
+        plt.grid(True)
+        plt.savefig(os.path.join(out_dir, f"{name}.png"))
+        plt.close()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def bench_size(num_steps: int, max_points: int, legacy: bool) -> Dict[str, Any]:
+    timelines = extract_timelines(synthetic_steps(num_steps))
+    result: Dict[str, Any] = {"num_steps": num_steps}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if legacy:
+            per_plot, total = timed(lambda: legacy_plots(timelines, tmp))
+            result["legacy"] = {"total_s": round(total, 2), "per_plot_s": _rounded(per_plot)}
+        runs = (
+            ("serial", max_points, 1),
+            ("parallel", max_points, 3),
+            ("all points, parallel", 0, 3),
+        )
+        for label, points, workers in runs:
+            per_plot, total = timed(
+                lambda: generate_all_visualisations(None, tmp, points, workers, timelines)
+            )
+            result[label] = {"total_s": round(total, 2), "per_plot_s": _rounded(per_plot)}
+    return result
+
+
+def _rounded(timings: Dict[str, float]) -> Dict[str, float]:
+    return {k: round(v, 3) for k, v in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Legacy vs downsampled / parallel plot rendering")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max_points", type=int, default=PLOT_MAX_POINTS)
+    parser.add_argument(
+        "--legacy_max", type=int, default=1_000_000, help="Skip the legacy renderer above this size"
+    )
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    print(f"CPUs available: {available_cpus()}")
+    results: List[Dict[str, Any]] = [
+        bench_size(n, args.max_points, legacy=n <= args.legacy_max) for n in args.sizes
+    ]
+
+    print("\n================ PLOT RENDERING ================\n")
+    for r in results:
+        print(f"{r['num_steps']:,} steps")
+        for label in ("legacy", "serial", "parallel", "all points, parallel"):
+            if label in r:
+                plots = ", ".join(f"{k} {v:.2f}s" for k, v in r[label]["per_plot_s"].items())
+                print(f"  {label:<20}: {r[label]['total_s']:>6.2f} s  ({plots})")
+        print()
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
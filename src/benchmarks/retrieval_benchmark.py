@@ -0,0 +1,142 @@
+# src/benchmarks/retrieval_benchmark.py
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+from src.rag.document_loader import DocumentLoader
+from src.rag.rag_engine import RETRIEVAL_MODES, RAGEngine
+
+FEATURES = ["ACC", "LKA", "AEB", "FCW", "Lane change", "Speed", "Braking", "Sensor fusion"]
+CONSTRAINTS = ["must not exceed", "must remain below", "must trigger above", "must hold within"]
+UNITS = ["km/h", "seconds", "meters", "g", "degrees"]
+
+
+# ---------------------------------------------------------
+# SYNTHETIC CORPUS + QUERIES
+# ---------------------------------------------------------
+def write_corpus(folder: Path, num_rules: int, rules_per_file: int = 500, seed: int = 0):
+    rng = random.Random(seed)
+    rules = []
+
+    for start in range(0, num_rules, rules_per_file):
+        file_rules = []
+        for r in range(start, min(num_rules, start + rules_per_file)):
+            rule = {
+                "id": f"{rng.choice(FEATURES).upper().replace(' ', '_')}_REQ_{r:06d}",
+                "text": (
+                    f"{rng.choice(FEATURES)} {rng.choice(CONSTRAINTS)} "
+                    f"{rng.randint(1, 250)} {rng.choice(UNITS)}."
+                ),
+            }
+            file_rules.append(rule)
+        (folder / f"spec_{start // rules_per_file:04d}.yaml").write_text(
+            yaml.safe_dump({"rules": file_rules}, sort_keys=False)
+        )
+        rules.extend(file_rules)
+
+    return rules
+
+
+def make_queries(rules: List[Dict], num_queries: int, seed: int = 1):
+    """
+    Exact-term queries (requirement ids, limits with units) and the
+    natural-language rule texts themselves.
+    """
+    rng = random.Random(seed)
+    sample = rng.sample(rules, min(num_queries, len(rules)))
+    return {
+        "rule_id": [(r["id"], r["id"]) for r in sample],
+        "limit": [(" ".join(r["text"].split()[-2:]).rstrip("."), r["id"]) for r in sample],
+        "text": [(r["text"], r["id"]) for r in sample],
+    }
+
+
+# ---------------------------------------------------------
+# BENCHMARK
+# ---------------------------------------------------------
+def bench_mode(rag: RAGEngine, queries, mode: str, k: int) -> Dict[str, Any]:
+    latencies = []
+    hits = 0
+    for query, rule_id in queries:
+        start = time.perf_counter()
+        results = rag.retrieve(query, top_k=k, mode=mode)
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += any(d["rule_id"] == rule_id for d in results)
+    latencies.sort()
+
+    return {
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 3),
+        "hit_at_k": round(hits / len(queries), 3),
+    }
+
+
+def run_benchmark(num_rules: int = 5000, num_queries: int = 200, k: int = 5, seed: int = 0):
+    with tempfile.TemporaryDirectory() as tmp:
+        rules = write_corpus(Path(tmp), num_rules, seed=seed)
+        rag = RAGEngine(index_dir=None, loader=DocumentLoader(base_path=tmp))
+
+        start = time.perf_counter()
+        rag.build_index()
+        vector_build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lexical = rag.lexical
+        lexical_build_s = time.perf_counter() - start
+
+        # Repeated queries would be served from the embedding LRU
+        rag.store.query_cache_size = 0
+
+        results = {}
+        for kind, queries in make_queries(rules, num_queries, seed + 1).items():
+            results[kind] = {mode: bench_mode(rag, queries, mode, k) for mode in RETRIEVAL_MODES}
+
+        return {
+            "num_rules": num_rules,
+            "num_chunks": len(rag.store.documents),
+            "num_terms": len(lexical.postings),
+            "k": k,
+            "vector_build_s": round(vector_build_s, 2),
+            "lexical_build_s": round(lexical_build_s, 3),
+            "results": results,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector vs lexical vs hybrid retrieval benchmark")
+    parser.add_argument("--num_rules", type=int, default=5000, help="Synthetic rules in the corpus")
+    parser.add_argument("--num_queries", type=int, default=200, help="Queries per query kind")
+    parser.add_argument("--k", type=int, default=5, help="Results per query (hit@k)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.num_rules, args.num_queries, args.k, args.seed)
+
+    print("\n================ RETRIEVAL MODES ================\n")
+    print(
+        f"{result['num_rules']} rules → {result['num_chunks']} chunks, "
+        f"{result['num_terms']} terms; build: vector {result['vector_build_s']} s, "
+        f"BM25 {result['lexical_build_s']} s\n"
+    )
+    print(f"  {'queries':<10}{'mode':<10}{'p50 ms':>9}{'p95 ms':>9}{'hit@' + str(result['k']):>8}")
+    for kind, modes in result["results"].items():
+        for mode, r in modes.items():
+            print(f"  {kind:<10}{mode:<10}{r['p50_ms']:>9.3f}{r['p95_ms']:>9.3f}{r['hit_at_k']:>8.3f}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"\n[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# src/benchmarks/step_benchmark.py
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from src.chaining.chaining_engine import ChainingEngine
+from src.optimizer.redundancy_optimizer import RedundancyOptimizer
+from src.state_machine.state_machine import StateMachine
+from src.steps.sequence import StepSequence
+from src.steps.step import to_dicts, to_steps
+
+ACTIONS = [
+    "SET_SPEED", "ACC_ON", "ACC_OFF", "LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT",
+    "INDICATOR_LEFT", "INDICATOR_RIGHT", "APPLY_BRAKE",
+]
+
+
+# ---------------------------------------------------------
+# REFERENCE: the dict-step optimizer loop (one .items() unpack
+# and params lookup per step)
+# ---------------------------------------------------------
+def _unpack(step: Dict):
+    [(action, params)] = step.items()
+    return action, params or {}
+
+
+def dict_optimize(steps: List[Dict]) -> List[Dict]:
+    optimized = []
+    last = {"speed": None, "acc_on": None, "lane": None, "indicator": None}
+    last_action = None
+    toggles = {
+        "ACC_ON": ("acc_on", True),
+        "ACC_OFF": ("acc_on", False),
+        "LANE_CHANGE_LEFT": ("lane", "LEFT"),
+        "LANE_CHANGE_RIGHT": ("lane", "RIGHT"),
+        "INDICATOR_LEFT": ("indicator", "LEFT"),
+        "INDICATOR_RIGHT": ("indicator", "RIGHT"),
+    }
+
+    for step in steps:
+        action, params = _unpack(step)
+        if action == "APPLY_BRAKE" and last_action == "APPLY_BRAKE":
+            continue
+        if action == "SET_SPEED":
+            speed = params.get("value")
+            if last["speed"] == speed:
+                last_action = action
+                continue
+            last["speed"] = speed
+        if action in toggles:
+            key, value = toggles[action]
+            if last[key] is value or last[key] == value:
+                last_action = action
+                continue
+            last[key] = value
+        optimized.append(step)
+        last_action = action
+    return optimized
+
+
+def synthetic_cases(num_cases: int, steps_per_case: int, seed: int = 0) -> List[List[Dict]]:
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(num_cases):
+        case = []
+        for _ in range(steps_per_case):
+            action = rng.choice(ACTIONS)
+            params = {"value": rng.randrange(0, 181, 10)} if action == "SET_SPEED" else {}
+            case.append({action: params})
+        cases.append(case)
+    return cases
+
+
+def best_of(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def allocated(fn) -> float:
+    """
+    MB still held by fn()'s result (tracemalloc, current after the call).
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held / 1e6
+
+
+def back_half(cases) -> int:
+    steps = ChainingEngine().chain_tests(cases)
+    steps = RedundancyOptimizer().optimize(steps)
+    sm = StateMachine()
+    return sum(sm.apply_step(step)[0] for step in steps)
+
+
+def back_half_sequence(seq: StepSequence, num_cases: int) -> int:
+    steps = ChainingEngine().chain_sequence(seq, num_cases=num_cases)
+    steps = RedundancyOptimizer().optimize(steps)
+    return sum(ok for ok, _ in StateMachine().apply_sequence(steps))
+
+
+def bench_size(num_steps: int, repeats: int, seed: int, steps_per_case: int = 20) -> Dict[str, Any]:
+    text = json.dumps(synthetic_cases(max(1, num_steps // steps_per_case), steps_per_case, seed))
+    dict_cases = json.loads(text)
+    step_cases = [to_steps(case) for case in dict_cases]
+    seq = StepSequence.from_cases(step_cases)
+    flat_dicts = [step for case in dict_cases for step in case]
+    flat_steps = [step for case in step_cases for step in case]
+
+    assert to_dicts(RedundancyOptimizer().optimize(flat_steps)) == dict_optimize(flat_dicts)
+    assert back_half_sequence(seq, len(step_cases)) == back_half(step_cases)
+
+    # Memory held by the sequence: parsed dict form vs converted Steps
+    dict_mb = allocated(lambda: json.loads(text))
+    step_mb = allocated(lambda: [to_steps(case) for case in json.loads(text)])
+    sequence_mb = allocated(lambda: StepSequence.from_cases(json.loads(text)))
+
+    unpack_dict_s = best_of(lambda: [_unpack(s)[1].get("value") for s in flat_dicts], repeats)
+    unpack_step_s = best_of(lambda: [s.value for s in flat_steps], repeats)
+    optimize_dict_s = best_of(lambda: dict_optimize(flat_dicts), repeats)
+    optimize_step_s = best_of(lambda: RedundancyOptimizer().optimize(flat_steps), repeats)
+    back_dict_s = best_of(lambda: back_half(dict_cases), repeats)
+    back_step_s = best_of(lambda: back_half(step_cases), repeats)
+    back_sequence_s = best_of(lambda: back_half_sequence(seq, len(step_cases)), repeats)
+    convert_s = best_of(lambda: [to_steps(case) for case in dict_cases], repeats)
+
+    return {
+        "num_steps": len(flat_steps),
+        "dict_mb": round(dict_mb, 1),
+        "step_mb": round(step_mb, 1),
+        "sequence_mb": round(sequence_mb, 1),
+        "unpack_dict_s": round(unpack_dict_s, 4),
+        "unpack_step_s": round(unpack_step_s, 4),
+        "optimize_dict_s": round(optimize_dict_s, 4),
+        "optimize_step_s": round(optimize_step_s, 4),
+        "back_half_dict_input_s": round(back_dict_s, 4),
+        "back_half_step_s": round(back_step_s, 4),
+        "back_half_sequence_s": round(back_sequence_s, 4),
+        "convert_s": round(convert_s, 4),
+    }
+
+
+def run_benchmark(sizes: List[int], repeats: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    return [bench_size(n, repeats, seed) for n in sizes]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Dict steps vs interned Step objects vs a StepSequence"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="Step counts"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.repeats, args.seed)
+
+    print("\n================ STEP REPRESENTATION ================\n")
+    print(
+        f"{'steps':>10}  {'dict MB':>8}  {'Step MB':>8}  {'seq MB':>7}  {'unpack d/S':>15}  "
+        f"{'optimize d/S':>15}  {'back half d/S/seq':>22}  {'convert':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['num_steps']:>10}  {r['dict_mb']:>8.1f}  {r['step_mb']:>8.1f}  "
+            f"{r['sequence_mb']:>7.1f}  "
+            f"{r['unpack_dict_s']:>6.3f}/{r['unpack_step_s']:.3f}s  "
+            f"{r['optimize_dict_s']:>6.3f}/{r['optimize_step_s']:.3f}s  "
+            f"{r['back_half_dict_input_s']:>6.3f}/{r['back_half_step_s']:.3f}"
+            f"/{r['back_half_sequence_s']:.3f}s  "
+            f"{r['convert_s']:>7.3f}s"
+        )
+    print(
+        "\nMB: memory held by the parsed suite (JSON → dicts vs JSON → dicts → Steps "
+        "or → StepSequence; the dicts are garbage once converted). Back half = chain + "
+        "optimize + state machine fed dict steps (converted per step) vs Steps vs a "
+        "StepSequence."
+    )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"\n[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# src/benchmarks/timeline_benchmark.py
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.artifacts.columnar import open_table, write_steps
+from src.steps.timeline import extract_timelines, timelines_from_table
+
+ACTIONS = [
+    "SET_SPEED", "ACC_ON", "ACC_OFF", "LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT",
+    "INDICATOR_LEFT", "INDICATOR_RIGHT", "APPLY_BRAKE",
+]
+
+
+# ---------------------------------------------------------
+# REFERENCE: the three separate list-building walks
+# ---------------------------------------------------------
+def separate_passes(steps: List[Dict]):
+    speeds, current_speed = [], 0
+    for step in steps:
+        if step["action"] == "SET_SPEED":
+            current_speed = step["params"].get("value", current_speed)
+        speeds.append(current_speed)
+
+    acc_state, acc_on = [], False
+    for step in steps:
+        if step["action"] == "ACC_ON":
+            acc_on = True
+        elif step["action"] == "ACC_OFF":
+            acc_on = False
+        acc_state.append(1 if acc_on else 0)
+
+    lane, lane_map, timeline = "CENTER", {"LEFT": 2, "CENTER": 1, "RIGHT": 0}, []
+    for step in steps:
+        if step["action"] == "LANE_CHANGE_LEFT":
+            lane = "LEFT"
+        elif step["action"] == "LANE_CHANGE_RIGHT":
+            lane = "RIGHT"
+        timeline.append(lane_map[lane])
+
+    return speeds, acc_state, timeline
+
+
+def synthetic_steps(num_steps: int, seed: int = 0) -> List[Dict]:
+    rng = random.Random(seed)
+    steps = []
+    for i in range(num_steps):
+        action = rng.choice(ACTIONS)
+        params = {"value": rng.randrange(0, 181, 10)} if action == "SET_SPEED" else {}
+        steps.append({"index": i + 1, "action": action, "params": params})
+    return steps
+
+
+def best_of(fn, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_size(num_steps: int, repeats: int, seed: int) -> Dict[str, Any]:
+    steps = synthetic_steps(num_steps, seed)
+
+    speeds, acc, lane = separate_passes(steps)
+    fused = extract_timelines(steps)
+    assert fused.speed.tolist() == speeds and fused.acc.tolist() == acc and fused.lane.tolist() == lane
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "steps_optimized")
+        write_steps(path, steps, "formatted")
+        columnar = timelines_from_table(open_table(path))
+        assert all(np.array_equal(a, b) for a, b in zip(fused, columnar))
+        columnar_s = best_of(lambda: timelines_from_table(open_table(path)), repeats)
+
+    separate_s = best_of(lambda: separate_passes(steps), repeats)
+    # Plots (and any NumPy consumer) convert the lists to arrays anyway
+    as_arrays_s = best_of(lambda: [np.asarray(t) for t in separate_passes(steps)], repeats)
+    fused_s = best_of(lambda: extract_timelines(steps), repeats)
+    return {
+        "num_steps": num_steps,
+        "separate_s": round(separate_s, 4),
+        "separate_arrays_s": round(as_arrays_s, 4),
+        "fused_s": round(fused_s, 4),
+        "columnar_s": round(columnar_s, 4),
+        "speedup_fused": round(as_arrays_s / fused_s, 1),
+        "speedup_columnar": round(as_arrays_s / columnar_s, 1),
+        # List pointer slots alone (3 lists) vs the four arrays
+        "list_mb": round(3 * num_steps * 8 / 1e6, 1),
+        "array_mb": round(sum(a.nbytes for a in fused) / 1e6, 1),
+    }
+
+
+def run_benchmark(sizes: List[int], repeats: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    return [bench_size(n, repeats, seed) for n in sizes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Separate vs fused timeline extraction")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 3_000_000], help="Step counts"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write results as JSON here")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.repeats, args.seed)
+
+    print("\n================ TIMELINE EXTRACTION ================\n")
+    print(
+        f"{'steps':>10}  {'3 walks':>9}  {'+ arrays':>9}  {'fused':>9}  {'columnar':>9}"
+        f"  {'x fused':>8}  {'x cols':>7}"
+    )
+    for r in results:
+        print(
+            f"{r['num_steps']:>10}  {r['separate_s']:>8.3f}s  {r['separate_arrays_s']:>8.3f}s  "
+            f"{r['fused_s']:>8.3f}s  {r['columnar_s']:>8.3f}s  "
+            f"{r['speedup_fused']:>7.1f}x  {r['speedup_columnar']:>6.1f}x"
+        )
+    print("\nSpeed-ups are against the three walks + list → array conversion.")
+    largest = results[-1]
+    print(
+        f"Memory at {largest['num_steps']} steps: {largest['list_mb']} MB of list slots (3 signals) "
+        f"vs {largest['array_mb']} MB of arrays (4 signals)"
+    )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"\n[OK] Saved results → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
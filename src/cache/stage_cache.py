@@ -0,0 +1,74 @@
+# src/cache/stage_cache.py
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict
+
+from src.utils.fileio import atomic_write_json
+
+
+class StageCache:
+    """
+    Persistent, content-addressed cache of per-case stage output:
+    - Keyed by hash of (case text, NLP version, rule-set version)
+    - Stores raw NLP steps, validated steps and issues per case
+    - Counts hits / misses for the current run
+    """
+
+    def __init__(self, cache_dir: str = ".avtc_cache/stages", enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def key(self, text: str, nlp_version: str, rules_version: str) -> str:
+        payload = json.dumps([text, nlp_version, rules_version])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        if not self.enabled:
+            return
+        atomic_write_json(self._path(key), entry)
+
+    def clear(self):
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    # ---------------------------------------------------------
+    # INTERNAL HELPERS
+    # ---------------------------------------------------------
+    def _path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small on big campaigns
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
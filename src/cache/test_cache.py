@@ -0,0 +1,33 @@
+# src/cache/test_cache.py
+
+import tempfile
+
+from src.cache.stage_cache import StageCache
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = StageCache(tmp)
+
+        key = cache.key("Accelerate to 80.", "nlp-v1", "rules-v1")
+        print("FIRST LOOKUP :", cache.get(key))
+
+        cache.put(
+            key,
+            {
+                "steps_raw": [{"SET_SPEED": {"value": 80}}],
+                "steps_validated": [{"SET_SPEED": {"value": 80}}],
+                "issues": [],
+            },
+        )
+        print("SECOND LOOKUP:", cache.get(key))
+
+        # Any version change produces a new key → recompute
+        other = cache.key("Accelerate to 80.", "nlp-v1", "rules-v2")
+        print("NEW RULES    :", cache.get(other))
+
+        print("\nSTATS:", cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # src/chaining/chaining_engine.py
 
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+from src.steps.sequence import StepSequence
+from src.steps.step import Action, Step, as_step, make_step
 
 
 class ChainingEngine:
@@ -19,8 +22,8 @@ class ChainingEngine:
     # ---------------------------------------------------------
     def chain_tests(
         self,
-        test_cases: List[List[Dict]],
-    ) -> List[Dict]:
+        test_cases: List[List[Step | Dict]],
+    ) -> List[Step]:
         """
         test_cases: list of test sequences
             [
@@ -29,98 +32,161 @@ class ChainingEngine:
               ...
             ]
 
-        returns: single chained sequence (list of steps)
+        returns: single chained sequence (list of Steps)
         """
-        chained: List[Dict] = []
-        current_state = {
+        chained: List[Step] = []
+        current_state = self.new_state()
+
+        for case in test_cases:
+            chained.extend(self.chain_case(case, current_state))
+
+        return chained
+
+    def new_state(self) -> Dict:
+        return {
             "speed": None,
             "acc_on": False,
             "lane": "CENTER",  # simple placeholder
+            "cases": 0,
         }
 
-        for idx, case in enumerate(test_cases):
-            if idx == 0:
-                # First test: just append, and update state
-                for step in case:
-                    self._update_state(current_state, step)
-                    chained.append(step)
-                continue
+    def chain_case(self, case: List[Step | Dict], current_state: Dict) -> List[Step]:
+        """
+        Incremental form of chain_tests: appends one case to a chain whose
+        end state is `current_state` (updated in place).
+        returns: transition steps (if any) followed by the case steps
+        """
+        chained: List[Step] = []
 
-            # For subsequent tests: insert transition if needed
+        # For subsequent tests: insert transition if needed
+        if current_state["cases"] > 0:
             transition = self._build_transition(
                 from_state=current_state,
-                to_case=case,
+                target_speed=self._get_first_speed(case),
             )
             chained.extend(transition)
 
-            # Then append the case itself, updating state
-            for step in case:
-                self._update_state(current_state, step)
-                chained.append(step)
+        # Then append the case itself, updating state
+        for step in case:
+            step = as_step(step)
+            self._update_state(current_state, step.action, step.value)
+            chained.append(step)
 
+        current_state["cases"] += 1
         return chained
 
+    def chain_sequence(
+        self,
+        cases: StepSequence,
+        current_state: Dict | None = None,
+        num_cases: int | None = None,
+        first_case: int = 0,
+    ) -> StepSequence:
+        """
+        chain_tests over a whole suite as one StepSequence (case ids from
+        StepSequence.from_cases): one pass over its columns, then all
+        transitions are inserted at once. Transition steps carry the id of
+        the case they lead into. `current_state` carries the chain across
+        calls.
+
+        Empty cases have no rows, so the suite's case ids are
+        first_case .. first_case + num_cases - 1 (as passed to from_cases);
+        without num_cases, trailing empty cases cannot be seen and are not
+        chained.
+        """
+        if current_state is None:
+            current_state = self.new_state()
+        pairs = list(cases.pairs())
+        rows: List[int] = []
+        transitions: List[Step] = []
+        transition_cases: List[int] = []
+
+        def chain_empty(ids: range, row: int):
+            # Empty cases have no rows but still get their transition
+            for empty_id in ids:
+                transition = self.chain_case([], current_state)
+                rows.extend([row] * len(transition))
+                transitions.extend(transition)
+                transition_cases.extend([empty_id] * len(transition))
+
+        next_id = first_case
+        for case_id, start, stop in cases.runs():
+            chain_empty(range(next_id, case_id), start)
+
+            case = pairs[start:stop]
+            if current_state["cases"] > 0:
+                transition = self._build_transition(
+                    from_state=current_state,
+                    target_speed=self._first_speed(case),
+                )
+                rows += [start] * len(transition)
+                transitions += transition
+                transition_cases += [case_id] * len(transition)
+
+            for action, value in case:
+                self._update_state(current_state, action, value)
+            current_state["cases"] += 1
+            next_id = case_id + 1
+
+        if num_cases is not None:
+            chain_empty(range(next_id, first_case + num_cases), len(cases))
+
+        return cases.insert(rows, StepSequence(transitions, transition_cases))
+
     # ---------------------------------------------------------
     # STATE TRACKING
     # ---------------------------------------------------------
-    def _update_state(self, state: Dict, step: Dict):
-        action, params = self._unpack(step)
-
-        if action == "SET_SPEED":
-            v = params.get("value")
-            if v is not None:
-                state["speed"] = v
+    def _update_state(self, state: Dict, action, value):
+        if action == Action.SET_SPEED:
+            if value is not None:
+                state["speed"] = value
 
-        if action == "ACC_ON":
+        if action == Action.ACC_ON:
             state["acc_on"] = True
 
-        if action == "ACC_OFF":
+        if action == Action.ACC_OFF:
             state["acc_on"] = False
 
-        if action == "LANE_CHANGE_LEFT":
+        if action == Action.LANE_CHANGE_LEFT:
             state["lane"] = "LEFT"
 
-        if action == "LANE_CHANGE_RIGHT":
+        if action == Action.LANE_CHANGE_RIGHT:
             state["lane"] = "RIGHT"
 
-    def _unpack(self, step: Dict):
-        [(action, params)] = step.items()
-        return action, params or {}
-
     # ---------------------------------------------------------
     # TRANSITION LOGIC
     # ---------------------------------------------------------
     def _build_transition(
         self,
         from_state: Dict,
-        to_case: List[Dict],
-    ) -> List[Dict]:
+        target_speed,
+    ) -> List[Step]:
         """
         Build minimal steps to move from end of previous case
-        into the starting conditions of the next case.
+        into the starting conditions of the next case
+        (target_speed: its first SET_SPEED value).
         """
-        transition: List[Dict] = []
-
-        # Determine starting conditions of next case
-        target_speed = self._get_first_speed(to_case)
+        transition: List[Step] = []
 
         # 1) Speed alignment
         if target_speed is not None and from_state.get("speed") != target_speed:
-            transition.append({"SET_SPEED": {"value": target_speed}})
+            transition.append(make_step(Action.SET_SPEED, target_speed))
             from_state["speed"] = target_speed
 
         # 2) ACC alignment (simple version: ensure ACC is off before new case)
         if from_state.get("acc_on"):
-            transition.append({"ACC_OFF": {}})
+            transition.append(make_step(Action.ACC_OFF))
             from_state["acc_on"] = False
 
         # 3) Lane alignment (optional: here we keep it simple and do nothing)
 
         return transition
 
-    def _get_first_speed(self, case: List[Dict]):
-        for step in case:
-            action, params = self._unpack(step)
-            if action == "SET_SPEED":
-                return params.get("value")
+    def _get_first_speed(self, case: List[Step | Dict]):
+        return self._first_speed((step.action, step.value) for step in map(as_step, case))
+
+    def _first_speed(self, pairs: Iterable[Tuple]):
+        for action, value in pairs:
+            if action == Action.SET_SPEED:
+                return value
         return None
@@ -0,0 +1,123 @@
+# src/checkpoint/checkpoint.py
+
+import glob
+import json
+import os
+from typing import Any, Dict, List
+
+from src.pipeline.orchestrator import case_entry, case_record
+from src.utils.fileio import atomic_write_json
+
+
+class CheckpointStore:
+    """
+    Crash-safe checkpoints inside a run folder (reports/<run>/checkpoints):
+    - manifest.json: run inputs + completed stages
+    - suite.json: the effective case list (after --minimise)
+    - cases_<k>.json: validated case records, one file per batch
+    - report.json: assembled report
+    Every file is written atomically (temp file + rename).
+    """
+
+    def __init__(self, run_dir: str, batch_size: int = 256):
+        self.dir = os.path.join(run_dir, "checkpoints")
+        self.batch_size = max(1, batch_size)
+        self.manifest: Dict[str, Any] = {"stages": []}
+
+    # ---------------------------------------------------------
+    # MANIFEST
+    # ---------------------------------------------------------
+    def exists(self) -> bool:
+        return os.path.exists(self._path("manifest"))
+
+    def start(self, inputs: Dict[str, Any]):
+        """
+        Fresh run: record the inputs a resume must reproduce.
+        """
+        self._clear_payloads()
+        self.manifest = {"inputs": inputs, "batch_size": self.batch_size, "stages": []}
+        self._save_manifest()
+
+    def resume(self) -> Dict[str, Any]:
+        """
+        returns: the inputs recorded by the interrupted run
+        """
+        self.manifest = self._load("manifest")
+        self.batch_size = self.manifest["batch_size"]
+        return self.manifest["inputs"]
+
+    def is_done(self, stage: str) -> bool:
+        return stage in self.manifest["stages"]
+
+    def mark_done(self, stage: str):
+        if stage not in self.manifest["stages"]:
+            self.manifest["stages"].append(stage)
+            self._save_manifest()
+
+    def finish(self):
+        """
+        Run completed: drop the bulky payloads, keep the manifest so a
+        later --resume knows there is nothing left to do.
+        """
+        self._clear_payloads()
+        self.mark_done("complete")
+
+    # ---------------------------------------------------------
+    # STAGE PAYLOADS
+    # ---------------------------------------------------------
+    def save(self, name: str, data: Any):
+        atomic_write_json(self._path(name), data)
+
+    def load(self, name: str) -> Any:
+        return self._load(name)
+
+    def process_cases(self, orch, cases: List[Any]) -> List[Dict[str, Any]]:
+        """
+        NLP + Reasoner in checkpointed batches: batches completed by an
+        earlier attempt are loaded instead of recomputed.
+        """
+        records: List[Dict[str, Any]] = []
+        resumed = 0
+
+        for k, offset in enumerate(range(0, len(cases), self.batch_size)):
+            name = f"cases_{k:05d}"
+            if os.path.exists(self._path(name)):
+                records.extend(map(case_record, self._load(name)))
+                resumed += 1
+                continue
+
+            batch = cases[offset : offset + self.batch_size]
+            with orch.metrics.timer("nlp"):
+                batch_records = [
+                    orch.parse_case(offset + i, case) for i, case in enumerate(batch)
+                ]
+            with orch.metrics.timer("reasoner"):
+                for record in batch_records:
+                    orch.validate_case(record)
+
+            self.save(name, [case_entry(r) for r in batch_records])
+            records.extend(batch_records)
+
+        orch.metrics.inc("cases", len(cases))
+        if resumed:
+            print(f"[OK] Resumed {resumed} completed case batch(es) from checkpoints")
+
+        return records
+
+    # ---------------------------------------------------------
+    # INTERNAL HELPERS
+    # ---------------------------------------------------------
+    def _path(self, name: str) -> str:
+        return os.path.join(self.dir, f"{name}.json")
+
+    def _load(self, name: str) -> Any:
+        with open(self._path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _clear_payloads(self):
+        for path in glob.glob(os.path.join(self.dir, "*.json")):
+            if os.path.basename(path) != "manifest.json":
+                os.remove(path)
+
+    def _save_manifest(self):
+        atomic_write_json(self._path("manifest"), self.manifest, indent=4)
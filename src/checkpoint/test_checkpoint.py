@@ -0,0 +1,43 @@
+# src/checkpoint/test_checkpoint.py
+
+import os
+import tempfile
+
+from src.checkpoint.checkpoint import CheckpointStore
+from src.pipeline.orchestrator import Orchestrator
+
+
+def main():
+    orch = Orchestrator()
+
+    cases = [
+        "Start at 0, accelerate to 80, enable ACC.",
+        "Change to the left lane, then brake.",
+        "Accelerate to 120 and then reduce speed to 60.",
+        "Disable ACC and change to the right lane.",
+        "Drive at 50 and stop.",
+    ]
+
+    with tempfile.TemporaryDirectory() as run_dir:
+        store = CheckpointStore(run_dir, batch_size=2)
+        store.start({"file": "inline", "file_sha256": "-", "minimise": False})
+
+        # Simulate an attempt that died after the first batch
+        first = store.process_cases(orch, cases[:2])
+        print("FIRST ATTEMPT :", len(first), "cases,", sorted(os.listdir(store.dir)))
+
+        # Resume: batch 0 is loaded from disk, the remainder is computed
+        resumed = CheckpointStore(run_dir)
+        resumed.resume()
+        records = resumed.process_cases(orch, cases)
+        print("RESUMED RUN   :", [r["id"] for r in records])
+
+        report = orch.assemble_report(records)
+        print("REPORT SUMMARY:", report["summary"])
+
+        resumed.finish()
+        print("AFTER FINISH  :", sorted(os.listdir(resumed.dir)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# src/coverage/suite_minimizer.py
+
+import heapq
+from typing import Any, Dict, List, Tuple
+
+from src.pipeline.orchestrator import normalise_case
+from src.state_machine.state_machine import StateMachine
+from src.steps.step import Step, as_step
+
+
+# ---------------------------------------------------------
+# STATE ABSTRACTION
+# ---------------------------------------------------------
+def speed_band(speed) -> str:
+    """
+    Buckets a speed into the bands the rules care about:
+    standstill, below ACC_MIN_SPEED, legal range, above SPEED_MAX_LIMIT.
+    """
+    if speed is None or speed == 0:
+        return "0"
+    if speed < 30:
+        return "<30"
+    if speed <= 180:
+        return "30-180"
+    return ">180"
+
+
+def state_signature(state: Dict) -> str:
+    acc = "ACC_ON" if state["acc_on"] else "ACC_OFF"
+    return f"{speed_band(state['speed'])}/{acc}/{state['lane']}/{state['indicator']}"
+
+
+def steps_transitions(steps: List[Step | Dict]) -> List[str]:
+    """
+    Transitions covered by one validated case, executed from a fresh
+    StateMachine so cases stay independent of suite order.
+    """
+    sm = StateMachine()
+    transitions: List[str] = []
+    for step in steps:
+        step = as_step(step)
+        src = state_signature(sm.get_state())
+        ok, _ = sm.apply_step(step)
+        dst = state_signature(sm.get_state()) if ok else "REJECTED"
+        transitions.append(f"{src} --{step.action}--> {dst}")
+
+    return transitions
+
+
+def coverage_summary(case_ids: List[str], case_transitions: List[List[str]]) -> Dict:
+    """
+    Union coverage over a set of cases (e.g. merged shards).
+    """
+    names: Dict[str, None] = {}
+    for transitions in case_transitions:
+        names.update(dict.fromkeys(transitions))
+
+    return {
+        "total_cases": len(case_ids),
+        "total_transitions": len(names),
+        "transitions": list(names),
+        "case_coverage": {
+            cid: len(set(t)) for cid, t in zip(case_ids, case_transitions)
+        },
+    }
+
+
+# ---------------------------------------------------------
+# GREEDY SET COVER ON BITSETS
+# ---------------------------------------------------------
+def greedy_set_cover(masks: List[int]) -> List[int]:
+    """
+    masks: one integer bitset per case (bit i = transition i covered)
+    returns: indices of a near-minimal subset covering the union of all masks
+
+    Lazy greedy: gains only shrink as coverage grows, so heap keys
+    (-gain, index) are lower bounds of the current ones, and a re-evaluated
+    entry whose key still beats the heap top can be taken directly. Ties
+    are broken by the lowest case index to keep results deterministic.
+    """
+    uncovered = 0
+    for m in masks:
+        uncovered |= m
+
+    heap = [(-m.bit_count(), idx) for idx, m in enumerate(masks) if m]
+    heapq.heapify(heap)
+
+    selected: List[int] = []
+    while uncovered and heap:
+        _, idx = heapq.heappop(heap)
+        gain = (masks[idx] & uncovered).bit_count()
+        if gain == 0:
+            continue
+
+        # Compare whole keys: an equal gain at a lower index must win
+        if heap and (-gain, idx) > heap[0]:
+            heapq.heappush(heap, (-gain, idx))
+            continue
+
+        selected.append(idx)
+        uncovered &= ~masks[idx]
+
+    return selected
+
+
+class SuiteMinimizer:
+    """
+    Test-suite minimisation by transition coverage:
+    - Runs every case through NLP → Reasoner → StateMachine
+    - Encodes the transitions each case covers as an integer bitset
+    - Selects a near-minimal subset preserving total coverage
+    """
+
+    def __init__(self, nlp, reasoner):
+        # Reuse the already-loaded NLP + Reasoner (e.g. from an Orchestrator)
+        self.nlp = nlp
+        self.reasoner = reasoner
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def case_transitions(self, text: str) -> List[str]:
+        """
+        Transitions covered by a single case description.
+        """
+        raw = self.nlp.process_text(text)
+        validated, _ = self.reasoner.validate_and_enrich(raw)
+        return steps_transitions(validated)
+
+    def minimise(self, descriptions: List[Any]) -> Dict[str, Any]:
+        """
+        descriptions: test cases (strings OR {"id", "description"} dicts)
+        returns: selected cases plus a coverage summary
+        """
+        transition_ids: Dict[str, int] = {}
+        masks: List[int] = []
+        case_ids: List[str] = []
+
+        for idx, case in enumerate(descriptions):
+            case_id, text = normalise_case(idx, case)
+            case_ids.append(case_id)
+
+            mask = 0
+            for t in self.case_transitions(text):
+                bit = transition_ids.setdefault(t, len(transition_ids))
+                mask |= 1 << bit
+            masks.append(mask)
+
+        selected = sorted(greedy_set_cover(masks))
+
+        return {
+            "selected": [descriptions[i] for i in selected],
+            "summary": self._build_summary(case_ids, masks, selected, transition_ids),
+        }
+
+    # ---------------------------------------------------------
+    # INTERNAL HELPERS
+    # ---------------------------------------------------------
+    def _build_summary(
+        self,
+        case_ids: List[str],
+        masks: List[int],
+        selected: List[int],
+        transition_ids: Dict[str, int],
+    ) -> Dict[str, Any]:
+        covered = 0
+        for i in selected:
+            covered |= masks[i]
+
+        transitions: List[Tuple[int, str]] = sorted(
+            (bit, name) for name, bit in transition_ids.items()
+        )
+
+        return {
+            "total_cases": len(case_ids),
+            "selected_cases": len(selected),
+            "selected_ids": [case_ids[i] for i in selected],
+            "total_transitions": len(transition_ids),
+            "covered_transitions": covered.bit_count(),
+            "transitions": [name for _, name in transitions],
+            "case_coverage": {
+                case_ids[i]: masks[i].bit_count() for i in range(len(case_ids))
+            },
+        }
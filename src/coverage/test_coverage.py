@@ -0,0 +1,44 @@
+# src/coverage/test_coverage.py
+
+from src.coverage.suite_minimizer import SuiteMinimizer, greedy_set_cover
+from src.nlp.nlp_processor import NLPProcessor
+from src.reasoner.reasoner import Reasoner
+
+
+def main():
+    # Pure bitset set cover: case 2 alone covers cases 0 + 1
+    masks = [0b0011, 0b0100, 0b0111, 0b1000]
+    print("GREEDY COVER:", greedy_set_cover(masks))
+
+    # Equal gains go to the lowest case index, even when the other case's
+    # heap entry is stale (case 1 covered 2 bits before case 2 was taken)
+    assert greedy_set_cover([0b0001, 0b0011, 0b1110]) == [2, 0]
+
+    minimizer = SuiteMinimizer(NLPProcessor(), Reasoner())
+
+    descriptions = [
+        {"id": "t01", "description": "Accelerate to 80."},
+        {"id": "t02", "description": "Increase speed to 80."},
+        {"id": "t03", "description": "Accelerate to 80 and enable ACC."},
+        {"id": "t04", "description": "Change to the left lane."},
+        {"id": "t05", "description": "Accelerate to 80, enable ACC, then brake."},
+    ]
+
+    result = minimizer.minimise(descriptions)
+    summary = result["summary"]
+
+    print("\n===== SELECTED CASES =====\n")
+    for case in result["selected"]:
+        print(case)
+
+    print("\n===== COVERAGE =====\n")
+    print(
+        f"{summary['selected_cases']}/{summary['total_cases']} cases, "
+        f"{summary['covered_transitions']}/{summary['total_transitions']} transitions"
+    )
+    for t in summary["transitions"]:
+        print("  ", t)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# src/diff/run_diff.py
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List
+
+from src.artifacts.store import has_run_file, open_run_text
+
+CASE_ARTIFACTS = ("steps_validated", "steps_raw")
+
+
+# ---------------------------------------------------------
+# LOADING
+# ---------------------------------------------------------
+def reports_path(run: str) -> str:
+    """
+    Accepts reports/<run>, reports/<run>/reports or a bare run name.
+    """
+    for path in (os.path.join(run, "reports"), run, os.path.join("reports", run, "reports")):
+        if os.path.isdir(path) and any(
+            has_run_file(path, f"steps_validated{ext}") for ext in (".json", ".jsonl")
+        ):
+            return path
+    raise FileNotFoundError(f"{run}: no steps_validated.json / .jsonl found")
+
+
+def load_artifact(reports_dir: str, name: str) -> List[Any] | None:
+    """
+    A JSON or JSON Lines artifact, read from the run folder or, for runs
+    moved into the artifact store, from its blobs.
+    """
+    if has_run_file(reports_dir, f"{name}.json"):
+        with open_run_text(reports_dir, f"{name}.json") as f:
+            return json.load(f)
+    if has_run_file(reports_dir, f"{name}.jsonl"):
+        with open_run_text(reports_dir, f"{name}.jsonl") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return None
+
+
+def canonical(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+def case_key(case_id: str, seen: Counter) -> str:
+    """
+    Case ids are unique in well-formed suites; repeats get #2, #3, ...
+    """
+    seen[case_id] += 1
+    return case_id if seen[case_id] == 1 else f"{case_id}#{seen[case_id]}"
+
+
+class RunIndex:
+    """
+    Per-case step sequences of one run, keyed by case id and indexed by a
+    sha256 content hash so identical cases compare in O(1).
+    """
+
+    def __init__(self, reports_dir: str, artifact: str = "steps_validated"):
+        self.path = reports_dir
+        steps = load_artifact(reports_dir, artifact)
+        if steps is None:
+            raise FileNotFoundError(f"{reports_dir}: no {artifact} artifact")
+        # Older runs have no cases artifact: fall back to positional ids
+        cases = load_artifact(reports_dir, "cases") or [
+            {"id": f"case_{i+1}", "text": ""} for i in range(len(steps))
+        ]
+        if len(steps) != len(cases):
+            raise ValueError(f"{reports_dir}: {len(cases)} cases but {len(steps)} {artifact} entries")
+
+        issues = load_artifact(reports_dir, "issues") or []
+
+        # Slice the flat issues list per case when counts were recorded
+        self.per_case_issues = all("num_issues" in c for c in cases)
+        self.run_issues = issues
+
+        self.cases: Dict[str, Dict[str, Any]] = {}
+        seen: Counter = Counter()
+        offset = 0
+        for case, case_steps in zip(cases, steps):
+            case_issues: List[Dict] = []
+            if self.per_case_issues:
+                case_issues = issues[offset:offset + case["num_issues"]]
+                offset += case["num_issues"]
+
+            digest = hashlib.sha256(canonical([case_steps, case_issues]).encode("utf-8")).hexdigest()
+            self.cases[case_key(case["id"], seen)] = {
+                "text": case["text"],
+                "digest": digest,
+                "steps": case_steps,
+                "issues": case_issues,
+            }
+
+    def __len__(self):
+        return len(self.cases)
+
+
+# ---------------------------------------------------------
+# DIFFING
+# ---------------------------------------------------------
+def diff_steps(old_steps: List[Dict], new_steps: List[Dict]) -> Dict[str, List]:
+    """
+    Step-level diff: a replaced block pairs up as modified steps; any
+    surplus on either side counts as removed / added.
+    """
+    old, new = [canonical(s) for s in old_steps], [canonical(s) for s in new_steps]
+    added, removed, modified = [], [], []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        pairs = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for k in range(pairs):
+            modified.append({"index": i1 + k + 1, "old": json.loads(old[i1 + k]), "new": json.loads(new[j1 + k])})
+        removed.extend({"index": i + 1, "step": json.loads(old[i])} for i in range(i1 + pairs, i2))
+        added.extend({"index": j + 1, "step": json.loads(new[j])} for j in range(j1 + pairs, j2))
+    return {"added": added, "removed": removed, "modified": modified}
+
+
+def diff_issues(old: List[Dict], new: List[Dict]) -> Dict[str, List]:
+    old_count = Counter(canonical(i) for i in old)
+    new_count = Counter(canonical(i) for i in new)
+    return {
+        "added": [json.loads(i) for i in (new_count - old_count).elements()],
+        "removed": [json.loads(i) for i in (old_count - new_count).elements()],
+    }
+
+
+def diff_runs(old: RunIndex, new: RunIndex) -> Dict[str, Any]:
+    """
+    Compares two runs case by case. Only cases whose digests differ are
+    sequence-diffed.
+    """
+    identical = 0
+    changed: List[Dict[str, Any]] = []
+    totals = Counter()
+
+    for key, new_case in new.cases.items():
+        old_case = old.cases.get(key)
+        if old_case is None:
+            continue
+        if old_case["digest"] == new_case["digest"]:
+            identical += 1
+            continue
+
+        steps = diff_steps(old_case["steps"], new_case["steps"])
+        issues = diff_issues(old_case["issues"], new_case["issues"])
+        for kind in ("added", "removed", "modified"):
+            totals[f"steps_{kind}"] += len(steps[kind])
+        for kind in ("added", "removed"):
+            totals[f"issues_{kind}"] += len(issues[kind])
+        changed.append({"id": key, "text": new_case["text"], "steps": steps, "issues": issues})
+
+    added_cases = [k for k in new.cases if k not in old.cases]
+    removed_cases = [k for k in old.cases if k not in new.cases]
+
+    # Runs written before per-case issue counts: compare issues run-wide
+    if not (old.per_case_issues and new.per_case_issues):
+        issues = diff_issues(old.run_issues, new.run_issues)
+        totals["issues_added"], totals["issues_removed"] = len(issues["added"]), len(issues["removed"])
+        run_issues = issues
+    else:
+        for key in added_cases:
+            totals["issues_added"] += len(new.cases[key]["issues"])
+        for key in removed_cases:
+            totals["issues_removed"] += len(old.cases[key]["issues"])
+        run_issues = None
+
+    summary = {
+        "old": old.path,
+        "new": new.path,
+        "cases_old": len(old),
+        "cases_new": len(new),
+        "identical": identical,
+        "changed": len(changed),
+        "cases_added": len(added_cases),
+        "cases_removed": len(removed_cases),
+        "steps_added": totals["steps_added"],
+        "steps_removed": totals["steps_removed"],
+        "steps_modified": totals["steps_modified"],
+        "issues_added": totals["issues_added"],
+        "issues_removed": totals["issues_removed"],
+    }
+    return {
+        "summary": summary,
+        "changed": changed,
+        "cases_added": added_cases,
+        "cases_removed": removed_cases,
+        "run_issues": run_issues,
+    }
+
+
+# ---------------------------------------------------------
+# OUTPUT
+# ---------------------------------------------------------
+def format_step(step: Dict) -> str:
+    [(action, params)] = step.items()
+    return f"{action} {params}" if params else action
+
+
+def format_diff(result: Dict[str, Any], max_cases: int = 20) -> str:
+    s = result["summary"]
+    lines = [
+        "# Run Diff",
+        "",
+        f"- Old: `{s['old']}` ({s['cases_old']} cases)",
+        f"- New: `{s['new']}` ({s['cases_new']} cases)",
+        f"- Identical cases: {s['identical']}",
+        f"- Changed cases: {s['changed']}",
+        f"- Added / removed cases: {s['cases_added']} / {s['cases_removed']}",
+        f"- Steps: +{s['steps_added']} / -{s['steps_removed']} / ~{s['steps_modified']}",
+        f"- Issues: +{s['issues_added']} / -{s['issues_removed']}",
+        "",
+    ]
+
+    for case in result["changed"][:max_cases]:
+        lines.append(f"## {case['id']}: {case['text']}")
+        for d in case["steps"]["removed"]:
+            lines.append(f"- [{d['index']}] {format_step(d['step'])}")
+        for d in case["steps"]["added"]:
+            lines.append(f"+ [{d['index']}] {format_step(d['step'])}")
+        for d in case["steps"]["modified"]:
+            lines.append(f"~ [{d['index']}] {format_step(d['old'])} → {format_step(d['new'])}")
+        for issue in case["issues"]["removed"]:
+            lines.append(f"- issue {issue.get('type', '').upper()}: {issue.get('message', '')}")
+        for issue in case["issues"]["added"]:
+            lines.append(f"+ issue {issue.get('type', '').upper()}: {issue.get('message', '')}")
+        lines.append("")
+
+    hidden = len(result["changed"]) - max_cases
+    if hidden > 0:
+        lines.append(f"... {hidden} more changed cases (see --json)")
+        lines.append("")
+
+    for title, keys in (("Added cases", result["cases_added"]), ("Removed cases", result["cases_removed"])):
+        if keys:
+            lines.append(f"## {title}")
+            lines.extend(f"- {k}" for k in keys[:max_cases])
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-case diff of two generated campaigns")
+    parser.add_argument("old", help="Baseline run (reports/<run> or its reports/ folder)")
+    parser.add_argument("new", help="Run to compare against the baseline")
+    parser.add_argument(
+        "--artifact",
+        choices=CASE_ARTIFACTS,
+        default="steps_validated",
+        help="Per-case step sequence to compare",
+    )
+    parser.add_argument("--max_cases", type=int, default=20, help="Changed cases to print")
+    parser.add_argument("--json", default=None, help="Write the full diff as JSON here")
+    args = parser.parse_args()
+
+    old = RunIndex(reports_path(args.old), args.artifact)
+    new = RunIndex(reports_path(args.new), args.artifact)
+    result = diff_runs(old, new)
+
+    print(format_diff(result, args.max_cases))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+        print(f"[OK] Saved diff → {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# src/diff/test_run_diff.py
+
+import copy
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.diff.run_diff import RunIndex, diff_runs, format_diff
+
+ACTIONS = ["ACC_ON", "ACC_OFF", "LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT", "APPLY_BRAKE"]
+
+
+def make_run(num_cases: int = 10_000, seed: int = 3):
+    """Synthetic campaign artifacts: cases + per-case validated steps + issues."""
+    rng = random.Random(seed)
+    cases, steps, issues = [], [], []
+    for i in range(num_cases):
+        case_steps = [{"SET_SPEED": {"value": rng.randrange(30, 181, 10)}}]
+        case_steps += [{rng.choice(ACTIONS): {}} for _ in range(rng.randint(2, 8))]
+        case_issues = []
+        if i % 10 == 0:
+            case_issues.append({"type": "warning", "message": f"Synthetic warning for case {i + 1}"})
+        cases.append({"id": f"t{i + 1:05d}", "text": f"Synthetic case {i + 1}", "num_issues": len(case_issues)})
+        steps.append(case_steps)
+        issues.extend(case_issues)
+    return cases, steps, issues
+
+
+def write_run(folder: str, cases, steps, issues):
+    os.makedirs(folder, exist_ok=True)
+    for name, data in (("cases", cases), ("steps_validated", steps), ("issues", issues)):
+        with open(os.path.join(folder, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+
+def main():
+    cases, steps, issues = make_run()
+
+    # "Template change": 1% of cases get a different speed, an extra step
+    # or lose their warning; one case (with a warning) is dropped, one is new
+    new_cases, new_steps = copy.deepcopy(cases), copy.deepcopy(steps)
+    for i in range(0, len(new_steps), 100):
+        new_steps[i][0]["SET_SPEED"]["value"] += 10
+        new_steps[i + 1].append({"APPLY_BRAKE": {}})
+    new_cases[200]["num_issues"] = 0
+    dropped = {"Synthetic warning for case 201", "Synthetic warning for case 11"}
+    new_issues = [x for x in issues if x["message"] not in dropped]
+    del new_cases[10], new_steps[10]
+    new_cases.append({"id": "t_new", "text": "Brand new case", "num_issues": 0})
+    new_steps.append([{"ACC_ON": {}}])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_run(os.path.join(tmp, "old"), cases, steps, issues)
+        write_run(os.path.join(tmp, "new"), new_cases, new_steps, new_issues)
+
+        start = time.perf_counter()
+        old, new = RunIndex(os.path.join(tmp, "old")), RunIndex(os.path.join(tmp, "new"))
+        index_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = diff_runs(old, new)
+        diff_s = time.perf_counter() - start
+
+    print(format_diff(result, max_cases=3))
+    print(f"\nIndex: {index_s:.2f} s for 2 × {len(old)} cases, diff: {diff_s * 1000:.1f} ms")
+
+    s = result["summary"]
+    assert s["changed"] == 200 and s["identical"] == len(old) - 201
+    assert (s["steps_modified"], s["steps_added"], s["steps_removed"]) == (100, 100, 0)
+    assert s["cases_added"] == 1 and s["cases_removed"] == 1
+    assert (s["issues_added"], s["issues_removed"]) == (0, 2)
+    print("[OK] Diff summary matches the injected changes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+# src/history/run_history.py
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.artifacts.store import has_run_file
+from src.diff.run_diff import load_artifact
+
+DEFAULT_DB = ".avtc_cache/history.sqlite"
+SCHEMA_VERSION = 1
+
+# Artifacts whose size + mtime decide whether a run must be re-ingested
+# ("manifest" covers runs moved into the artifact store)
+RUN_ARTIFACTS = ("cases", "steps_validated", "steps_optimized", "issues", "manifest")
+
+RUN_NAME_RE = re.compile(r"run_(\d{4}-\d{2}-\d{2})_(\d{2})-(\d{2})-(\d{2})$")
+RULE_RE = re.compile(r"violates ([A-Z][A-Z0-9_]+)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id       INTEGER PRIMARY KEY,
+    name         TEXT NOT NULL UNIQUE,
+    path         TEXT NOT NULL,
+    started_at   TEXT NOT NULL,
+    signature    TEXT NOT NULL,
+    num_cases    INTEGER NOT NULL,
+    num_steps    INTEGER NOT NULL,
+    num_errors   INTEGER NOT NULL,
+    num_warnings INTEGER NOT NULL,
+    status       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cases (
+    run_id     INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    case_idx   INTEGER NOT NULL,
+    case_id    TEXT NOT NULL,
+    text       TEXT NOT NULL,
+    num_issues INTEGER,
+    PRIMARY KEY (run_id, case_idx)
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id   INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    stage    TEXT NOT NULL,     -- "validated" (per case) | "optimized" (timeline)
+    case_idx INTEGER,           -- NULL for the optimized timeline
+    pos      INTEGER NOT NULL,
+    action   TEXT NOT NULL,
+    value    INTEGER,
+    params   TEXT               -- JSON, only when params are not {} / {"value": n}
+);
+CREATE TABLE IF NOT EXISTS issues (
+    run_id   INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    case_idx INTEGER,           -- NULL when the run predates per-case issue counts
+    type     TEXT,
+    rule     TEXT,
+    message  TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS cases_case_id ON cases(case_id);
+CREATE INDEX IF NOT EXISTS steps_run ON steps(run_id, stage, case_idx);
+CREATE INDEX IF NOT EXISTS steps_action ON steps(action, run_id);
+CREATE INDEX IF NOT EXISTS issues_run ON issues(run_id);
+CREATE INDEX IF NOT EXISTS issues_rule ON issues(rule, type, run_id);
+"""
+
+
+# ---------------------------------------------------------
+# RUN DISCOVERY
+# ---------------------------------------------------------
+def run_reports_dir(run_dir: str) -> str | None:
+    """
+    reports/<run>/reports (current layout) or reports/<run> (older runs).
+    """
+    for path in (os.path.join(run_dir, "reports"), run_dir):
+        for ext in (".json", ".jsonl"):
+            if has_run_file(path, f"steps_validated{ext}"):
+                return path
+    return None
+
+
+def run_signature(reports_dir: str) -> str:
+    parts = []
+    for name in RUN_ARTIFACTS:
+        for ext in (".json", ".jsonl"):
+            path = os.path.join(reports_dir, name + ext)
+            if os.path.exists(path):
+                st = os.stat(path)
+                parts.append(f"{name}{ext}:{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+
+def run_started_at(name: str, reports_dir: str) -> str:
+    """
+    Timestamp from run_YYYY-mm-dd_HH-MM-SS folder names, else folder mtime.
+    """
+    m = RUN_NAME_RE.match(name)
+    if m:
+        return f"{m.group(1)}T{m.group(2)}:{m.group(3)}:{m.group(4)}"
+    return datetime.fromtimestamp(os.path.getmtime(reports_dir)).isoformat(timespec="seconds")
+
+
+def issue_rule(message: str) -> str | None:
+    m = RULE_RE.search(message or "")
+    return m.group(1) if m else None
+
+
+def step_row(step: Dict) -> Tuple[str, int | None, str | None]:
+    [(action, params)] = step.items()
+    if not params:
+        return action, None, None
+    if isinstance(params, dict) and len(params) == 1 and type(params.get("value")) is int:
+        return action, params["value"], None
+    return action, None, json.dumps(params)
+
+
+# ---------------------------------------------------------
+# DATABASE
+# ---------------------------------------------------------
+class RunHistory:
+    """
+    SQLite index over reports/<run> folders: runs, cases, steps, issues.
+    Ingest is incremental: runs already indexed with an unchanged artifact
+    signature are skipped without opening their JSON.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{db_path}: schema v{version}, expected v{SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------------------------------------------------------
+    # INGEST
+    # ---------------------------------------------------------
+    def ingest(self, reports_root: str = "reports", force: bool = False) -> Dict[str, List[str]]:
+        """
+        Indexes new (or re-written) run folders under reports_root.
+        Returns {"ingested": [...], "skipped": [...]}.
+        """
+        known = {
+            row["name"]: row["signature"]
+            for row in self.conn.execute("SELECT name, signature FROM runs")
+        }
+        result: Dict[str, List[str]] = {"ingested": [], "skipped": []}
+
+        for name in sorted(os.listdir(reports_root)):
+            reports_dir = run_reports_dir(os.path.join(reports_root, name))
+            if reports_dir is None:
+                continue
+            signature = run_signature(reports_dir)
+            if not force and known.get(name) == signature:
+                result["skipped"].append(name)
+                continue
+            with self.conn:
+                self.conn.execute("DELETE FROM runs WHERE name = ?", (name,))
+                self._ingest_run(name, reports_dir, signature)
+            result["ingested"].append(name)
+
+        return result
+
+    def _ingest_run(self, name: str, reports_dir: str, signature: str):
+        validated = load_artifact(reports_dir, "steps_validated") or []
+        optimized = load_artifact(reports_dir, "steps_optimized") or []
+        issues = load_artifact(reports_dir, "issues") or []
+        cases = load_artifact(reports_dir, "cases") or [
+            {"id": f"case_{i+1}", "text": ""} for i in range(len(validated))
+        ]
+
+        errors = sum(1 for i in issues if i.get("type") == "error")
+        warnings = sum(1 for i in issues if i.get("type") == "warning")
+        run_id = self.conn.execute(
+            "INSERT INTO runs (name, path, started_at, signature, num_cases, num_steps,"
+            " num_errors, num_warnings, status) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                name,
+                reports_dir,
+                run_started_at(name, reports_dir),
+                signature,
+                len(cases),
+                len(optimized),
+                errors,
+                warnings,
+                "FAILED" if errors else "OK",
+            ),
+        ).lastrowid
+
+        self.conn.executemany(
+            "INSERT INTO cases VALUES (?, ?, ?, ?, ?)",
+            (
+                (run_id, idx, c["id"], c.get("text", ""), c.get("num_issues"))
+                for idx, c in enumerate(cases)
+            ),
+        )
+        self.conn.executemany(
+            "INSERT INTO steps VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._step_rows(run_id, validated, optimized),
+        )
+        self.conn.executemany(
+            "INSERT INTO issues VALUES (?, ?, ?, ?, ?)",
+            self._issue_rows(run_id, cases, issues),
+        )
+
+    @staticmethod
+    def _step_rows(run_id: int, validated: List[List[Dict]], optimized: List[Dict]) -> Iterator[Tuple]:
+        for case_idx, case_steps in enumerate(validated):
+            for pos, step in enumerate(case_steps):
+                yield (run_id, "validated", case_idx, pos, *step_row(step))
+        for pos, step in enumerate(optimized):
+            if "action" in step:
+                # Formatted timeline entry: {"index", "action", "params"}
+                step = {step["action"]: step.get("params", {})}
+            yield (run_id, "optimized", None, pos, *step_row(step))
+
+    @staticmethod
+    def _issue_rows(run_id: int, cases: List[Dict], issues: List[Dict]) -> Iterator[Tuple]:
+        # Per-case issue counts let the flat issues list be attributed to cases
+        owners: List[int | None] = [None] * len(issues)
+        if cases and all("num_issues" in c for c in cases):
+            owners = [idx for idx, c in enumerate(cases) for _ in range(c["num_issues"])]
+        for owner, issue in zip(owners, issues):
+            message = issue.get("message", "")
+            yield (run_id, owner, issue.get("type"), issue_rule(message), message)
+
+    # ---------------------------------------------------------
+    # QUERIES
+    # ---------------------------------------------------------
+    def query(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def runs(self, since: str | None = None, until: str | None = None) -> List[Dict[str, Any]]:
+        clauses, params = _date_clauses(since, until, "started_at")
+        return self.query(
+            "SELECT name, started_at, num_cases, num_steps, num_errors, num_warnings, status"
+            f" FROM runs {_where(clauses)} ORDER BY started_at",
+            params,
+        )
+
+    def issues(
+        self,
+        rule: str | None = None,
+        issue_type: str | None = None,
+        match: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs with matching issues, e.g. rule="ACC_MIN_SPEED", issue_type="error".
+        """
+        clauses, params = _date_clauses(since, until, "r.started_at")
+        if rule:
+            clauses.append("i.rule = ?")
+            params += (rule,)
+        if issue_type:
+            clauses.append("i.type = ?")
+            params += (issue_type,)
+        if match:
+            clauses.append("i.message LIKE ?")
+            params += (f"%{match}%",)
+        return self.query(
+            "SELECT r.name, r.started_at, COUNT(*) AS issues,"
+            " COUNT(DISTINCT i.case_idx) AS cases"
+            f" FROM issues i JOIN runs r USING (run_id) {_where(clauses)}"
+            " GROUP BY r.run_id ORDER BY r.started_at",
+            params,
+        )
+
+    def actions(self, run: str | None = None, stage: str = "optimized") -> List[Dict[str, Any]]:
+        """
+        Action frequencies across all runs (or one run).
+        """
+        sql = "SELECT s.action, COUNT(*) AS steps, COUNT(DISTINCT s.run_id) AS runs FROM steps s"
+        params: Tuple = (stage,)
+        if run:
+            sql += " JOIN runs r USING (run_id) WHERE s.stage = ? AND r.name = ?"
+            params += (run,)
+        else:
+            sql += " WHERE s.stage = ?"
+        return self.query(sql + " GROUP BY s.action ORDER BY steps DESC", params)
+
+    def case_history(self, case_id: str) -> List[Dict[str, Any]]:
+        """
+        The validated steps generated for one case id in every run.
+        """
+        rows = self.query(
+            "SELECT r.name, r.started_at, c.text, c.case_idx, r.run_id"
+            " FROM cases c JOIN runs r USING (run_id) WHERE c.case_id = ?"
+            " ORDER BY r.started_at",
+            (case_id,),
+        )
+        for row in rows:
+            steps = self.conn.execute(
+                "SELECT action, value, params FROM steps"
+                " WHERE run_id = ? AND stage = 'validated' AND case_idx = ? ORDER BY pos",
+                (row.pop("run_id"), row.pop("case_idx")),
+            )
+            row["steps"] = [_format_step(*s) for s in steps]
+        return rows
+
+
+def _date_clauses(since: str | None, until: str | None, column: str) -> Tuple[List[str], Tuple]:
+    clauses, params = [], ()
+    if since:
+        clauses.append(f"{column} >= ?")
+        params += (since,)
+    if until:
+        clauses.append(f"{column} < ?")
+        params += (until,)
+    return clauses, params
+
+
+def _where(clauses: List[str]) -> str:
+    return f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def _format_step(action: str, value: int | None, params: str | None) -> str:
+    if value is not None:
+        return f"{action}({value})"
+    return f"{action}({params})" if params else action
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+def print_rows(rows: List[Dict[str, Any]]):
+    if not rows:
+        print("(no rows)")
+        return
+    columns = list(rows[0])
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) for c in columns]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(str(r[c]).ljust(w) for c, w in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite index over historical runs")
+    parser.add_argument("--db", default=DEFAULT_DB, help="History database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ingest", help="Index new run folders")
+    p.add_argument("--reports", default="reports", help="Folder holding run folders")
+    p.add_argument("--force", action="store_true", help="Re-ingest every run")
+
+    p = sub.add_parser("runs", help="List indexed runs")
+    p.add_argument("--since", default=None, help="ISO date, e.g. 2026-09-01")
+    p.add_argument("--until", default=None)
+
+    p = sub.add_parser("issues", help="Runs that raised matching issues")
+    p.add_argument("--rule", default=None, help="e.g. ACC_MIN_SPEED, SPEED_MAX_LIMIT")
+    p.add_argument("--type", default=None, choices=["error", "warning"])
+    p.add_argument("--match", default=None, help="Substring of the issue message")
+    p.add_argument("--since", default=None)
+    p.add_argument("--until", default=None)
+
+    p = sub.add_parser("actions", help="Action frequencies")
+    p.add_argument("--run", default=None, help="Restrict to one run name")
+    p.add_argument("--stage", default="optimized", choices=["optimized", "validated"])
+
+    p = sub.add_parser("case", help="Steps generated for one case id across runs")
+    p.add_argument("case_id")
+
+    p = sub.add_parser("sql", help="Run a read-only SQL query")
+    p.add_argument("sql")
+
+    args = parser.parse_args()
+
+    with RunHistory(args.db) as history:
+        if args.command == "ingest":
+            result = history.ingest(args.reports, force=args.force)
+            for name in result["ingested"]:
+                print(f"[OK] Ingested {name}")
+            print(f"\n{len(result['ingested'])} ingested, {len(result['skipped'])} unchanged → {args.db}")
+        elif args.command == "runs":
+            print_rows(history.runs(args.since, args.until))
+        elif args.command == "issues":
+            print_rows(history.issues(args.rule, args.type, args.match, args.since, args.until))
+        elif args.command == "actions":
+            print_rows(history.actions(args.run, args.stage))
+        elif args.command == "case":
+            for row in history.case_history(args.case_id):
+                print(f"{row['started_at']}  {row['name']}: {' → '.join(row['steps'])}")
+        elif args.command == "sql":
+            history.conn.execute("PRAGMA query_only=ON")
+            print_rows(history.query(args.sql))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# src/history/test_history.py
+
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.history.run_history import RunHistory
+
+ACTIONS = ["ACC_OFF", "LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT", "APPLY_BRAKE"]
+
+
+def write_run(root: str, name: str, num_cases: int, acc_errors: int, seed: int):
+    """Synthetic run folder in the current reports/<run>/reports layout."""
+    rng = random.Random(seed)
+    cases, validated, issues = [], [], []
+    for i in range(num_cases):
+        speed = rng.randrange(30, 181, 10)
+        steps = [{"SET_SPEED": {"value": speed}}] + [{rng.choice(ACTIONS): {}} for _ in range(3)]
+        case_issues = []
+        if i < acc_errors:
+            steps.insert(0, {"ACC_ON": {}})
+            case_issues.append({
+                "type": "error",
+                "message": "ACC_ON at 0 km/h violates ACC_MIN_SPEED (>= 30 km/h).",
+            })
+        cases.append({"id": f"t{i + 1:04d}", "text": f"Case {i + 1}", "num_issues": len(case_issues)})
+        validated.append(steps)
+        issues.extend(case_issues)
+
+    optimized = [
+        {"index": n, "action": a, "params": p}
+        for n, (a, p) in enumerate((kv for case in validated for s in case for kv in s.items()), 1)
+    ]
+
+    folder = os.path.join(root, name, "reports")
+    os.makedirs(folder)
+    artifacts = {"cases": cases, "steps_validated": validated, "steps_optimized": optimized, "issues": issues}
+    for artifact, data in artifacts.items():
+        with open(os.path.join(folder, f"{artifact}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "reports")
+        for day in range(1, 21):
+            # Runs in September raise ACC_MIN_SPEED errors, August runs do not
+            month = "08" if day <= 10 else "09"
+            name = f"run_2026-{month}-{day:02d}_09-00-00"
+            write_run(root, name, num_cases=2000, acc_errors=0 if month == "08" else day, seed=day)
+
+        db = os.path.join(tmp, "history.sqlite")
+        with RunHistory(db) as history:
+            start = time.perf_counter()
+            first = history.ingest(root)
+            full_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            again = history.ingest(root)
+            noop_s = time.perf_counter() - start
+
+            write_run(root, "nightly", num_cases=500, acc_errors=3, seed=99)
+            start = time.perf_counter()
+            delta = history.ingest(root)
+            delta_s = time.perf_counter() - start
+
+            print("\n===== INGEST =====\n")
+            print(f"First ingest : {len(first['ingested'])} runs in {full_s:.2f} s")
+            print(f"Re-ingest    : {len(again['ingested'])} runs in {noop_s * 1000:.1f} ms")
+            print(f"New run      : {delta['ingested']} in {delta_s:.2f} s")
+            assert len(first["ingested"]) == 20 and not again["ingested"]
+            assert delta["ingested"] == ["nightly"]
+
+            start = time.perf_counter()
+            rows = history.issues(rule="ACC_MIN_SPEED", issue_type="error", since="2026-09-01", until="2026-10-01")
+            query_ms = (time.perf_counter() - start) * 1000
+
+            print("\n===== ACC_MIN_SPEED ERRORS, SEPTEMBER =====\n")
+            for row in rows:
+                print(row)
+            print(f"\nQuery: {query_ms:.1f} ms")
+            assert [r["name"] for r in rows] == [f"run_2026-09-{d}_09-00-00" for d in range(11, 21)]
+            assert all(r["issues"] == r["cases"] == int(r["name"][12:14]) for r in rows)
+
+            print("\n===== ACTIONS (nightly) =====\n")
+            for row in history.actions(run="nightly"):
+                print(row)
+
+            print("\n===== CASE t0001 ACROSS RUNS =====\n")
+            for row in history.case_history("t0001")[:3]:
+                print(row["name"], " → ".join(row["steps"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# src/metrics/instrumentation.py
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Tuple
+
+# Shared no-op timer: a disabled Metrics hands this out instead of allocating
+_NULL_TIMER = nullcontext()
+
+# Upper bounds (seconds) for latency histograms
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class _Timer:
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        if self.metrics.profiler is not None:
+            self.metrics.profiler.start(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.record_time(self.name, time.perf_counter() - self.start)
+        if self.metrics.profiler is not None:
+            self.metrics.profiler.stop(self.name)
+        return False
+
+
+class Metrics:
+    """
+    Lightweight run instrumentation:
+    - Context-manager timers per stage (total seconds, calls, min, max)
+    - Monotonic counters
+    - Fixed-bucket histograms (e.g. per-case latency)
+    - Optional StageProfiler hooked into every stage timer
+    A disabled instance (without profiler) turns every call into a no-op.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        profiler=None,
+    ):
+        self.enabled = enabled
+        self.profiler = profiler
+        self.buckets = buckets
+        self.timers: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.histograms: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # RECORDING API
+    # ---------------------------------------------------------
+    def timer(self, name: str):
+        if not self.enabled and self.profiler is None:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record_time(self, name: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            t = self.timers.get(name)
+            if t is None:
+                t = self.timers[name] = {
+                    "seconds": 0.0,
+                    "calls": 0,
+                    "min": seconds,
+                    "max": seconds,
+                }
+            t["seconds"] += seconds
+            t["calls"] += 1
+            t["min"] = min(t["min"], seconds)
+            t["max"] = max(t["max"], seconds)
+
+    def inc(self, name: str, n: float = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, value: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            h = self.histograms.get(name)
+            if h is None:
+                h = self.histograms[name] = {
+                    # last slot is the +Inf bucket
+                    "counts": [0] * (len(self.buckets) + 1),
+                    "sum": 0.0,
+                    "count": 0,
+                }
+            h["counts"][bisect.bisect_left(self.buckets, value)] += 1
+            h["sum"] += value
+            h["count"] += 1
+
+    # ---------------------------------------------------------
+    # EXPORT
+    # ---------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        histograms = {}
+        for name, h in self.histograms.items():
+            histograms[name] = {
+                "buckets": {
+                    str(le): c for le, c in zip(list(self.buckets) + ["+Inf"], h["counts"])
+                },
+                "sum": h["sum"],
+                "count": h["count"],
+            }
+
+        return {
+            "timers": self.timers,
+            "counters": self.counters,
+            "histograms": histograms,
+        }
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        if self.timers:
+            lines.append("# TYPE avtc_stage_seconds_total counter")
+            for name, t in self.timers.items():
+                lines.append(f'avtc_stage_seconds_total{{stage="{name}"}} {t["seconds"]}')
+            lines.append("# TYPE avtc_stage_calls_total counter")
+            for name, t in self.timers.items():
+                lines.append(f'avtc_stage_calls_total{{stage="{name}"}} {t["calls"]}')
+
+        for name, value in self.counters.items():
+            metric = f"avtc_{_prom_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for name, h in self.histograms.items():
+            metric = f"avtc_{_prom_name(name)}"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for le, c in zip(list(self.buckets) + ["+Inf"], h["counts"]):
+                cumulative += c
+                lines.append(f'{metric}_bucket{{le="{le}"}} {cumulative}')
+            lines.append(f"{metric}_sum {h['sum']}")
+            lines.append(f"{metric}_count {h['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, out_dir: str):
+        """
+        Writes metrics.json + metrics.prom (Prometheus text format) into out_dir.
+        """
+        if not self.enabled:
+            return
+
+        json_path = os.path.join(out_dir, "metrics.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+        prom_path = os.path.join(out_dir, "metrics.prom")
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+        print(f"[OK] Saved metrics → {json_path}, {prom_path}")
+
+
+def _prom_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
@@ -0,0 +1,240 @@
+# src/metrics/profiling.py
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Tuple
+
+# Collapsed stacks: deeper paths are folded into their ancestor
+MAX_STACK_DEPTH = 64
+TOP_ALLOCATIONS = 15
+
+
+class StageProfiler:
+    """
+    Per-stage profiler driven by the Metrics stage timers:
+    - cpu: one cProfile per stage → <stage>.pstats + <stage>.collapsed
+           (flamegraph.pl / speedscope compatible), plus pipeline-wide files
+    - mem: tracemalloc peak, net growth and top allocation sites per stage
+    Stages nest per thread. Only one cProfile can be active per process,
+    so in cpu mode stages that other threads run meanwhile are timed but
+    not profiled. tracemalloc is process-wide, so a mem peak includes
+    whatever other threads allocated meanwhile.
+    """
+
+    MODES = ("cpu", "mem")
+
+    def __init__(self, mode: str, out_dir: str):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported profile mode: {mode}")
+
+        self.mode = mode
+        self.out_dir = out_dir
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self.memory: Dict[str, Dict[str, Any]] = {}
+        # Per-thread stack of open stages; thread holding the cProfile;
+        # open mem frames of all threads
+        self._local = threading.local()
+        self._owner: int | None = None
+        self._open: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+        if mode == "mem" and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+
+    # ---------------------------------------------------------
+    # STAGE HOOKS (called by Metrics timers)
+    # ---------------------------------------------------------
+    @property
+    def _stack(self) -> List[Tuple[str, Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start(self, stage: str):
+        stack = self._stack
+        if self.mode == "cpu":
+            with self._lock:
+                # A thread inside an unprofiled stage never claims the
+                # profiler, so its profiled frames are always contiguous
+                if self._owner not in (None, threading.get_ident()) or any(
+                    handle is None for _, handle in stack
+                ):
+                    stack.append((stage, None))
+                    return
+                self._owner = threading.get_ident()
+                prof = self.profiles.setdefault(stage, cProfile.Profile())
+            # Only one profiler can be active: pause the enclosing stage
+            if stack:
+                stack[-1][1].disable()
+            stack.append((stage, prof))
+            prof.enable()
+            return
+
+        snapshot = tracemalloc.take_snapshot()
+        with self._lock:
+            current, _ = tracemalloc.get_traced_memory()
+            # reset_peak() is global: open stages keep the peak seen so far
+            self._carry_peak()
+            tracemalloc.reset_peak()
+            frame = {"snapshot": snapshot, "current": current, "peak": current}
+            self._open.append(frame)
+        stack.append((stage, frame))
+
+    def stop(self, stage: str):
+        stack = self._stack
+        name, handle = stack.pop()
+
+        if self.mode == "cpu":
+            if handle is None:
+                return
+            handle.disable()
+            if stack:
+                stack[-1][1].enable()
+            else:
+                # Last profiled stage of this thread: let other threads profile
+                with self._lock:
+                    self._owner = None
+            return
+
+        with self._lock:
+            self._carry_peak()
+            self._open.remove(handle)
+        peak = handle["peak"]
+        snapshot = tracemalloc.take_snapshot()
+        diffs = snapshot.compare_to(handle["snapshot"], "lineno")
+
+        with self._lock:
+            self._record_memory(name, peak, peak - handle["current"], diffs)
+
+    def _carry_peak(self):
+        _, peak = tracemalloc.get_traced_memory()
+        for frame in self._open:
+            frame["peak"] = max(frame["peak"], peak)
+
+    def _record_memory(self, name: str, peak: int, peak_increase: int, diffs):
+        entry = self.memory.setdefault(
+            name,
+            {
+                "calls": 0,
+                "peak_bytes": 0,
+                "peak_increase_bytes": 0,
+                "net_bytes": 0,
+                "top_allocations": [],
+            },
+        )
+        entry["calls"] += 1
+        entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+        entry["peak_increase_bytes"] = max(entry["peak_increase_bytes"], peak_increase)
+        entry["net_bytes"] += sum(d.size_diff for d in diffs)
+        entry["top_allocations"] = [
+            {
+                "site": f"{d.traceback[0].filename}:{d.traceback[0].lineno}",
+                "size_diff_bytes": d.size_diff,
+                "count_diff": d.count_diff,
+            }
+            for d in sorted(diffs, key=lambda d: d.size_diff, reverse=True)[
+                :TOP_ALLOCATIONS
+            ]
+        ]
+
+    # ---------------------------------------------------------
+    # OUTPUT
+    # ---------------------------------------------------------
+    def write(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+
+        if self.mode == "mem":
+            path = os.path.join(self.out_dir, "memory_profile.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.memory, f, indent=4)
+            print(f"[OK] Saved memory profile → {path}")
+            return
+
+        combined: Counter = Counter()
+        merged = None
+
+        for stage, prof in self.profiles.items():
+            stats = pstats.Stats(prof)
+            stats.dump_stats(os.path.join(self.out_dir, f"{stage}.pstats"))
+
+            stacks = collapsed_stacks(stats)
+            _write_collapsed(os.path.join(self.out_dir, f"{stage}.collapsed"), stacks)
+
+            # Pipeline-wide flamegraph: stage name becomes the root frame
+            for stack, weight in stacks.items():
+                combined[f"{stage};{stack}"] += weight
+
+            if merged is None:
+                merged = stats
+            else:
+                merged.add(stats)
+
+        if merged is not None:
+            merged.dump_stats(os.path.join(self.out_dir, "pipeline.pstats"))
+        _write_collapsed(os.path.join(self.out_dir, "pipeline.collapsed"), combined)
+
+        print(f"[OK] Saved CPU profiles → {self.out_dir}")
+
+
+# ---------------------------------------------------------
+# PSTATS → COLLAPSED STACKS
+# ---------------------------------------------------------
+def collapsed_stacks(stats: pstats.Stats) -> Counter:
+    """
+    Rebuilds approximate call stacks from the cProfile caller graph.
+    Each function's time is split across its callers in proportion to the
+    cumulative time recorded on each caller → callee edge.
+    Weights are self time in microseconds.
+    """
+    raw = stats.stats
+    children = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+
+    stacks: Counter = Counter()
+
+    def walk(func, path: Tuple[str, ...], fraction: float):
+        _, _, tt, ct, _ = raw[func]
+        path = path + (_frame_name(func),)
+
+        self_us = int(tt * fraction * 1e6)
+        if self_us > 0:
+            stacks[";".join(path)] += self_us
+
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+
+        for child, edge_ct in children.get(func, ()):
+            child_ct = raw[child][3]
+            if child_ct <= 0 or _frame_name(child) in path:
+                continue
+            child_fraction = fraction * edge_ct / child_ct
+            # Prune paths contributing less than a microsecond
+            if child_ct * child_fraction * 1e6 < 1:
+                continue
+            walk(child, path, child_fraction)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, (), 1.0)
+
+    return stacks
+
+
+def _frame_name(func) -> str:
+    filename, lineno, name = func
+    frame = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return frame.replace(";", ":")
+
+
+def _write_collapsed(path: str, stacks: Counter):
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, weight in sorted(stacks.items()):
+            f.write(f"{stack} {weight}\n")
@@ -0,0 +1,111 @@
+# src/metrics/test_metrics.py
+
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from src.metrics.instrumentation import Metrics
+from src.metrics.profiling import StageProfiler
+
+metrics = Metrics()
+
+with metrics.timer("nlp"):
+    for latency in [0.002, 0.004, 0.03]:
+        time.sleep(latency)
+        metrics.observe("nlp_case_seconds", latency)
+        metrics.inc("cases")
+
+print("METRICS DICT:")
+print(metrics.to_dict())
+
+print("\nPROMETHEUS TEXT:")
+print(metrics.to_prometheus())
+
+# Disabled metrics record nothing
+disabled = Metrics(enabled=False)
+with disabled.timer("nlp"):
+    disabled.inc("cases")
+print("DISABLED:", disabled.to_dict())
+
+# CPU profiling driven by the same stage timers
+with tempfile.TemporaryDirectory() as tmp:
+    profiler = StageProfiler("cpu", tmp)
+    profiled = Metrics(profiler=profiler)
+    with profiled.timer("reasoner"):
+        sum(i * i for i in range(100_000))
+    profiler.write()
+    print("PROFILE FILES:", sorted(os.listdir(tmp)))
+
+# Concurrent stages (process_many, server threads) keep their own stacks
+with tempfile.TemporaryDirectory() as tmp:
+    profiler = StageProfiler("cpu", tmp)
+    shared = Metrics(profiler=profiler)
+
+    def campaign():
+        for _ in range(50):
+            with shared.timer("nlp"):
+                with shared.timer("reasoner"):
+                    sum(i * i for i in range(2_000))
+
+    threads = [threading.Thread(target=campaign) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    profiler.write()
+    assert shared.timers["nlp"]["calls"] == shared.timers["reasoner"]["calls"] == 200
+    print("THREADED PROFILES:", sorted(os.listdir(tmp)))
+
+# Forced interleaving: A enters a stage while B holds the profiler, B
+# finishes, then A nests a stage inside its unprofiled one
+with tempfile.TemporaryDirectory() as tmp:
+    profiler = StageProfiler("cpu", tmp)
+    shared = Metrics(profiler=profiler)
+    b_started, a_started, b_done = (
+        threading.Event(),
+        threading.Event(),
+        threading.Event(),
+    )
+
+    def thread_b():
+        with shared.timer("nlp"):
+            b_started.set()
+            a_started.wait()
+        b_done.set()
+
+    def thread_a():
+        b_started.wait()
+        with shared.timer("nlp"):
+            a_started.set()
+            b_done.wait()
+            with shared.timer("reasoner"):
+                pass
+        # A holds nothing afterwards: a later stage can claim the profiler
+        with shared.timer("optimizer"):
+            pass
+
+    threads = [threading.Thread(target=thread_b), threading.Thread(target=thread_a)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert shared.timers["reasoner"]["calls"] == 1 and profiler._owner is None
+    assert "optimizer" in profiler.profiles and "reasoner" not in profiler.profiles
+    print("INTERLEAVED STAGES: OK")
+
+# A nested stage's reset_peak() does not hide the outer stage's peak
+with tempfile.TemporaryDirectory() as tmp:
+    profiler = StageProfiler("mem", tmp)
+    mem = Metrics(profiler=profiler)
+    with mem.timer("outer"):
+        block = bytearray(20_000_000)
+        del block
+        with mem.timer("inner"):
+            pass
+    tracemalloc.stop()
+    outer = profiler.memory["outer"]["peak_increase_bytes"]
+    inner = profiler.memory["inner"]["peak_increase_bytes"]
+    assert outer >= 20_000_000 > inner, (outer, inner)
+    print(f"NESTED MEM PEAKS: outer {outer / 1e6:.1f} MB, inner {inner / 1e6:.1f} MB")
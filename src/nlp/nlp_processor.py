@@ -1,5 +1,7 @@
+import hashlib
+import json
 import re
-from sentence_transformers import SentenceTransformer, util
+import threading
 
 
 class NLPProcessor:
@@ -10,8 +12,16 @@ class NLPProcessor:
     - Multi-action extraction per sentence
     """
 
-    def __init__(self):
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+    # Bump when parsing logic changes in a way templates do not capture
+    PARSER_VERSION = "1"
+    MODEL_NAME = "all-MiniLM-L6-v2"
+
+    def __init__(self, model=None):
+        # Pass a shared encoder to avoid loading the model more than once.
+        # Otherwise the model (and torch) is loaded on first semantic lookup.
+        self._model = model
+        self._template_embeddings = None
+        self._load_lock = threading.RLock()
 
         # Canonical keyword actions
         self.keyword_templates = {
@@ -108,7 +118,7 @@ class NLPProcessor:
             ],
         }
 
-        # Precompute embeddings
+        # Template phrases (embeddings are computed on first use)
         self.template_phrases = []
         self.template_actions = []
 
@@ -117,9 +127,35 @@ class NLPProcessor:
                 self.template_phrases.append(p)
                 self.template_actions.append(action)
 
-        self.template_embeddings = self.model.encode(
-            self.template_phrases, convert_to_tensor=True
-        )
+        # Fingerprint of everything that shapes the parser output
+        self.version = hashlib.sha256(
+            json.dumps(
+                [self.PARSER_VERSION, self.MODEL_NAME, self.keyword_templates]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    # ---------------------------------------------------------
+    # LAZY MODEL LOADING
+    # ---------------------------------------------------------
+    @property
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.MODEL_NAME)
+        return self._model
+
+    @property
+    def template_embeddings(self):
+        if self._template_embeddings is None:
+            with self._load_lock:
+                if self._template_embeddings is None:
+                    self._template_embeddings = self.model.encode(
+                        self.template_phrases, convert_to_tensor=True
+                    )
+        return self._template_embeddings
 
     # ---------------------------------------------------------
     # PARAMETER EXTRACTION
@@ -153,6 +189,8 @@ class NLPProcessor:
     # SEMANTIC ACTION DETECTION
     # ---------------------------------------------------------
     def detect_action_semantic(self, text: str):
+        from sentence_transformers import util
+
         text_emb = self.model.encode(text, convert_to_tensor=True)
         scores = util.cos_sim(text_emb, self.template_embeddings)[0]
 
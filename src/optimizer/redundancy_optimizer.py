@@ -1,4 +1,8 @@
-from typing import Dict, List
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.steps.sequence import StepSequence
+from src.steps.step import Action, Step, as_step
 
 
 class RedundancyOptimizer:
@@ -12,79 +16,104 @@ class RedundancyOptimizer:
     # ---------------------------------------------------------
     # PUBLIC API
     # ---------------------------------------------------------
-    def optimize(self, steps: List[Dict]) -> List[Dict]:
-        optimized = []
-        last_state = {
-            "speed": None,
-            "acc_on": None,
-            "lane": None,
-            "indicator": None,
+    def optimize(self, steps: List[Step | Dict] | StepSequence) -> List[Step] | StepSequence:
+        return self.optimize_chunk(steps, self.new_state())
+
+    def new_state(self) -> Dict:
+        return {
+            "last_state": {
+                "speed": None,
+                "acc_on": None,
+                "lane": None,
+                "indicator": None,
+            },
+            "last_action": None,
         }
-        last_action = None  # NEW: track last action for consecutive checks
-
-        for step in steps:
-            action, params = self._unpack(step)
 
+    def optimize_chunk(
+        self, steps: List[Step | Dict] | StepSequence, state: Dict
+    ) -> List[Step] | StepSequence:
+        """
+        Incremental form of optimize: `state` carries what was kept so far
+        across chunks (updated in place), so optimizing a sequence chunk by
+        chunk gives the same result as optimizing it in one go.
+        A StepSequence is filtered on its columns and comes back as one.
+        """
+        if isinstance(steps, StepSequence):
+            return steps.compress(list(self._kept(steps.pairs(), state)))
+
+        steps = [as_step(step) for step in steps]
+        pairs = ((step.action, step.value) for step in steps)
+        return list(compress(steps, list(self._kept(pairs, state))))
+
+    def _kept(self, pairs: Iterable[Tuple], state: Dict) -> Iterator[bool]:
+        """
+        Keep / drop decision per (action, value) pair.
+        """
+        last_state = state["last_state"]
+        last_action = state["last_action"]  # track last action for consecutive checks
+
+        for action, value in pairs:
             # 0. Remove consecutive APPLY_BRAKE
-            if action == "APPLY_BRAKE" and last_action == "APPLY_BRAKE":
+            if action == Action.APPLY_BRAKE and last_action == Action.APPLY_BRAKE:
+                yield False
                 continue
 
             # 1. Remove duplicate SET_SPEED
-            if action == "SET_SPEED":
-                speed = params.get("value")
-                if last_state["speed"] == speed:
+            if action == Action.SET_SPEED:
+                if last_state["speed"] == value:
                     last_action = action
-                    continue  # skip duplicate
-                last_state["speed"] = speed
+                    yield False  # skip duplicate
+                    continue
+                last_state["speed"] = value
 
             # 2. Remove duplicate ACC_ON / ACC_OFF
-            if action == "ACC_ON":
+            if action == Action.ACC_ON:
                 if last_state["acc_on"] is True:
                     last_action = action
+                    yield False
                     continue
                 last_state["acc_on"] = True
 
-            if action == "ACC_OFF":
+            if action == Action.ACC_OFF:
                 if last_state["acc_on"] is False:
                     last_action = action
+                    yield False
                     continue
                 last_state["acc_on"] = False
 
             # 3. Remove duplicate lane changes
-            if action == "LANE_CHANGE_LEFT":
+            if action == Action.LANE_CHANGE_LEFT:
                 if last_state["lane"] == "LEFT":
                     last_action = action
+                    yield False
                     continue
                 last_state["lane"] = "LEFT"
 
-            if action == "LANE_CHANGE_RIGHT":
+            if action == Action.LANE_CHANGE_RIGHT:
                 if last_state["lane"] == "RIGHT":
                     last_action = action
+                    yield False
                     continue
                 last_state["lane"] = "RIGHT"
 
             # 4. Remove duplicate indicators
-            if action == "INDICATOR_LEFT":
+            if action == Action.INDICATOR_LEFT:
                 if last_state["indicator"] == "LEFT":
                     last_action = action
+                    yield False
                     continue
                 last_state["indicator"] = "LEFT"
 
-            if action == "INDICATOR_RIGHT":
+            if action == Action.INDICATOR_RIGHT:
                 if last_state["indicator"] == "RIGHT":
                     last_action = action
+                    yield False
                     continue
                 last_state["indicator"] = "RIGHT"
 
             # If not skipped, keep the step
-            optimized.append(step)
+            yield True
             last_action = action  # update last action
 
-        return optimized
-
-    # ---------------------------------------------------------
-    # HELPERS
-    # ---------------------------------------------------------
-    def _unpack(self, step: Dict):
-        [(action, params)] = step.items()
-        return action, params or {}
+        state["last_action"] = last_action
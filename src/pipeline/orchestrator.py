@@ -1,13 +1,63 @@
 # src/pipeline/orchestrator.py
 
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
+from src.cache.stage_cache import StageCache
 from src.chaining.chaining_engine import ChainingEngine
-from src.nlp.nlp_processor import NLPProcessor
+from src.metrics.instrumentation import Metrics
 from src.optimizer.redundancy_optimizer import RedundancyOptimizer
-from src.reasoner.reasoner import Reasoner
+from src.pipeline.resources import PipelineResources
 from src.reporting.reporting_engine import ReportingEngine
 from src.state_machine.state_machine import StateMachine
+from src.steps.step import Step, to_dicts, to_steps
+
+
+# Per-case record fields that survive a process boundary (shards, checkpoints)
+CASE_RECORD_FIELDS = ("index", "id", "text", "steps_raw", "steps_validated", "issues")
+
+
+def normalise_case(idx: int, case: Any) -> Tuple[str, str]:
+    """
+    Returns (case_id, text) for a test case given as a plain string
+    or as a {"id": ..., "description": ...} dict.
+    """
+    # Case is a simple string
+    if isinstance(case, str):
+        return f"case_{idx+1}", case
+
+    # Case is a dict with description
+    if isinstance(case, dict):
+        return case.get("id", f"case_{idx+1}"), case.get("description", "")
+
+    raise ValueError(f"Unsupported test case format: {case}")
+
+
+def case_summary(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The per-case entry of the "cases" artifact. num_issues lets the flat
+    issues list be sliced back into cases (see src/diff/run_diff.py).
+    """
+    return {"id": record["id"], "text": record["text"], "num_issues": len(record["issues"])}
+
+
+def case_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON form of a case record (CASE_RECORD_FIELDS, steps as dicts) for
+    shards and checkpoints; case_record() reverses it.
+    """
+    entry = {field: record[field] for field in CASE_RECORD_FIELDS}
+    entry["steps_raw"] = to_dicts(record["steps_raw"])
+    entry["steps_validated"] = to_dicts(record["steps_validated"])
+    return entry
+
+
+def case_record(entry: Dict[str, Any]) -> Dict[str, Any]:
+    record = dict(entry)
+    record["steps_raw"] = to_steps(entry["steps_raw"])
+    record["steps_validated"] = to_steps(entry["steps_validated"])
+    return record
 
 
 class Orchestrator:
@@ -18,14 +68,24 @@ class Orchestrator:
     Supports BOTH:
     - ["Accelerate to 80.", "Reduce speed to 40."]
     - [{"id": "t01", "description": "Accelerate to 80."}, ...]
+
+    Heavy models live in shared PipelineResources; vehicle state is created
+    per call, so one instance can serve concurrent campaigns.
     """
 
-    def __init__(self):
-        self.nlp = NLPProcessor()
-        self.reasoner = Reasoner()
+    def __init__(
+        self,
+        cache: StageCache | None = None,
+        metrics: Metrics | None = None,
+        resources: PipelineResources | None = None,
+    ):
+        self.cache = cache
+        self.metrics = metrics or Metrics(enabled=False)
+        self.resources = resources or PipelineResources()
+        self.nlp = self.resources.nlp
+        self.reasoner = self.resources.reasoner
         self.chainer = ChainingEngine()
         self.optimizer = RedundancyOptimizer()
-        self.state_machine = StateMachine()
         self.reporting = ReportingEngine()
 
     # ---------------------------------------------------------
@@ -39,79 +99,177 @@ class Orchestrator:
         descriptions: list of natural language test descriptions
         returns: full report dict
         """
+        metrics = self.metrics
+        metrics.inc("cases", len(descriptions))
 
         # ---------------------------------------------------------
         # 1) NLP: parse each test case (supports both formats)
+        #    Cached cases skip NLP + Reasoner entirely
         # ---------------------------------------------------------
-        all_raw_steps: List[List[Dict]] = []
-        test_ids: List[str] = []
-        test_texts: List[str] = []
-
-        for idx, case in enumerate(descriptions):
-
-            # Case is a simple string
-            if isinstance(case, str):
-                text = case
-                case_id = f"case_{idx+1}"
-
-            # Case is a dict with description
-            elif isinstance(case, dict):
-                text = case.get("description", "")
-                case_id = case.get("id", f"case_{idx+1}")
-
-            else:
-                raise ValueError(f"Unsupported test case format: {case}")
-
-            test_ids.append(case_id)
-            test_texts.append(text)
-
-            steps = self.nlp.process_text(text)
-            all_raw_steps.append(steps)
+        with metrics.timer("nlp"):
+            records = [
+                self.parse_case(idx, case) for idx, case in enumerate(descriptions)
+            ]
 
         # ---------------------------------------------------------
         # 2) Reasoner: validate & enrich each test
         # ---------------------------------------------------------
-        all_validated: List[List[Dict]] = []
-        all_issues: List[Dict] = []
+        with metrics.timer("reasoner"):
+            for record in records:
+                self.validate_case(record)
+
+        return self.assemble_report(records)
+
+    def assemble_report(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Back half of the pipeline over validated case records (in suite order):
+        Chaining → Optimizer → StateMachine → Reporting.
+        Shared by single-node runs and merged shard runs.
+        """
+        metrics = self.metrics
 
-        for steps in all_raw_steps:
-            validated, issues = self.reasoner.validate_and_enrich(steps)
-            all_validated.append(validated)
-            all_issues.extend(issues)
+        all_raw_steps = [r["steps_raw"] for r in records]
+        all_validated = [r["steps_validated"] for r in records]
+        all_issues = [issue for r in records for issue in r["issues"]]
+        metrics.inc("issues", len(all_issues))
 
         # ---------------------------------------------------------
         # 3) Chaining: merge all validated tests
         # ---------------------------------------------------------
-        chained = self.chainer.chain_tests(all_validated)
+        with metrics.timer("chaining"):
+            chained = self.chainer.chain_tests(all_validated)
+        metrics.inc("steps_chained", len(chained))
 
         # ---------------------------------------------------------
         # 4) Redundancy Optimizer
         # ---------------------------------------------------------
-        optimized = self.optimizer.optimize(chained)
+        with metrics.timer("optimizer"):
+            optimized = self.optimizer.optimize(chained)
+        metrics.inc("steps_optimized", len(optimized))
 
         # ---------------------------------------------------------
         # 5) State Machine: apply steps, collect state trace
         # ---------------------------------------------------------
+        with metrics.timer("state_machine"):
+            state_trace = self.apply_state_machine(optimized, StateMachine())
+
+        # ---------------------------------------------------------
+        # 6) Reporting
+        # ---------------------------------------------------------
+        with metrics.timer("reporting"):
+            report = self.reporting.build_report(
+                steps=optimized,
+                issues=all_issues,
+                state_trace=state_trace,
+                raw_steps=all_raw_steps,
+                validated_steps=all_validated,
+            )
+        report["cases"] = [case_summary(r) for r in records]
+
+        return report
+
+    def process_many(
+        self,
+        campaigns: List[List[Any]],
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Processes independent campaigns concurrently on a thread pool,
+        sharing the loaded models. Reports come back in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.process_test_descriptions, campaigns))
+
+    # ---------------------------------------------------------
+    # PER-CASE STAGES (shared by batch + streaming pipelines)
+    # ---------------------------------------------------------
+    def parse_case(self, idx: int, case: Any) -> Dict[str, Any]:
+        """
+        NLP stage for one case.
+        returns: case record {"id", "text", "steps_raw", ...}; cache hits
+                 come back already validated
+        """
+        case_id, text = normalise_case(idx, case)
+        record: Dict[str, Any] = {
+            "index": idx,
+            "id": case_id,
+            "text": text,
+            "cache_key": None,
+        }
+
+        if self.cache is not None:
+            key = self.cache.key(text, self.nlp.version, self.reasoner.version)
+            record["cache_key"] = key
+
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.metrics.inc("cache_hits")
+                record.update(entry)
+                record["steps_raw"] = to_steps(entry["steps_raw"])
+                record["steps_validated"] = to_steps(entry["steps_validated"])
+                return record
+
+        # Disabled metrics: no clock reads or metric calls per case
+        if not self.metrics.enabled:
+            steps = self.nlp.process_text(text)
+        else:
+            start = time.perf_counter()
+            steps = self.nlp.process_text(text)
+            self.metrics.observe("nlp_case_seconds", time.perf_counter() - start)
+            self.metrics.inc("steps_raw", len(steps))
+
+        record["steps_raw"] = to_steps(steps)
+        return record
+
+    def validate_case(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reasoner stage for one case record (no-op for cache hits).
+        """
+        if "steps_validated" in record:
+            return record
+
+        if not self.metrics.enabled:
+            validated, issues = self.reasoner.validate_and_enrich(record["steps_raw"])
+        else:
+            start = time.perf_counter()
+            validated, issues = self.reasoner.validate_and_enrich(record["steps_raw"])
+            self.metrics.observe("reasoner_case_seconds", time.perf_counter() - start)
+
+        record["steps_validated"] = validated
+        record["issues"] = issues
+
+        if record["cache_key"] is not None:
+            self.cache.put(
+                record["cache_key"],
+                {
+                    "steps_raw": to_dicts(record["steps_raw"]),
+                    "steps_validated": to_dicts(validated),
+                    "issues": issues,
+                },
+            )
+
+        return record
+
+    def apply_state_machine(
+        self, steps: List[Step], state_machine: StateMachine
+    ) -> List[Dict]:
+        """
+        Applies steps to the run's state machine.
+        returns: state trace, one entry per step
+        """
         state_trace = []
-        for step in optimized:
-            ok, msg = self.state_machine.apply_step(step)
-            state = self.state_machine.get_state()
+        for step in steps:
+            ok, msg = state_machine.apply_step(step)
+            state = state_machine.get_state()
             state_trace.append(
                 {
-                    "step": step,
+                    "step": step.to_dict(),
                     "ok": ok,
                     "message": msg,
                     "state": state,
                 }
             )
+            if not ok:
+                self.metrics.inc("state_rejections")
 
-        # ---------------------------------------------------------
-        # 6) Reporting
-        # ---------------------------------------------------------
-        report = self.reporting.build_report(
-            steps=optimized,
-            issues=all_issues,
-            state_trace=state_trace,
-        )
-
-        return report
\ No newline at end of file
+        return state_trace
@@ -0,0 +1,44 @@
+# src/pipeline/resources.py
+
+import threading
+
+from src.nlp.nlp_processor import NLPProcessor
+from src.rag.rag_engine import RAGEngine
+from src.reasoner.reasoner import Reasoner
+
+
+class SharedEncoder:
+    """
+    One SentenceTransformer shared by NLP + RAG.
+    Calls are serialised: the HF fast tokenizer is not safe to share across
+    threads, and torch already parallelises a single encode internally.
+    """
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        # Loaded on first encode, so cached / plot-free runs never import torch
+        self.model = None
+        self._lock = threading.Lock()
+
+    def encode(self, *args, **kwargs):
+        with self._lock:
+            if self.model is None:
+                from sentence_transformers import SentenceTransformer
+
+                self.model = SentenceTransformer(self.model_name)
+            return self.model.encode(*args, **kwargs)
+
+
+class PipelineResources:
+    """
+    Heavy, immutable pipeline resources, loaded once and shared by every
+    campaign / thread:
+    - MiniLM encoder (shared by NLP + RAG instead of loading it twice)
+    - NLP template embedding matrix
+    - RAG FAISS index + rule-set fingerprint
+    """
+
+    def __init__(self, model_name: str = NLPProcessor.MODEL_NAME):
+        self.encoder = SharedEncoder(model_name)
+        self.nlp = NLPProcessor(model=self.encoder)
+        self.reasoner = Reasoner(rag=RAGEngine(model=self.encoder))
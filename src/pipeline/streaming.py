@@ -0,0 +1,180 @@
+# src/pipeline/streaming.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from src.pipeline.orchestrator import case_summary
+from src.state_machine.state_machine import StateMachine
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+class StreamingPipeline:
+    """
+    Streaming variant of Orchestrator.process_test_descriptions:
+    - NLP → Reasoner → Chaining + Optimizer → StateMachine as async stages
+    - Stages connected by bounded queues (back-pressure keeps memory flat)
+    - NLP batches run in an executor so later cases are parsed while
+      earlier ones are chained, optimized and applied
+    Produces the same report as the batch pipeline. With a
+    StreamingReportWriter the artifacts are written as they are produced
+    and only the summary is kept in memory.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        batch_size: int = 32,
+        queue_size: int = 4,
+        keep_case_steps: bool = True,
+        writer=None,
+    ):
+        self.orch = orchestrator
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        # False → drop per-case raw/validated steps once chained (report omits them)
+        self.keep_case_steps = keep_case_steps
+        self.writer = writer
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def process_test_descriptions(self, descriptions: List[Any]) -> Dict[str, Any]:
+        return asyncio.run(self.run(descriptions))
+
+    async def run(self, descriptions: List[Any]) -> Dict[str, Any]:
+        self.orch.metrics.inc("cases", len(descriptions))
+
+        parsed: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        validated: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        optimized: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        result: Dict[str, Any] = {
+            "cases": [],
+            "steps_raw": [],
+            "steps_validated": [],
+            "issues": [],
+            "steps": [],
+            "state_trace": [],
+            "num_issues": 0,
+        }
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="avtc-nlp") as pool:
+            await asyncio.gather(
+                self._nlp_stage(descriptions, parsed, pool),
+                self._reasoner_stage(parsed, validated, result),
+                self._chain_optimize_stage(validated, optimized),
+                self._state_machine_stage(optimized, result),
+            )
+
+        start = time.perf_counter()
+        if self.writer is not None:
+            report = {"summary": self.writer.close(), "artifacts": self.writer.paths}
+            self.orch.metrics.record_time("reporting", time.perf_counter() - start)
+            return report
+
+        report = self.orch.reporting.build_report(
+            steps=result["steps"],
+            issues=result["issues"],
+            state_trace=result["state_trace"],
+            raw_steps=result["steps_raw"] if self.keep_case_steps else None,
+            validated_steps=result["steps_validated"] if self.keep_case_steps else None,
+        )
+        report["cases"] = result["cases"]
+        self.orch.metrics.record_time("reporting", time.perf_counter() - start)
+
+        return report
+
+    # ---------------------------------------------------------
+    # STAGES
+    # ---------------------------------------------------------
+    async def _nlp_stage(self, descriptions, out_q: asyncio.Queue, pool):
+        loop = asyncio.get_running_loop()
+
+        for offset in range(0, len(descriptions), self.batch_size):
+            batch = descriptions[offset : offset + self.batch_size]
+            records = await loop.run_in_executor(pool, self._parse_batch, offset, batch)
+            await out_q.put(records)
+
+        await out_q.put(_DONE)
+
+    async def _reasoner_stage(self, in_q: asyncio.Queue, out_q: asyncio.Queue, result):
+        while (records := await in_q.get()) is not _DONE:
+            start = time.perf_counter()
+            for record in records:
+                self.orch.validate_case(record)
+            self.orch.metrics.record_time("reasoner", time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for record in records:
+                result["num_issues"] += len(record["issues"])
+                if self.writer is not None:
+                    self.writer.write_case(record)
+                    continue
+                result["issues"].extend(record["issues"])
+                result["cases"].append(case_summary(record))
+                if self.keep_case_steps:
+                    result["steps_raw"].append(record["steps_raw"])
+                    result["steps_validated"].append(record["steps_validated"])
+            if self.writer is not None:
+                self.orch.metrics.record_time("reporting", time.perf_counter() - start)
+
+            await out_q.put([r["steps_validated"] for r in records])
+            # Let downstream stages drain before taking the next batch
+            await asyncio.sleep(0)
+
+        self.orch.metrics.inc("issues", result["num_issues"])
+        await out_q.put(_DONE)
+
+    async def _chain_optimize_stage(self, in_q: asyncio.Queue, out_q: asyncio.Queue):
+        chainer, optimizer = self.orch.chainer, self.orch.optimizer
+        chain_state = chainer.new_state()
+        opt_state = optimizer.new_state()
+
+        while (cases := await in_q.get()) is not _DONE:
+            start = time.perf_counter()
+            chained: List[Dict] = []
+            for case in cases:
+                chained.extend(chainer.chain_case(case, chain_state))
+            self.orch.metrics.record_time("chaining", time.perf_counter() - start)
+            self.orch.metrics.inc("steps_chained", len(chained))
+
+            start = time.perf_counter()
+            kept = optimizer.optimize_chunk(chained, opt_state)
+            self.orch.metrics.record_time("optimizer", time.perf_counter() - start)
+            self.orch.metrics.inc("steps_optimized", len(kept))
+
+            await out_q.put(kept)
+            await asyncio.sleep(0)
+
+        await out_q.put(_DONE)
+
+    async def _state_machine_stage(self, in_q: asyncio.Queue, result):
+        state_machine = StateMachine()
+
+        while (steps := await in_q.get()) is not _DONE:
+            start = time.perf_counter()
+            trace = self.orch.apply_state_machine(steps, state_machine)
+            self.orch.metrics.record_time("state_machine", time.perf_counter() - start)
+
+            if self.writer is not None:
+                start = time.perf_counter()
+                self.writer.write_steps(steps, trace)
+                self.orch.metrics.record_time("reporting", time.perf_counter() - start)
+            else:
+                result["state_trace"].extend(trace)
+                result["steps"].extend(steps)
+
+    # ---------------------------------------------------------
+    # EXECUTOR WORK
+    # ---------------------------------------------------------
+    def _parse_batch(self, offset: int, batch: List[Any]) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        records = [
+            self.orch.parse_case(offset + i, case) for i, case in enumerate(batch)
+        ]
+        self.orch.metrics.record_time("nlp", time.perf_counter() - start)
+        return records
@@ -0,0 +1,26 @@
+# src/pipeline/test_sessions.py
+
+from src.pipeline.orchestrator import Orchestrator
+
+
+def main():
+    orch = Orchestrator()
+
+    campaigns = [
+        ["Start at 0, accelerate to 80, enable ACC."],
+        ["Accelerate to 60, change to the left lane, then brake."],
+        ["Drive at 50, engage ACC, shift to left lane, then disengage ACC."],
+    ] * 4
+
+    # Same campaigns, sequentially vs. concurrently on one Orchestrator
+    sequential = [orch.process_test_descriptions(c) for c in campaigns]
+    concurrent = orch.process_many(campaigns, max_workers=6)
+
+    print("\n===== SESSION ISOLATION =====\n")
+    for i, (a, b) in enumerate(zip(sequential, concurrent), start=1):
+        same = a["steps"] == b["steps"] and a["state_trace"] == b["state_trace"]
+        print(f"Campaign {i:02d}: {a['summary']['total_steps']} steps, identical={same}")
+
+
+if __name__ == "__main__":
+    main()
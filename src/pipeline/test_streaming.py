@@ -0,0 +1,37 @@
+# src/pipeline/test_streaming.py
+
+from src.pipeline.orchestrator import Orchestrator
+from src.pipeline.streaming import StreamingPipeline
+
+
+def main():
+    orch = Orchestrator()
+
+    descriptions = [
+        "Begin from standstill, accelerate to 60 with ACC, then maintain speed.",
+        "After that, disable ACC and change to the right lane.",
+        "Next, accelerate to 120 and then brake hard.",
+        "Finally, change to the left lane and reduce speed to 40.",
+    ]
+
+    # Tiny batches + queues so every stage overlaps with the next
+    pipeline = StreamingPipeline(orch, batch_size=1, queue_size=1)
+    report = pipeline.process_test_descriptions(descriptions)
+
+    print("\n===== STREAMED STEPS =====\n")
+    for i, step in enumerate(report["steps"], start=1):
+        print(f"{i:03d}: {step}")
+
+    print("\n===== SUMMARY =====\n")
+    print(report["summary"])
+
+    # Same output as the batch pipeline on the same suite
+    batch = orch.process_test_descriptions(descriptions)
+    for key in ("steps_raw", "steps_validated", "steps", "state_trace", "issues", "summary"):
+        assert report[key] == batch[key], key
+    assert report["text_report"] == batch["text_report"]
+    print("\n[OK] Streamed steps, state trace and issues match the batch pipeline")
+
+
+if __name__ == "__main__":
+    main()
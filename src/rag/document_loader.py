@@ -5,10 +5,30 @@ from pathlib import Path
 
 import yaml
 
+# libyaml bindings when available (~10x faster on large specs)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class DocumentLoader:
-    def __init__(self, base_path="src/rag/data"):
+    """
+    Loads the OEM / safety rule corpus as retrieval chunks:
+    - One chunk per rule (list item or top-level key), not per file
+    - Each chunk carries its parent context (file + key path) in the text
+    - Metadata: source file, key path, rule id
+    - Chunks longer than max_chars are split along the structure,
+      long scalar values into word windows
+    """
+
+    SUFFIXES = (".yaml", ".yml", ".json")
+
+    # Bump when the chunking below changes (invalidates saved indexes)
+    CHUNKER_VERSION = "1"
+
+    def __init__(self, base_path="src/rag/data", max_chars=1000):
         self.base_path = Path(base_path)
+        # ~256 MiniLM word pieces; longer input is truncated by the encoder
+        self.max_chars = max_chars
 
     def load_yaml(self, filename):
         path = self.base_path / filename
@@ -20,15 +40,155 @@ class DocumentLoader:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    def corpus_files(self):
+        return [
+            file for file in self.base_path.glob("**/*")
+            if file.is_file() and file.suffix in self.SUFFIXES
+        ]
+
+    def load_file(self, file):
+        file = Path(file)
+        if file.suffix in [".yaml", ".yml"]:
+            content = yaml.load(file.read_text(), Loader=_YAML_LOADER)
+        else:
+            content = json.loads(file.read_text())
+        return self.chunk(content, str(file))
+
     def load_all_documents(self):
         docs = []
 
-        for file in self.base_path.glob("**/*"):
-            if file.suffix in [".yaml", ".yml"]:
-                content = yaml.safe_load(file.read_text())
-                docs.append({"text": str(content), "source": str(file)})
-            elif file.suffix == ".json":
-                content = json.loads(file.read_text())
-                docs.append({"text": str(content), "source": str(file)})
+        for file in self.corpus_files():
+            docs.extend(self.load_file(file))
 
         return docs
+
+    # ---------------------------------------------------------
+    # CHUNKING
+    # ---------------------------------------------------------
+    def chunk(self, content, source):
+        """
+        Splits one parsed document into chunks:
+        {"text", "source", "key_path", "rule_id"}
+        """
+        chunks = []
+        context = Path(source).stem
+
+        if isinstance(content, dict):
+            self._collection(content, [], None, context, source, chunks)
+        elif isinstance(content, list):
+            for i, item in enumerate(content):
+                self._unit(item, [i], None, context, source, chunks)
+        elif content is not None:
+            self._unit(content, [], None, context, source, chunks)
+
+        return chunks
+
+    def _collection(self, node, path, rule_id, context, source, chunks):
+        # Mapping of rules: lists are rule collections, everything else a rule
+        for key, value in node.items():
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    self._unit(item, path + [key, i], rule_id, context, source, chunks)
+            else:
+                self._unit(value, path + [key], rule_id, context, source, chunks)
+
+    def _unit(self, node, path, parent_id, context, source, chunks):
+        rule_id = self._rule_id(node, path, parent_id)
+        header = self._header(context, path, rule_id)
+        text = f"{header}\n{self._render(node)}"
+
+        if len(text) <= self.max_chars:
+            chunks.append(self._doc(text, source, path, rule_id))
+        elif isinstance(node, dict):
+            self._split_mapping(node, header, path, rule_id, context, source, chunks)
+        elif isinstance(node, list):
+            for i, item in enumerate(node):
+                self._unit(item, path + [i], rule_id, context, source, chunks)
+        else:
+            # Oversized scalar: word windows sharing the same header
+            for window in self._windows(str(node), self.max_chars - len(header) - 1):
+                chunks.append(self._doc(f"{header}\n{window}", source, path, rule_id))
+
+    def _split_mapping(self, node, header, path, rule_id, context, source, chunks):
+        # Keep as many fields as fit together (id, text, ...) in one chunk,
+        # oversized fields become chunks of their own
+        head, rest = [], []
+        size = len(header)
+        for key, value in node.items():
+            item = self._render({key: value})
+            if size + 1 + len(item) <= self.max_chars:
+                head.append(item)
+                size += 1 + len(item)
+            else:
+                rest.append(key)
+
+        if head:
+            text = header + "\n" + "\n".join(head)
+            chunks.append(self._doc(text, source, path, rule_id))
+        for key in rest:
+            self._unit(node[key], path + [key], rule_id, context, source, chunks)
+
+    def _header(self, context, path, rule_id):
+        parts = [context]
+        if path:
+            parts.append(self.key_path(path))
+        if rule_id is not None and rule_id not in path:
+            parts.append(rule_id)
+        return " > ".join(parts)
+
+    @staticmethod
+    def _rule_id(node, path, parent_id):
+        if isinstance(node, dict) and node.get("id") is not None:
+            return str(node["id"])
+        # Parts of a split rule keep the rule's id
+        if parent_id is not None:
+            return parent_id
+        # Keyed rules (e.g. keywords.yaml) use the mapping key as id
+        if path and isinstance(path[-1], str):
+            return path[-1]
+        return None
+
+    @staticmethod
+    def key_path(path):
+        out = ""
+        for part in path:
+            out += f"[{part}]" if isinstance(part, int) else (f".{part}" if out else str(part))
+        return out
+
+    def _doc(self, text, source, path, rule_id):
+        return {
+            "text": text,
+            "source": source,
+            "key_path": self.key_path(path),
+            "rule_id": rule_id,
+        }
+
+    @staticmethod
+    def _render(node):
+        if isinstance(node, (dict, list)):
+            return yaml.dump(
+                node,
+                Dumper=_YAML_DUMPER,
+                sort_keys=False,
+                default_flow_style=False,
+                allow_unicode=True,
+            ).strip()
+        return str(node)
+
+    @staticmethod
+    def _windows(text, size):
+        size = max(1, size)
+        window = ""
+        for word in text.split():
+            while len(word) > size:
+                if window:
+                    yield window
+                    window = ""
+                yield word[:size]
+                word = word[size:]
+            if window and len(window) + 1 + len(word) > size:
+                yield window
+                window = ""
+            window = f"{window} {word}" if window else word
+        if window:
+            yield window
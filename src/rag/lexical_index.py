@@ -0,0 +1,152 @@
+# src/rag/lexical_index.py
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+# Identifiers (ACC_MIN_SPEED), decimals (1.2) and plain words / numbers
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[._][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lower-cased terms; compound identifiers are kept whole and also split,
+    so "ACC_MIN_SPEED" matches both the exact id and "min speed".
+    """
+    tokens = []
+    for tok in TOKEN_RE.findall(text.lower()):
+        tokens.append(tok)
+        if "_" in tok:
+            tokens.extend(p for p in tok.split("_") if p)
+    return tokens
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index over the RAG chunks:
+    - postings: term -> {doc id: term frequency}
+    - doc ids are the VectorStore (FAISS) ids, so hits map to the same chunks
+    - only postings of the query terms are touched, no full scan: they are
+      scored as NumPy arrays (compiled lazily after updates) and summed over
+      the matched rows, so a query costs O(postings), not O(corpus)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_len: Dict[int, int] = {}
+        self.total_len = 0
+
+        # Compiled view: dense rows, per-row length norm, per-term arrays
+        self._compiled = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.doc_len)
+
+    # ---------------------------------------------------------
+    # UPDATES
+    # ---------------------------------------------------------
+    def add(self, doc_id: int, text: str):
+        terms = Counter(tokenize(text))
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+
+        length = sum(terms.values())
+        self.doc_len[doc_id] = length
+        self.total_len += length
+        self._compiled = None
+
+    def add_documents(self, documents: Dict[int, Dict]):
+        for doc_id, doc in documents.items():
+            self.add(doc_id, doc["text"])
+
+    def remove(self, doc_ids: Iterable[int]):
+        doc_ids = {i for i in doc_ids if i in self.doc_len}
+        if not doc_ids:
+            return
+
+        for term in list(self.postings):
+            posting = self.postings[term]
+            for doc_id in doc_ids & posting.keys():
+                del posting[doc_id]
+            if not posting:
+                del self.postings[term]
+
+        for doc_id in doc_ids:
+            self.total_len -= self.doc_len.pop(doc_id)
+        self._compiled = None
+
+    # ---------------------------------------------------------
+    # SEARCH
+    # ---------------------------------------------------------
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[int, float]]:
+        """
+        [(doc id, BM25 score)] best first; empty when no query term occurs.
+        """
+        import numpy as np
+
+        compiled = self._compile()
+        n = len(compiled["ids"])
+        if not n or top_k <= 0:
+            return []
+
+        # Per-term contributions over their postings only, then summed per row
+        term_rows, term_scores = [], []
+        for term in set(tokenize(query)):
+            arrays = self._term_arrays(compiled, term)
+            if arrays is None:
+                continue
+
+            rows, tf = arrays
+            idf = math.log(1 + (n - len(rows) + 0.5) / (len(rows) + 0.5))
+            term_rows.append(rows)
+            term_scores.append(idf * tf * (self.k1 + 1) / (tf + compiled["norm"][rows]))
+        if not term_rows:
+            return []
+
+        matched, inverse = np.unique(np.concatenate(term_rows), return_inverse=True)
+        scores = np.zeros(len(matched), dtype="float32")
+        np.add.at(scores, inverse, np.concatenate(term_scores))
+
+        if len(matched) > top_k:
+            keep = np.argpartition(-scores, top_k - 1)[:top_k]
+            matched, scores = matched[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")
+
+        return [(int(compiled["ids"][matched[i]]), float(scores[i])) for i in order]
+
+    # ---------------------------------------------------------
+    # COMPILED VIEW
+    # ---------------------------------------------------------
+    def _compile(self):
+        import numpy as np
+
+        with self._lock:
+            if self._compiled is None:
+                ids = list(self.doc_len)
+                lengths = np.array([self.doc_len[i] for i in ids], dtype="float32")
+                avg_len = float(lengths.mean()) if ids else 1.0
+                self._compiled = {
+                    "ids": np.array(ids, dtype="int64"),
+                    "row": {doc_id: r for r, doc_id in enumerate(ids)},
+                    "norm": self.k1 * (1 - self.b + self.b * lengths / (avg_len or 1.0)),
+                    "terms": {},
+                }
+            return self._compiled
+
+    def _term_arrays(self, compiled, term):
+        import numpy as np
+
+        arrays = compiled["terms"].get(term)
+        if arrays is None:
+            posting = self.postings.get(term)
+            if not posting:
+                return None
+            rows = np.fromiter((compiled["row"][i] for i in posting), dtype="int64", count=len(posting))
+            tf = np.fromiter(posting.values(), dtype="float32", count=len(posting))
+            arrays = compiled["terms"][term] = (rows, tf)
+        return arrays
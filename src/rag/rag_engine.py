@@ -1,17 +1,185 @@
 # src/rag/rag_engine.py
 
+import os
+import threading
+
+from src.utils.fileio import file_sha256
+
 from .document_loader import DocumentLoader
+from .lexical_index import LexicalIndex
 from .vector_store import VectorStore
 
+# vector: FAISS only; lexical: BM25 only (no encoder call);
+# hybrid: BM25 candidates re-ranked by vector similarity (RRF)
+RETRIEVAL_MODES = ("vector", "lexical", "hybrid")
+
+# Reciprocal-rank-fusion constant
+RRF_K = 60
+
+
+def corpus_manifest(files, previous=None):
+    """
+    {path: {"size", "mtime", "sha256"}} for the corpus files.
+    Content is only re-hashed when size or mtime differ from `previous`.
+    """
+    previous = previous or {}
+    manifest = {}
+
+    for file in files:
+        path = str(file)
+        stat = os.stat(path)
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+        old = previous.get(path)
+        if old and old["size"] == entry["size"] and old["mtime"] == entry["mtime"]:
+            entry["sha256"] = old["sha256"]
+        else:
+            entry["sha256"] = file_sha256(path)
+
+        manifest[path] = entry
+
+    return manifest
+
 
 class RAGEngine:
-    def __init__(self):
-        self.loader = DocumentLoader()
-        self.store = VectorStore()
+    def __init__(
+        self,
+        model=None,
+        index_dir=".avtc_cache/rag_index",
+        loader=None,
+        index_type="flat",
+        metric="l2",
+        hybrid_candidates=50,
+    ):
+        # index_dir=None keeps the index in memory only;
+        # index_type / metric: see VectorStore
+        self.loader = loader or DocumentLoader()
+        self.store = VectorStore(model=model, index_type=index_type, metric=metric)
+        self.index_dir = index_dir
+        self.hybrid_candidates = hybrid_candidates
+
+        # BM25 index over the same chunks, built on first lexical / hybrid query
+        self._lexical = None
+        self._lexical_lock = threading.Lock()
+
+        # Guards the lazy build so concurrent first queries build it once
+        self._build_lock = threading.Lock()
+        self._ready = False
 
     def build_index(self):
-        docs = self.loader.load_all_documents()
+        self._lexical = None
+
+        if self.index_dir is None:
+            self.store.add_documents(self.loader.load_all_documents())
+            return
+
+        files = self.loader.corpus_files()
+
+        # Unchanged corpus: memory-map the saved index, no embedding at all
+        meta = {"chunker": self.loader.CHUNKER_VERSION, "max_chars": self.loader.max_chars}
+        stored = self.store.load(self.index_dir, mmap=True, meta=meta)
+        manifest = corpus_manifest(files, stored)
+        if stored is not None and self._changed(stored, manifest) == ([], []):
+            if manifest != stored:
+                # Touched but identical files: refresh mtimes so they are
+                # not re-hashed on the next start
+                self.store.save(self.index_dir, manifest, meta)
+            return
+
+        if stored is None or not self.store.supports_removal:
+            # Full (re)build: new index, or one that cannot drop vectors
+            self.store.reset()
+            changed, removed = [str(f) for f in files], []
+        else:
+            # Writable copy, then patch only the files that changed
+            self.store.load(self.index_dir, mmap=False, meta=meta)
+            changed, removed = self._changed(stored, manifest)
+            self.store.remove_sources(changed + removed)
+
+        docs = []
+        for file in files:
+            if str(file) in changed:
+                docs.extend(self.loader.load_file(file))
         self.store.add_documents(docs)
 
-    def retrieve(self, query, top_k=5):
-        return self.store.search(query, top_k)
+        if self.store.index is not None:
+            self.store.save(self.index_dir, manifest, meta)
+
+    @property
+    def lexical(self):
+        with self._lexical_lock:
+            if self._lexical is None:
+                lexical = LexicalIndex()
+                lexical.add_documents(self.store.documents)
+                self._lexical = lexical
+            return self._lexical
+
+    def retrieve(self, query, top_k=5, mode="vector"):
+        return self.retrieve_many([query], top_k, mode)[0]
+
+    def retrieve_many(self, queries, top_k=5, mode="vector"):
+        """
+        One result list per query, searched as a single batch.
+        """
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode {mode!r}, expected one of {RETRIEVAL_MODES}")
+
+        # Index is built on first retrieval unless built explicitly;
+        # the store's index exists before all vectors are added, so other
+        # threads wait for the whole build instead of checking it
+        if not self._ready:
+            with self._build_lock:
+                if self.store.index is None:
+                    self.build_index()
+                self._ready = True
+
+        if mode == "vector":
+            return self.store.search_many(queries, top_k)
+        if mode == "lexical":
+            return [
+                [self.store.documents[i] for i, _ in self.lexical.search(q, top_k)]
+                for q in queries
+            ]
+        return self._hybrid(queries, top_k)
+
+    def _hybrid(self, queries, top_k):
+        if not queries:
+            return []
+
+        results = [None] * len(queries)
+        query_embs = self.store.encode_queries(queries)
+
+        no_terms = []
+        for qi, query in enumerate(queries):
+            candidates = [i for i, _ in self.lexical.search(query, self.hybrid_candidates)]
+            if not candidates:
+                no_terms.append(qi)
+                continue
+
+            # Fuse BM25 rank with vector rank among the candidates only
+            sims = self.store.similarities(query_embs[qi], candidates)
+            by_vector = sorted(range(len(candidates)), key=lambda c: -sims[c])
+            vector_rank = {candidates[c]: rank for rank, c in enumerate(by_vector)}
+
+            fused = sorted(
+                enumerate(candidates),
+                key=lambda item: -(1 / (RRF_K + item[0]) + 1 / (RRF_K + vector_rank[item[1]])),
+            )
+            results[qi] = [self.store.documents[i] for _, i in fused[:top_k]]
+
+        # No query term in the corpus: plain vector search
+        if no_terms:
+            _, indices = self.store.search_embeddings(query_embs[no_terms], top_k)
+            for qi, row in zip(no_terms, indices.tolist()):
+                results[qi] = [self.store.documents[i] for i in row if i in self.store.documents]
+
+        return results
+
+    @staticmethod
+    def _changed(stored, manifest):
+        changed = [
+            path for path, entry in manifest.items()
+            if stored.get(path, {}).get("sha256") != entry["sha256"]
+        ]
+        removed = [path for path in stored if path not in manifest]
+        return changed, removed
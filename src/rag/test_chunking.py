@@ -0,0 +1,89 @@
+# src/rag/test_chunking.py
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from src.rag.document_loader import DocumentLoader
+from src.rag.rag_engine import RAGEngine
+
+SUBJECTS = ["ACC", "LKA", "AEB", "FCW", "Lane change", "Speed", "Braking", "Sensor fusion"]
+VERBS = ["must not exceed", "must remain below", "must trigger above", "must hold within"]
+UNITS = ["km/h", "seconds", "meters", "g", "degrees"]
+
+
+def make_corpus(folder: Path, num_files: int = 20, rules_per_file: int = 150, seed: int = 7):
+    """Synthetic OEM spec: rule lists with optional nested conditions and long notes."""
+    rng = random.Random(seed)
+    expected = {}
+
+    for f in range(num_files):
+        rules = []
+        for r in range(rules_per_file):
+            rule_id = f"OEM_{f:02d}_{r:04d}"
+            text = (
+                f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} "
+                f"{rng.randint(1, 250)} {rng.choice(UNITS)} in scenario {rule_id.lower()}."
+            )
+            rule = {"id": rule_id, "text": text}
+            if r % 5 == 0:
+                rule["conditions"] = [f"condition {c} of {rule_id.lower()}" for c in range(3)]
+            if r % 50 == 0:
+                # Oversized rationale → must be split, chunks keep the rule id
+                rule["rationale"] = " ".join(f"note{w}" for w in range(400))
+            rules.append(rule)
+            expected[rule_id] = text
+
+        doc = {"spec": {"oem": f"OEM-{f}", "version": "1.0"}, "rules": rules}
+        (folder / f"spec_{f:02d}.yaml").write_text(yaml.safe_dump(doc, sort_keys=False))
+
+    return expected
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "corpus"
+        corpus.mkdir()
+        expected = make_corpus(corpus)
+
+        loader = DocumentLoader(base_path=str(corpus), max_chars=600)
+
+        start = time.perf_counter()
+        docs = loader.load_all_documents()
+        elapsed = time.perf_counter() - start
+
+        rule_ids = {d["rule_id"] for d in docs if d["rule_id"] in expected}
+        longest = max(len(d["text"]) for d in docs)
+
+        print(f"RULES      : {len(expected)}")
+        print(f"CHUNKS     : {len(docs)} in {elapsed * 1000:.0f} ms")
+        print(f"LONGEST    : {longest} chars (limit {loader.max_chars})")
+        print(f"RULES FOUND: {len(rule_ids)}")
+        print("SAMPLE     :", docs[1])
+
+        assert rule_ids == set(expected)
+        assert longest <= loader.max_chars
+        assert all(d["source"] and d["key_path"] for d in docs)
+
+        # Retrieval points back at the exact rule
+        rag = RAGEngine(index_dir=str(Path(tmp) / "index"), loader=loader)
+        start = time.perf_counter()
+        rag.build_index()
+        print(f"\nINDEXED    : {rag.store.index.ntotal} chunks in {time.perf_counter() - start:.1f} s")
+
+        sample = random.Random(1).sample(sorted(expected), 50)
+        hits = 0
+        for rule_id in sample:
+            top = rag.retrieve(expected[rule_id], top_k=1)[0]
+            hits += top["rule_id"] == rule_id
+        print(f"TOP-1 HITS : {hits}/{len(sample)}")
+
+        top = rag.retrieve(expected[sample[0]], top_k=1)[0]
+        print("RESULT     :", top["source"], top["key_path"], top["rule_id"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,41 @@
+import threading
+import time
+
 from src.rag.rag_engine import RAGEngine
 
 rag = RAGEngine()
 rag.build_index()
 
+# Second engine reuses the saved index (memory-mapped, nothing re-embedded)
+start = time.perf_counter()
+rag = RAGEngine()
+rag.build_index()
+print(f"Reloaded {rag.store.index.ntotal} vectors in {(time.perf_counter() - start) * 1000:.1f} ms")
+
 query = "ACC must be enabled above what speed?"
 results = rag.retrieve(query, top_k=3)
 
 for r in results:
-    print("\nSOURCE:", r["source"])
+    print("\nSOURCE:", r["source"], "|", r["key_path"], "|", r["rule_id"])
     print("TEXT:", r["text"])
+
+# Batched: one encode + one FAISS call for all queries, repeats hit the LRU
+queries = [query, "Lane change in a tunnel", "Maximum braking deceleration", query]
+for q, hits in zip(queries, rag.retrieve_many(queries, top_k=1)):
+    print(f"\n{q!r} → {hits[0]['rule_id']} ({hits[0]['key_path']})")
+print("\nQUERY CACHE:", rag.store.query_cache_stats())
+
+# Exact requirement ids / limits: BM25 prefilter, re-ranked by vector similarity
+for mode in ("vector", "lexical", "hybrid"):
+    hits = rag.retrieve("ACC_MIN_GAP 1.2 seconds", top_k=3, mode=mode)
+    print(f"\n{mode.upper():<8}:", [h["rule_id"] for h in hits])
+
+# Concurrent first queries share one lazy build (in-memory index, no reload)
+rag = RAGEngine(model=rag.store.model, index_dir=None)
+threads = [threading.Thread(target=rag.retrieve, args=(query,)) for _ in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+assert rag.store.index.ntotal == len(rag.loader.load_all_documents())
+print(f"\nConcurrent lazy build: {rag.store.index.ntotal} vectors")
@@ -0,0 +1,52 @@
+# src/rag/test_vector_store.py
+
+import numpy as np
+
+from src.rag.vector_store import INDEX_TYPES, VectorStore
+
+
+def make_store(index_type, embeddings):
+    # add_embeddings never touches the encoder
+    store = VectorStore(model=object(), index_type=index_type)
+    docs = [
+        {"text": f"doc {i}", "source": "a.md" if i < 1000 else "b.md"}
+        for i in range(len(embeddings))
+    ]
+    store.add_embeddings(embeddings, docs)
+    return store
+
+
+def main():
+    embeddings = np.random.default_rng(0).standard_normal((3000, 32)).astype("float32")
+
+    for index_type in INDEX_TYPES:
+        store = make_store(index_type, embeddings)
+        if not store.supports_removal:
+            print(f"[OK] {index_type:<6} no removals (full rebuild on change)")
+            continue
+
+        assert store.remove_sources(["a.md"]) == 1000
+        assert store.index.ntotal == 2000
+
+        # Remaining documents are still found under their own ids...
+        probe = [1000, 1500, 2999]
+        _, ids = store.search_embeddings(embeddings[probe], top_k=1)
+        assert ids[:, 0].tolist() == probe, (index_type, ids[:, 0].tolist())
+
+        # ...removed ones never come back
+        _, ids = store.search_embeddings(embeddings[:5], top_k=10)
+        assert all(i == -1 or i >= 1000 for i in ids.ravel().tolist()), index_type
+
+        # Reconstruction (used by similarities) follows the same ids
+        sims = store.similarities(embeddings[1500], [1500, 2000])
+        assert sims[0] >= sims[1], index_type
+
+        # New documents after a removal get fresh ids
+        store.add_embeddings(embeddings[:10], [{"text": "new", "source": "c.md"}] * 10)
+        _, ids = store.search_embeddings(embeddings[:1], top_k=1)
+        assert ids[0, 0] == 3000, (index_type, ids[0, 0])
+        print(f"[OK] {index_type:<6} removal keeps ids and results ({store.index_spec})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,428 @@
 # src/rag/vector_store.py
 
-import faiss
-import numpy as np
-from sentence_transformers import SentenceTransformer
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from src.utils.fileio import atomic_write_json
+
+# Bump when the on-disk layout of a saved index changes
+INDEX_FORMAT = "avtc-rag-index-v3"
+
+
+INDEX_TYPES = ("flat", "ivf", "hnsw", "ivfpq")
+METRICS = ("l2", "cosine")
+
+# FAISS k-means wants ~39 training points per centroid
+MIN_POINTS_PER_CENTROID = 39
+MAX_TRAINING_POINTS = 100_000
 
 
 class VectorStore:
-    def __init__(self, embedding_model="all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(embedding_model)
+    """
+    FAISS-backed document store.
+
+    index_type:
+    - flat:  exact brute-force scan (default)
+    - ivf:   inverted lists over k-means cells, probes `nprobe` cells per query
+    - hnsw:  graph index, `ef_search` candidates per query (no removals)
+    - ivfpq: IVF with product-quantised (compressed) vectors
+    metric "cosine" L2-normalises vectors and searches by inner product.
+
+    IVF / PQ are trained automatically on the first batch of documents;
+    cell and code sizes are derived from its size unless given explicitly.
+    """
+
+    def __init__(
+        self,
+        embedding_model="all-MiniLM-L6-v2",
+        model=None,
+        index_type="flat",
+        metric="l2",
+        nlist=None,
+        nprobe=8,
+        hnsw_m=32,
+        ef_search=64,
+        pq_m=None,
+        query_cache_size=1024,
+    ):
+        # Pass a shared encoder to avoid loading the model more than once.
+        # faiss / sentence-transformers are imported on first use.
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index_type {index_type!r}, expected one of {INDEX_TYPES}"
+            )
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}")
+
+        self.embedding_model = embedding_model
+        self._model = model
+        self.index_type = index_type
+        self.metric = metric
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.pq_m = pq_m
+        # Factory string actually built (after automatic sizing)
+        self.index_spec = None
+
         self.index = None
-        self.documents = []
+        # FAISS id -> {"text": ..., "source": ...}; ids stay stable across
+        # removals because they are explicit (IndexIDMap2 or IVF list ids)
+        self.documents = {}
+        self._next_id = 0
+
+        # LRU of query text -> embedding, shared by search / search_many
+        self.query_cache_size = query_cache_size
+        self._query_cache = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self.query_cache_hits = 0
+        self.query_cache_misses = 0
+
+    @property
+    def model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(self.embedding_model)
+        return self._model
+
+    @property
+    def supports_removal(self):
+        return self.index_type != "hnsw"
+
+    def config(self):
+        return {
+            "index_type": self.index_type,
+            "metric": self.metric,
+            "nlist": self.nlist,
+            "hnsw_m": self.hnsw_m,
+            "pq_m": self.pq_m,
+        }
+
+    def reset(self):
+        self.index = None
+        self.index_spec = None
+        self.documents = {}
+        self._next_id = 0
 
     def add_documents(self, docs):
         """
         docs = list of {"text": "...", "source": "..."}
         """
-        self.documents.extend(docs)
+        if not docs:
+            return
 
         embeddings = self.model.encode([d["text"] for d in docs], convert_to_numpy=True)
+        self.add_embeddings(embeddings, docs)
+
+    def add_embeddings(self, embeddings, docs):
+        """
+        Adds precomputed embeddings (one row per doc); the first call
+        creates and, if needed, trains the index.
+        """
+        import faiss
+        import numpy as np
 
-        dim = embeddings.shape[1]
+        if self.metric == "cosine":
+            # normalize_L2 works in place; never touch the caller's array
+            embeddings = np.array(embeddings, dtype="float32", order="C")
+            faiss.normalize_L2(embeddings)
+        else:
+            embeddings = np.ascontiguousarray(embeddings, dtype="float32")
 
         if self.index is None:
-            self.index = faiss.IndexFlatL2(dim)
+            self.index = self._create_index(embeddings)
 
-        self.index.add(embeddings)
+        ids = np.arange(self._next_id, self._next_id + len(docs), dtype="int64")
+        self.index.add_with_ids(embeddings, ids)
+
+        for doc_id, doc in zip(ids.tolist(), docs):
+            self.documents[doc_id] = doc
+        self._next_id += len(docs)
+
+    def remove_sources(self, sources):
+        """
+        Drops every document that came from one of `sources` (file paths).
+        Returns the number of removed documents.
+        """
+        import numpy as np
+
+        sources = set(sources)
+        ids = [i for i, d in self.documents.items() if d["source"] in sources]
+
+        if ids and self.index is not None:
+            self.index.remove_ids(np.array(ids, dtype="int64"))
+        for doc_id in ids:
+            del self.documents[doc_id]
+
+        return len(ids)
 
     def search(self, query, top_k=5):
-        query_emb = self.model.encode([query], convert_to_numpy=True)
-        distances, indices = self.index.search(query_emb, top_k)
+        return self.search_many([query], top_k)[0]
+
+    def search_many(self, queries, top_k=5):
+        """
+        Batched search: one encode call for all uncached queries and one
+        FAISS call for the whole batch. Returns one result list per query.
+        """
+        if not queries:
+            return []
+
+        query_embs = self.encode_queries(queries)
+        distances, indices = self.search_embeddings(query_embs, top_k)
 
         results = []
-        for idx in indices[0]:
-            if idx < len(self.documents):
-                results.append(self.documents[idx])
+        for row in indices.tolist():
+            # FAISS pads with -1 when fewer than top_k documents exist
+            results.append([self.documents[i] for i in row if i in self.documents])
 
         return results
+
+    def encode_queries(self, queries):
+        """
+        (n_queries, dim) float32 embeddings; repeated queries are served from
+        the LRU cache, the rest are encoded together in a single batch.
+        """
+        import numpy as np
+
+        cached = {}
+        with self._query_cache_lock:
+            for q in queries:
+                emb = self._query_cache.get(q)
+                if emb is not None:
+                    self._query_cache.move_to_end(q)
+                    cached[q] = emb
+
+        missing = list(dict.fromkeys(q for q in queries if q not in cached))
+        if missing:
+            embs = self.model.encode(missing, convert_to_numpy=True)
+            embs = np.asarray(embs, dtype="float32")
+            for q, emb in zip(missing, embs):
+                cached[q] = emb
+
+            with self._query_cache_lock:
+                for q, emb in zip(missing, embs):
+                    self._query_cache[q] = emb
+                    self._query_cache.move_to_end(q)
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+
+        with self._query_cache_lock:
+            self.query_cache_hits += len(queries) - len(missing)
+            self.query_cache_misses += len(missing)
+
+        return np.stack([cached[q] for q in queries])
+
+    def query_cache_stats(self):
+        total = self.query_cache_hits + self.query_cache_misses
+        return {
+            "hits": self.query_cache_hits,
+            "misses": self.query_cache_misses,
+            "hit_ratio": round(self.query_cache_hits / total, 4) if total else 0.0,
+            "size": len(self._query_cache),
+        }
+
+    def search_embeddings(self, query_embs, top_k=5):
+        """
+        Raw FAISS search: (distances, ids) arrays of shape (n_queries, top_k).
+        """
+        import faiss
+        import numpy as np
+
+        if self.metric == "cosine":
+            query_embs = np.array(query_embs, dtype="float32", order="C")
+            faiss.normalize_L2(query_embs)
+        else:
+            query_embs = np.ascontiguousarray(query_embs, dtype="float32")
+        return self.index.search(query_embs, top_k)
+
+    def similarities(self, query_emb, ids):
+        """
+        Similarity (higher = closer) of one query embedding to the stored
+        vectors `ids`, computed from reconstructed vectors without a search.
+        """
+        import numpy as np
+
+        vectors = np.stack([self._reconstruct(i) for i in ids])
+        query = np.array(query_emb, dtype="float32").reshape(-1)
+
+        if self.metric == "cosine":
+            query /= np.linalg.norm(query) or 1.0
+            return vectors @ query
+        return -((vectors - query) ** 2).sum(axis=1)
+
+    def _reconstruct(self, doc_id):
+        import faiss
+
+        try:
+            return self.index.reconstruct(int(doc_id))
+        except RuntimeError:
+            # IVF indexes need a direct map (id -> list slot) to reconstruct
+            ivf = faiss.try_extract_index_ivf(self.index)
+            if ivf is None or ivf.direct_map.type != faiss.DirectMap.NoMap:
+                raise
+            ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+            return self.index.reconstruct(int(doc_id))
+
+    # ---------------------------------------------------------
+    # INDEX CONSTRUCTION
+    # ---------------------------------------------------------
+    def _create_index(self, embeddings):
+        import faiss
+
+        n, dim = embeddings.shape
+        spec = self._factory_spec(n, dim)
+        faiss_metric = (
+            faiss.METRIC_INNER_PRODUCT if self.metric == "cosine" else faiss.METRIC_L2
+        )
+
+        index = faiss.index_factory(dim, spec, faiss_metric)
+        # IVF indexes store the ids in their inverted lists and remove them
+        # natively; wrapping them in IndexIDMap2 desyncs its id map from the
+        # lists on remove_ids
+        if not spec.startswith("IVF"):
+            index = faiss.IndexIDMap2(index)
+        if not index.is_trained:
+            index.train(self._training_sample(embeddings))
+
+        self.index_spec = spec
+        self._apply_search_params(index)
+        return index
+
+    def _factory_spec(self, n, dim):
+        if self.index_type == "hnsw":
+            return f"HNSW{self.hnsw_m}"
+
+        if self.index_type == "flat":
+            return "Flat"
+
+        nlist = self.nlist or max(1, min(int(4 * n**0.5), n // MIN_POINTS_PER_CENTROID))
+        if self.index_type == "ivf":
+            return f"IVF{nlist},Flat"
+
+        # IVF-PQ: ~8 dims per sub-quantiser, codebook size limited by the
+        # number of training points
+        pq_m = self.pq_m or max(
+            d for d in range(1, max(1, dim // 8) + 1) if dim % d == 0
+        )
+        nbits = min(8, (n // MIN_POINTS_PER_CENTROID).bit_length() - 1)
+        if nbits < 4:
+            print(
+                f"[WARN] {n} vectors are too few to train {self.index_type}; "
+                "using an exact flat index"
+            )
+            return "Flat"
+        # "np": skip polysemous training (~6x slower, only helps Hamming search)
+        return f"IVF{nlist},PQ{pq_m}x{nbits}np"
+
+    @staticmethod
+    def _training_sample(embeddings):
+        import numpy as np
+
+        if len(embeddings) <= MAX_TRAINING_POINTS:
+            return embeddings
+        rows = np.random.default_rng(0).choice(
+            len(embeddings), MAX_TRAINING_POINTS, replace=False
+        )
+        return embeddings[np.sort(rows)]
+
+    def _apply_search_params(self, index):
+        import faiss
+
+        params = faiss.ParameterSpace()
+        if self.index_type in ("ivf", "ivfpq") and (self.index_spec or "").startswith(
+            "IVF"
+        ):
+            params.set_index_parameter(index, "nprobe", self.nprobe)
+        elif self.index_type == "hnsw":
+            params.set_index_parameter(index, "efSearch", self.ef_search)
+
+    # ---------------------------------------------------------
+    # PERSISTENCE
+    # ---------------------------------------------------------
+    def save(self, index_dir, files, meta=None):
+        """
+        Writes the FAISS index plus a JSON table of documents and the
+        corpus file manifest they were built from. `meta` records how the
+        documents were produced (e.g. chunker version).
+        """
+        import faiss
+
+        os.makedirs(index_dir, exist_ok=True)
+
+        # Unique temp name: concurrent saves of one index_dir must not collide
+        fd, tmp_path = tempfile.mkstemp(dir=index_dir, prefix=".tmp_")
+        os.close(fd)
+        try:
+            faiss.write_index(self.index, tmp_path)
+            os.replace(tmp_path, os.path.join(index_dir, "index.faiss"))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # Written last: a crash in between leaves an ntotal mismatch,
+        # which load() treats as "no usable index"
+        atomic_write_json(
+            os.path.join(index_dir, "store.json"),
+            {
+                "format": INDEX_FORMAT,
+                "embedding_model": self.embedding_model,
+                "index": self.config(),
+                "index_spec": self.index_spec,
+                "ntotal": int(self.index.ntotal),
+                "next_id": self._next_id,
+                "files": files,
+                "meta": meta,
+                "documents": [[i, d] for i, d in sorted(self.documents.items())],
+            },
+        )
+
+    def load(self, index_dir, mmap=True, meta=None):
+        """
+        Restores a saved index. With mmap=True the vectors are memory-mapped
+        read-only instead of copied into RAM; load with mmap=False before
+        adding or removing documents.
+
+        Returns the stored corpus file manifest, or None when there is no
+        compatible saved index (other format, model, index config or `meta`).
+        """
+        import faiss
+
+        index_path = os.path.join(index_dir, "index.faiss")
+        store_path = os.path.join(index_dir, "store.json")
+        if not (os.path.exists(index_path) and os.path.exists(store_path)):
+            return None
+
+        try:
+            with open(store_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if stored.get("format") != INDEX_FORMAT:
+            return None
+        if stored.get("embedding_model") != self.embedding_model:
+            return None
+        if stored.get("index") != self.config() or stored.get("meta") != meta:
+            return None
+
+        flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        try:
+            index = faiss.read_index(index_path, flags)
+        except RuntimeError:
+            return None
+
+        if index.ntotal != stored["ntotal"]:
+            return None
+
+        self.index = index
+        self.index_spec = stored["index_spec"]
+        self._apply_search_params(index)
+        self.documents = {int(i): d for i, d in stored["documents"]}
+        self._next_id = stored["next_id"]
+        return stored["files"]
@@ -1,7 +1,19 @@
 # src/reasoner/reasoner.py
 
+import hashlib
+import json
 from typing import Dict, List, Tuple
+
 from src.rag.rag_engine import RAGEngine
+from src.steps.step import Action, Step, as_step, make_step
+from src.utils.fileio import file_sha256
+
+_ACC_OFF = make_step(Action.ACC_OFF)
+_APPLY_BRAKE = make_step(Action.APPLY_BRAKE)
+_INDICATOR_LEFT = make_step(Action.INDICATOR_LEFT)
+_INDICATOR_RIGHT = make_step(Action.INDICATOR_RIGHT)
+_LANE_CHANGE_LEFT = make_step(Action.LANE_CHANGE_LEFT)
+_LANE_CHANGE_RIGHT = make_step(Action.LANE_CHANGE_RIGHT)
 
 
 class Reasoner:
@@ -13,28 +25,48 @@ class Reasoner:
     - Avoids duplicate or unnecessary braking
     """
 
-    def __init__(self):
-        self.rag = RAGEngine()
-        self.rag.build_index()
+    # Bump when the hard-coded rule checks or enrichment logic change
+    RULES_VERSION = "1"
+
+    def __init__(self, rag: RAGEngine | None = None):
+        # The RAG index is built lazily on first retrieval
+        self.rag = rag or RAGEngine()
+
+        # Rule-set fingerprint: logic version + chunking + rule corpus hashes
+        # (hashing the files avoids re-reading and re-chunking the corpus)
+        loader = self.rag.loader
+        corpus = sorted(
+            (file.relative_to(loader.base_path).as_posix(), file_sha256(file))
+            for file in loader.corpus_files()
+        )
+        self.version = hashlib.sha256(
+            json.dumps(
+                [self.RULES_VERSION, loader.CHUNKER_VERSION, loader.max_chars, corpus]
+            ).encode("utf-8")
+        ).hexdigest()
 
     # ---------------------------------------------------------
     # PUBLIC API
     # ---------------------------------------------------------
-    def validate_and_enrich(self, steps: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    def validate_and_enrich(self, steps: List[Step | Dict]) -> Tuple[List[Step], List[Dict]]:
+        """
+        steps: Steps or dict steps; returns (enriched Steps, issues)
+        """
         issues: List[Dict] = []
-        enriched: List[Dict] = []
+        enriched: List[Step] = []
 
         current_speed = None
         acc_on = False
 
         for step in steps:
-            action, params = self._unpack(step)
+            step = as_step(step)
+            action = step.action
             previous_speed = current_speed
 
             # Rule checks
             step_issues = self._check_action_rules(
                 action=action,
-                params=params,
+                value=step.value,
                 current_speed=current_speed,
                 acc_on=acc_on,
             )
@@ -42,8 +74,7 @@ class Reasoner:
 
             # Hybrid enrichment
             enriched_steps = self._enrich_sequence(
-                action=action,
-                params=params,
+                step=step,
                 current_speed=current_speed,
                 previous_speed=previous_speed,
                 acc_on=acc_on,
@@ -51,34 +82,25 @@ class Reasoner:
 
             # Update state
             for es in enriched_steps:
-                a, p = self._unpack(es)
-                if a == "ACC_ON":
+                a = es.action
+                if a == Action.ACC_ON:
                     acc_on = True
-                elif a == "ACC_OFF":
+                elif a == Action.ACC_OFF:
                     acc_on = False
-                elif a == "SET_SPEED":
-                    current_speed = p.get("value")
+                elif a == Action.SET_SPEED:
+                    current_speed = es.value
 
             enriched.extend(enriched_steps)
 
         return enriched, issues
 
-    # ---------------------------------------------------------
-    # INTERNAL HELPERS
-    # ---------------------------------------------------------
-    def _unpack(self, step: Dict):
-        if not step:
-            return None, {}
-        [(action, params)] = step.items()
-        return action, params or {}
-
     # ---------------------------------------------------------
     # RULE CHECKS
     # ---------------------------------------------------------
     def _check_action_rules(
         self,
         action: str,
-        params: Dict,
+        value: int | None,
         current_speed: int,
         acc_on: bool,
     ) -> List[Dict]:
@@ -86,7 +108,7 @@ class Reasoner:
         issues: List[Dict] = []
 
         # ACC minimum speed
-        if action == "ACC_ON":
+        if action == Action.ACC_ON:
             if current_speed is not None and current_speed < 30:
                 issues.append(
                     {
@@ -96,18 +118,17 @@ class Reasoner:
                 )
 
         # Speed max limit
-        if action == "SET_SPEED":
-            v = params.get("value")
-            if v is not None and v > 180:
+        if action == Action.SET_SPEED:
+            if value is not None and value > 180:
                 issues.append(
                     {
                         "type": "error",
-                        "message": f"SET_SPEED {v} km/h violates SPEED_MAX_LIMIT (<= 180 km/h).",
+                        "message": f"SET_SPEED {value} km/h violates SPEED_MAX_LIMIT (<= 180 km/h).",
                     }
                 )
 
         # Lane change with ACC ON → warning
-        if action in ["LANE_CHANGE_LEFT", "LANE_CHANGE_RIGHT"] and acc_on:
+        if action in (Action.LANE_CHANGE_LEFT, Action.LANE_CHANGE_RIGHT) and acc_on:
             issues.append(
                 {
                     "type": "warning",
@@ -122,31 +143,30 @@ class Reasoner:
     # ---------------------------------------------------------
     def _enrich_sequence(
         self,
-        action: str,
-        params: Dict,
+        step: Step,
         current_speed: int,
         previous_speed: int,
         acc_on: bool,
-    ) -> List[Dict]:
+    ) -> List[Step]:
 
-        result: List[Dict] = []
+        action = step.action
 
         # 1) Brake overrides ACC → insert ACC_OFF before APPLY_BRAKE
-        if action == "APPLY_BRAKE" and acc_on:
-            return [{"ACC_OFF": {}}, {"APPLY_BRAKE": {}}]
+        if action == Action.APPLY_BRAKE and acc_on:
+            return [_ACC_OFF, _APPLY_BRAKE]
 
         # 2) Lane change → indicator only
-        if action == "LANE_CHANGE_LEFT":
-            return [{"INDICATOR_LEFT": {}}, {"LANE_CHANGE_LEFT": {}}]
+        if action == Action.LANE_CHANGE_LEFT:
+            return [_INDICATOR_LEFT, _LANE_CHANGE_LEFT]
 
-        if action == "LANE_CHANGE_RIGHT":
-            return [{"INDICATOR_RIGHT": {}}, {"LANE_CHANGE_RIGHT": {}}]
+        if action == Action.LANE_CHANGE_RIGHT:
+            return [_INDICATOR_RIGHT, _LANE_CHANGE_RIGHT]
 
         # ---------------------------------------------------------
         # 3) SPEED LOGIC (SAFE + FINAL)
         # ---------------------------------------------------------
-        if action == "SET_SPEED":
-            v = params.get("value")
+        if action == Action.SET_SPEED:
+            v = step.value
 
             # If NLP produced SET_SPEED with no value → ignore
             if v is None:
@@ -154,14 +174,14 @@ class Reasoner:
 
             # First speed ever → accept
             if previous_speed is None:
-                return [{"SET_SPEED": {"value": v}}]
+                return [make_step(Action.SET_SPEED, v)]
 
             # Speed reduction → brake + set_speed
             if v < previous_speed:
-                return [{"APPLY_BRAKE": {}}, {"SET_SPEED": {"value": v}}]
+                return [_APPLY_BRAKE, make_step(Action.SET_SPEED, v)]
 
             # Speed increase → just set_speed
-            return [{"SET_SPEED": {"value": v}}]
+            return [make_step(Action.SET_SPEED, v)]
 
         # Default: no enrichment
-        return [{action: params}]
\ No newline at end of file
+        return [step]
\ No newline at end of file
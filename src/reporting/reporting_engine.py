@@ -2,6 +2,8 @@
 
 from typing import Any, Dict, List
 
+from src.steps.step import Step, to_dicts, unpack
+
 
 class ReportingEngine:
     """
@@ -9,6 +11,12 @@ class ReportingEngine:
     from the final test sequence, issues, and state trace.
     """
 
+    # Text report section headings
+    RAW_SECTION = ("RAW NLP STEPS", "-------------")
+    VALIDATED_SECTION = ("VALIDATED + ENRICHED STEPS", "---------------------------")
+    FINAL_SECTION = ("FINAL OPTIMIZED STEPS", "----------------------")
+    ISSUES_SECTION = ("ISSUES", "------")
+
     def __init__(self):
         pass
 
@@ -17,11 +25,11 @@ class ReportingEngine:
     # ---------------------------------------------------------
     def build_report(
         self,
-        steps: List[Dict],  # optimized steps
+        steps: List[Step | Dict],  # optimized steps
         issues: List[Dict],  # warnings + errors
         state_trace: List[Dict] | None = None,
-        raw_steps: List[List[Dict]] | None = None,
-        validated_steps: List[List[Dict]] | None = None,
+        raw_steps: List[List[Step | Dict]] | None = None,
+        validated_steps: List[List[Step | Dict]] | None = None,
     ) -> Dict[str, Any]:
         """
         steps: final optimized sequence
@@ -39,9 +47,9 @@ class ReportingEngine:
         # Steps (formatted)
         report["steps"] = self._format_steps(steps)
 
-        # Raw + validated steps (machine readable)
-        report["steps_raw"] = raw_steps or []
-        report["steps_validated"] = validated_steps or []
+        # Raw + validated steps (machine readable, dict form)
+        report["steps_raw"] = [to_dicts(case) for case in raw_steps or []]
+        report["steps_validated"] = [to_dicts(case) for case in validated_steps or []]
 
         # Issues + state trace
         report["issues"] = issues
@@ -73,10 +81,10 @@ class ReportingEngine:
             "status": "FAILED" if errors else "OK",
         }
 
-    def _format_steps(self, steps: List[Dict]) -> List[Dict[str, Any]]:
+    def _format_steps(self, steps: List[Step | Dict]) -> List[Dict[str, Any]]:
         formatted = []
         for idx, step in enumerate(steps, start=1):
-            action, params = self._unpack(step)
+            action, params = unpack(step)
             formatted.append(
                 {
                     "index": idx,
@@ -86,10 +94,6 @@ class ReportingEngine:
             )
         return formatted
 
-    def _unpack(self, step: Dict):
-        [(action, params)] = step.items()
-        return action, params or {}
-
     # ---------------------------------------------------------
     # TEXT REPORT GENERATION
     # ---------------------------------------------------------
@@ -104,62 +108,70 @@ class ReportingEngine:
 
         lines: List[str] = []
 
-        # Header
-        lines.append("=== AUTONOMOUS VEHICLE TEST CAMPAIGN REPORT ===")
-        lines.append("")
-
-        # Summary
-        lines.append("SUMMARY")
-        lines.append("-------")
-        lines.append(f"Total steps : {summary['total_steps']}")
-        lines.append(f"Errors      : {summary['num_errors']}")
-        lines.append(f"Warnings    : {summary['num_warnings']}")
-        lines.append(f"Status      : {summary['status']}")
-        lines.append("")
+        # Header + summary
+        lines.extend(self.header_lines(summary))
 
         # Raw NLP steps
         if raw_steps:
-            lines.append("RAW NLP STEPS")
-            lines.append("-------------")
+            lines.extend(self.RAW_SECTION)
             for i, test in enumerate(raw_steps, start=1):
-                lines.append(f"Test {i}:")
-                for step in test:
-                    a, p = self._unpack(step)
-                    lines.append(f"  - {a} {p}")
-                lines.append("")
+                lines.extend(self.case_lines(i, test))
         else:
             lines.append("RAW NLP STEPS: Not provided")
             lines.append("")
 
         # Validated steps
         if validated_steps:
-            lines.append("VALIDATED + ENRICHED STEPS")
-            lines.append("---------------------------")
+            lines.extend(self.VALIDATED_SECTION)
             for i, test in enumerate(validated_steps, start=1):
-                lines.append(f"Test {i}:")
-                for step in test:
-                    a, p = self._unpack(step)
-                    lines.append(f"  - {a} {p}")
-                lines.append("")
+                lines.extend(self.case_lines(i, test))
         else:
             lines.append("VALIDATED STEPS: Not provided")
             lines.append("")
 
         # Final optimized steps
-        lines.append("FINAL OPTIMIZED STEPS")
-        lines.append("----------------------")
+        lines.extend(self.FINAL_SECTION)
         for s in steps:
-            lines.append(f"{s['index']:03d}: {s['action']} {s['params']}")
+            lines.append(self.step_line(s))
         lines.append("")
 
         # Issues
-        lines.append("ISSUES")
-        lines.append("------")
+        lines.extend(self.ISSUES_SECTION)
         if issues:
             for i in issues:
-                lines.append(f"[{i['type'].upper()}] {i['message']}")
+                lines.append(self.issue_line(i))
         else:
             lines.append("No issues detected.")
         lines.append("")
 
         return "\n".join(lines)
+
+    # ---------------------------------------------------------
+    # TEXT REPORT PIECES (shared with the streaming writer)
+    # ---------------------------------------------------------
+    def header_lines(self, summary: Dict[str, Any]) -> List[str]:
+        return [
+            "=== AUTONOMOUS VEHICLE TEST CAMPAIGN REPORT ===",
+            "",
+            "SUMMARY",
+            "-------",
+            f"Total steps : {summary['total_steps']}",
+            f"Errors      : {summary['num_errors']}",
+            f"Warnings    : {summary['num_warnings']}",
+            f"Status      : {summary['status']}",
+            "",
+        ]
+
+    def case_lines(self, number: int, test: List[Step | Dict]) -> List[str]:
+        lines = [f"Test {number}:"]
+        for step in test:
+            a, p = unpack(step)
+            lines.append(f"  - {a} {p}")
+        lines.append("")
+        return lines
+
+    def step_line(self, formatted: Dict[str, Any]) -> str:
+        return f"{formatted['index']:03d}: {formatted['action']} {formatted['params']}"
+
+    def issue_line(self, issue: Dict) -> str:
+        return f"[{issue['type'].upper()}] {issue['message']}"
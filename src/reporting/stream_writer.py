@@ -0,0 +1,219 @@
+# src/reporting/stream_writer.py
+
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterator, List
+
+from src.pipeline.orchestrator import case_summary
+from src.reporting.reporting_engine import ReportingEngine
+from src.steps.step import Step, to_dicts, unpack
+
+# Default write buffer per output file
+DEFAULT_BUFFER_BYTES = 1 << 20
+
+
+def read_jsonl(path: str) -> Iterator[Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class StreamingReportWriter:
+    """
+    Writes the run artifacts incrementally while the pipeline produces them:
+    - cases / steps_raw / steps_validated.jsonl: one line per case
+    - steps_optimized / state_trace / issues.jsonl: one line per step / issue
+      (steps formatted as in the batch report: index, action, params)
+    - report.md: same text as the batch report; sections are spooled to
+      part files and joined behind the summary on close()
+    Memory is bounded by the file buffers, not by the campaign size.
+    Used as a context manager, an exception aborts the run and removes
+    the partial files.
+    """
+
+    JSONL_FILES = (
+        "cases",
+        "steps_raw",
+        "steps_validated",
+        "steps_optimized",
+        "state_trace",
+        "issues",
+    )
+    PARTS = ("raw", "validated", "final", "issues")
+
+    def __init__(
+        self,
+        out_dir: str,
+        reporting: ReportingEngine | None = None,
+        keep_case_steps: bool = True,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+    ):
+        self.out_dir = out_dir
+        self.reporting = reporting or ReportingEngine()
+        # False → no per-case raw/validated steps (report says "Not provided")
+        self.keep_case_steps = keep_case_steps
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.paths = {
+            name: os.path.join(out_dir, f"{name}.jsonl") for name in self.JSONL_FILES
+        }
+        self.paths["report"] = os.path.join(out_dir, "report.md")
+
+        self._files = {
+            name: open(path, "w", encoding="utf-8", buffering=buffer_bytes)
+            for name, path in self.paths.items()
+            if name != "report"
+        }
+        self._parts = {
+            name: open(self._part_path(name), "w+", encoding="utf-8", buffering=buffer_bytes)
+            for name in self.PARTS
+        }
+
+        self.num_cases = 0
+        self.num_issues = 0
+        self.total_steps = 0
+        self.num_errors = 0
+        self.num_warnings = 0
+        self.closed = False
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def write_case(self, record: Dict[str, Any]):
+        """
+        One validated case record (after NLP + Reasoner).
+        """
+        self.num_cases += 1
+        self._line("cases", case_summary(record))
+
+        if self.keep_case_steps:
+            self._line("steps_raw", to_dicts(record["steps_raw"]))
+            self._line("steps_validated", to_dicts(record["steps_validated"]))
+            self._part("raw", self.reporting.case_lines(self.num_cases, record["steps_raw"]))
+            self._part(
+                "validated",
+                self.reporting.case_lines(self.num_cases, record["steps_validated"]),
+            )
+
+        for issue in record["issues"]:
+            self.num_issues += 1
+            self._line("issues", issue)
+            self._part("issues", [self.reporting.issue_line(issue)])
+            if issue.get("type") == "error":
+                self.num_errors += 1
+            elif issue.get("type") == "warning":
+                self.num_warnings += 1
+
+    def write_steps(self, steps: List[Step | Dict], state_trace: List[Dict]):
+        """
+        A chunk of final optimized steps with their state snapshots.
+        """
+        lines = []
+        for step in steps:
+            self.total_steps += 1
+            action, params = unpack(step)
+            formatted = {"index": self.total_steps, "action": action, "params": params}
+            self._line("steps_optimized", formatted)
+            lines.append(self.reporting.step_line(formatted))
+        self._part("final", lines)
+
+        for snapshot in state_trace:
+            self._line("state_trace", snapshot)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "total_steps": self.total_steps,
+            "num_errors": self.num_errors,
+            "num_warnings": self.num_warnings,
+            "status": "FAILED" if self.num_errors else "OK",
+        }
+
+    def close(self, abort: bool = False) -> Dict[str, Any]:
+        """
+        Flushes the JSONL files, assembles report.md and returns the summary.
+        abort=True instead deletes the part files and the incomplete JSONL
+        files, leaving no partial report behind.
+        """
+        if self.closed:
+            return self.summary()
+        self.closed = True
+
+        for f in self._files.values():
+            f.close()
+
+        if abort:
+            for name, f in self._parts.items():
+                f.close()
+                os.remove(self._part_path(name))
+            for name in self.JSONL_FILES:
+                os.remove(self.paths[name])
+            return self.summary()
+
+        summary = self.summary()
+        tmp_path = self.paths["report"] + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            self._write_lines(out, self.reporting.header_lines(summary))
+
+            has_cases = self.keep_case_steps and self.num_cases > 0
+            self._copy_section(out, "raw", self.reporting.RAW_SECTION, has_cases,
+                               "RAW NLP STEPS: Not provided")
+            self._copy_section(out, "validated", self.reporting.VALIDATED_SECTION, has_cases,
+                               "VALIDATED STEPS: Not provided")
+
+            self._write_lines(out, self.reporting.FINAL_SECTION)
+            self._copy_part(out, "final")
+            self._write_lines(out, [""])
+
+            self._write_lines(out, self.reporting.ISSUES_SECTION)
+            if self.num_issues:
+                self._copy_part(out, "issues")
+            else:
+                self._write_lines(out, ["No issues detected."])
+        os.replace(tmp_path, self.paths["report"])
+
+        for name, f in self._parts.items():
+            f.close()
+            os.remove(self._part_path(name))
+
+        return summary
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(abort=exc_type is not None)
+        return False
+
+    # ---------------------------------------------------------
+    # INTERNAL HELPERS
+    # ---------------------------------------------------------
+    def _part_path(self, name: str) -> str:
+        return os.path.join(self.out_dir, f".report_{name}.part")
+
+    def _line(self, name: str, obj: Any):
+        self._files[name].write(json.dumps(obj))
+        self._files[name].write("\n")
+
+    def _part(self, name: str, lines: List[str]):
+        self._write_lines(self._parts[name], lines)
+
+    @staticmethod
+    def _write_lines(f, lines):
+        for line in lines:
+            f.write(line)
+            f.write("\n")
+
+    def _copy_part(self, out, name: str):
+        part = self._parts[name]
+        part.flush()
+        part.seek(0)
+        shutil.copyfileobj(part, out)
+
+    def _copy_section(self, out, name, heading, present, missing_line):
+        if present:
+            self._write_lines(out, heading)
+            self._copy_part(out, name)
+        else:
+            self._write_lines(out, [missing_line, ""])
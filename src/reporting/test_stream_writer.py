@@ -0,0 +1,95 @@
+# src/reporting/test_stream_writer.py
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.reporting.reporting_engine import ReportingEngine
+from src.reporting.stream_writer import StreamingReportWriter
+
+NUM_CASES = 20_000
+CASE = [
+    {"SET_SPEED": {"value": 0}},
+    {"SET_SPEED": {"value": 80}},
+    {"ACC_ON": {}},
+    {"INDICATOR_LEFT": {}},
+    {"LANE_CHANGE_LEFT": {}},
+    {"APPLY_BRAKE": {}},
+]
+ISSUE = {"type": "warning", "message": "LANE_CHANGE_LEFT while ACC was recently ON."}
+
+
+def records():
+    for i in range(NUM_CASES):
+        yield {
+            "id": f"case_{i + 1}",
+            "text": "Accelerate to 80, enable ACC, change lane left and brake.",
+            "steps_raw": CASE,
+            "steps_validated": CASE,
+            "issues": [ISSUE] if i % 10 == 0 else [],
+        }
+
+
+def batch(out_dir):
+    engine = ReportingEngine()
+    recs = list(records())
+    steps = [s for r in recs for s in r["steps_validated"]]
+    report = engine.build_report(
+        steps=steps,
+        issues=[i for r in recs for i in r["issues"]],
+        raw_steps=[r["steps_raw"] for r in recs],
+        validated_steps=[r["steps_validated"] for r in recs],
+    )
+    with open(os.path.join(out_dir, "report.md"), "w", encoding="utf-8") as f:
+        f.write(report["text_report"])
+    for name in ("steps_raw", "steps_validated", "issues"):
+        with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(report[name], f, indent=4)
+    with open(os.path.join(out_dir, "steps_optimized.json"), "w", encoding="utf-8") as f:
+        json.dump(report["steps"], f, indent=4)
+
+
+def streamed(out_dir):
+    writer = StreamingReportWriter(out_dir)
+    for record in records():
+        writer.write_case(record)
+        writer.write_steps(record["steps_validated"], [])
+    writer.close()
+
+
+def measure(label, fn, out_dir):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(out_dir)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<9}: {elapsed:6.2f} s, peak {peak / 1e6:7.1f} MB")
+
+
+def main():
+    print(f"{NUM_CASES} cases, {NUM_CASES * len(CASE)} steps\n")
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        measure("BATCH", batch, a)
+        measure("STREAMED", streamed, b)
+
+        with open(os.path.join(a, "report.md"), encoding="utf-8") as fa, \
+                open(os.path.join(b, "report.md"), encoding="utf-8") as fb:
+            print("\nreport.md identical:", fa.read() == fb.read())
+
+    # A run that fails mid-way leaves no partial files behind
+    with tempfile.TemporaryDirectory() as c:
+        try:
+            with StreamingReportWriter(c) as writer:
+                writer.write_case(next(records()))
+                raise RuntimeError("pipeline failed")
+        except RuntimeError:
+            pass
+        assert os.listdir(c) == [], os.listdir(c)
+        print("Aborted run leaves:", os.listdir(c))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# src/server/client.py
+
+import argparse
+import json
+import sys
+import urllib.error
+import urllib.request
+from typing import Any, Dict
+
+# Deliberately light: no pipeline imports, so the client starts instantly
+
+
+def generate(url: str, tests, timeout: float = 600.0) -> Dict[str, Any]:
+    data = json.dumps({"tests": tests}).encode("utf-8")
+    req = urllib.request.Request(
+        f"{url.rstrip('/')}/generate",
+        data=data,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Submit test cases to an AVTC server")
+    parser.add_argument(
+        "--file", default="data/test_cases.json", help="Path to test cases JSON"
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Server URL")
+    parser.add_argument("--out", default=None, help="Write the report JSON here")
+    args = parser.parse_args()
+
+    with open(args.file, "r", encoding="utf-8") as f:
+        tests = json.load(f)["tests"]
+
+    try:
+        report = generate(args.url, tests)
+    except urllib.error.HTTPError as e:
+        print(f"[ERROR] {e.code}: {e.read().decode('utf-8')}", file=sys.stderr)
+        sys.exit(1)
+    except urllib.error.URLError as e:
+        print(f"[ERROR] Server not reachable at {args.url}: {e.reason}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"[OK] Saved report → {args.out}")
+    else:
+        print(report["text_report"])
+
+    summary = report["summary"]
+    print(
+        f"[OK] {summary['total_steps']} steps, {summary['num_errors']} errors, "
+        f"{summary['num_warnings']} warnings in {report['elapsed_s']} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# src/server/server.py
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+from src.cache.stage_cache import StageCache
+from src.pipeline.orchestrator import Orchestrator
+
+WARMUP_CASES = ["Accelerate to 50, enable ACC, then change to the left lane and brake."]
+
+
+class GenerationService:
+    """
+    Holds one warmed Orchestrator for the lifetime of the process:
+    - Models, template embeddings and the RAG index are loaded once
+    - Each request only pays for the pipeline work on its batch
+    - Requests are served concurrently (per-run state is not shared)
+    """
+
+    def __init__(self, cache: StageCache | None = None):
+        self.started = time.time()
+        self.requests = 0
+        self.orch = Orchestrator(cache=cache)
+        self._lock = threading.Lock()
+
+        # Warm-up pass so the first real request does not pay lazy init costs
+        self.generate(WARMUP_CASES)
+        self.requests = 0
+
+    def generate(self, tests) -> Dict[str, Any]:
+        report = self.orch.process_test_descriptions(tests)
+        with self._lock:
+            self.requests += 1
+        return report
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests": self.requests,
+        }
+
+
+def make_handler(service: GenerationService):
+    class Handler(BaseHTTPRequestHandler):
+        # ---------------------------------------------------------
+        # ROUTES
+        # ---------------------------------------------------------
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, service.health())
+            else:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/generate":
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                tests = payload["tests"]
+                if not isinstance(tests, list):
+                    raise TypeError(f"'tests' must be a list, got {type(tests).__name__}")
+            except (ValueError, KeyError, TypeError) as e:
+                self._send(400, {"error": f"Expected JSON body {{'tests': [...]}}: {e}"})
+                return
+
+            start = time.perf_counter()
+            try:
+                report = service.generate(tests)
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+                return
+            except Exception as e:
+                # Malformed cases can fail anywhere in the pipeline; always answer
+                self._send(500, {"error": f"{type(e).__name__}: {e}"})
+                return
+
+            report["elapsed_s"] = round(time.perf_counter() - start, 4)
+            self._send(200, report)
+
+        # ---------------------------------------------------------
+        # HELPERS
+        # ---------------------------------------------------------
+        def _send(self, status: int, body: Dict[str, Any]):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            print(f"[server] {self.address_string()} {fmt % args}")
+
+    return Handler
+
+
+# ---------------------------------------------------------
+# ENTRY POINT
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Resident AVTC generation server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Bind port")
+    parser.add_argument(
+        "--cache_dir", default=".avtc_cache/stages", help="Per-case stage cache folder"
+    )
+    parser.add_argument(
+        "--no_cache", action="store_true", help="Bypass the per-case stage cache"
+    )
+    args = parser.parse_args()
+
+    print("[server] Loading models + RAG index ...")
+    service = GenerationService(StageCache(args.cache_dir, enabled=not args.no_cache))
+
+    httpd = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    print(f"[server] Ready on http://{args.host}:{args.port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
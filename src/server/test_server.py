@@ -0,0 +1,54 @@
+# src/server/test_server.py
+
+import json
+import threading
+import urllib.error
+from http.server import ThreadingHTTPServer
+
+from src.server.client import generate
+from src.server.server import GenerationService, make_handler
+
+
+def main():
+    service = GenerationService()
+
+    # Port 0 → pick any free port
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(service))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    batches = [
+        ["Accelerate to 80.", "Enable ACC."],
+        ["Start at 0, accelerate to 100, then change to the left lane."],
+    ]
+
+    for tests in batches:
+        report = generate(url, tests)
+        print("\nINPUT  :", tests)
+        print("SUMMARY:", report["summary"])
+        print("LATENCY:", report["elapsed_s"], "s")
+
+    # Malformed cases get a JSON error response, never a dropped connection
+    for tests in (["Accelerate to 80.", 42], [{"description": 5}]):
+        try:
+            generate(url, tests)
+            raise AssertionError(f"{tests!r} was accepted")
+        except urllib.error.HTTPError as e:
+            assert e.code in (400, 500), e.code
+            print(f"\nREJECTED: {tests!r} → {e.code} {json.loads(e.read())['error']}")
+
+    # A payload that is not a list of cases is a bad request
+    for tests in ("Accelerate to 80.", {"description": "Accelerate to 80."}, None):
+        try:
+            generate(url, tests)
+            raise AssertionError(f"{tests!r} was accepted")
+        except urllib.error.HTTPError as e:
+            assert e.code == 400, e.code
+            print(f"\nREJECTED: {tests!r} → {e.code} {json.loads(e.read())['error']}")
+
+    print("\nHEALTH:", service.health())
+    httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# src/sharding/shards.py
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+from src.coverage.suite_minimizer import coverage_summary, steps_transitions
+from src.pipeline.orchestrator import case_entry, case_record, normalise_case
+from src.utils.fileio import atomic_write_json
+
+PARTIAL_FORMAT = "avtc-shard-v1"
+
+
+# ---------------------------------------------------------
+# PARTITIONING
+# ---------------------------------------------------------
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    "i/N" → (i, N), with shards numbered 1..N.
+    """
+    try:
+        shard, num_shards = (int(p) for p in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard spec '{spec}', expected i/N (e.g. 2/8)")
+
+    if num_shards < 1 or not 1 <= shard <= num_shards:
+        raise ValueError(f"Invalid shard spec '{spec}': need 1 <= i <= N")
+    return shard, num_shards
+
+
+def shard_of(case_id: str, num_shards: int) -> int:
+    """
+    Stable shard (1..N) for a case id: same on every machine and Python run,
+    unlike the salted built-in hash().
+    """
+    digest = hashlib.sha1(case_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards + 1
+
+
+def select_shard(
+    cases: List[Any], shard: int, num_shards: int
+) -> List[Tuple[int, Any]]:
+    """
+    returns: (global index, case) pairs belonging to `shard`
+    """
+    selected = []
+    for idx, case in enumerate(cases):
+        case_id, _ = normalise_case(idx, case)
+        if shard_of(case_id, num_shards) == shard:
+            selected.append((idx, case))
+    return selected
+
+
+# ---------------------------------------------------------
+# SHARD RUN
+# ---------------------------------------------------------
+def run_shard(orch, cases: List[Any], shard: int, num_shards: int) -> Dict[str, Any]:
+    """
+    Runs the per-case stages (NLP + Reasoner) on one shard.
+    returns: mergeable partial result
+    """
+    selected = select_shard(cases, shard, num_shards)
+    orch.metrics.inc("cases", len(selected))
+
+    with orch.metrics.timer("nlp"):
+        records = [orch.parse_case(idx, case) for idx, case in selected]
+
+    with orch.metrics.timer("reasoner"):
+        for record in records:
+            orch.validate_case(record)
+
+    partial_cases = []
+    for record in records:
+        entry = case_entry(record)
+        entry["transitions"] = steps_transitions(record["steps_validated"])
+        partial_cases.append(entry)
+
+    return {
+        "format": PARTIAL_FORMAT,
+        "shard": shard,
+        "num_shards": num_shards,
+        "total_cases": len(cases),
+        "nlp_version": orch.nlp.version,
+        "rules_version": orch.reasoner.version,
+        "cases": partial_cases,
+    }
+
+
+def partial_path(run_dir: str, shard: int, num_shards: int) -> str:
+    return os.path.join(run_dir, "shards", f"shard_{shard}_of_{num_shards}.json")
+
+
+def write_partial(run_dir: str, partial: Dict[str, Any]) -> str:
+    path = partial_path(run_dir, partial["shard"], partial["num_shards"])
+    atomic_write_json(path, partial)
+    print(f"[OK] Saved shard {partial['shard']}/{partial['num_shards']} → {path}")
+    return path
+
+
+# ---------------------------------------------------------
+# MERGE
+# ---------------------------------------------------------
+def load_partials(run_dir: str) -> List[Dict[str, Any]]:
+    paths = sorted(glob.glob(os.path.join(run_dir, "shards", "shard_*_of_*.json")))
+    if not paths:
+        raise FileNotFoundError(f"No shard partials found in {run_dir}/shards")
+
+    partials = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            partials.append(json.load(f))
+    return partials
+
+
+def merge_partials(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validates that the partials form one complete, consistent campaign.
+    returns: {"records": case records in suite order, "coverage": summary}
+    """
+    first = partials[0]
+    for p in partials:
+        if p.get("format") != PARTIAL_FORMAT:
+            raise ValueError(f"Unsupported shard format: {p.get('format')}")
+        for key in ("num_shards", "total_cases", "nlp_version", "rules_version"):
+            if p[key] != first[key]:
+                raise ValueError(
+                    f"Shard {p['shard']} disagrees on {key}: {p[key]} != {first[key]}"
+                )
+
+    num_shards = first["num_shards"]
+    found = sorted(p["shard"] for p in partials)
+    if found != list(range(1, num_shards + 1)):
+        missing = sorted(set(range(1, num_shards + 1)) - set(found))
+        raise ValueError(f"Incomplete or duplicate shards: missing {missing}, found {found}")
+
+    records = sorted(
+        (case_record(case) for p in partials for case in p["cases"]),
+        key=lambda c: c["index"],
+    )
+    if [r["index"] for r in records] != list(range(first["total_cases"])):
+        raise ValueError("Merged shards do not cover every case exactly once")
+
+    coverage = coverage_summary(
+        [r["id"] for r in records], [r["transitions"] for r in records]
+    )
+    coverage["num_shards"] = num_shards
+
+    return {"records": records, "coverage": coverage}
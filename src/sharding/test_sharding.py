@@ -0,0 +1,48 @@
+# src/sharding/test_sharding.py
+
+from collections import Counter
+
+from src.sharding.shards import merge_partials, select_shard, shard_of
+
+cases = [{"id": f"t{i:03d}", "description": f"Accelerate to {i}."} for i in range(1, 201)]
+
+# Stable hash partition: every case lands in exactly one of 4 shards
+sizes = Counter(shard_of(c["id"], 4) for c in cases)
+print("SHARD SIZES:", dict(sorted(sizes.items())))
+
+shards = [select_shard(cases, s, 4) for s in range(1, 5)]
+print("TOTAL SELECTED:", sum(len(s) for s in shards))
+
+# Fake partials (as written by run_shard) merge back into suite order
+partials = [
+    {
+        "format": "avtc-shard-v1",
+        "shard": s,
+        "num_shards": 4,
+        "total_cases": len(cases),
+        "nlp_version": "v",
+        "rules_version": "v",
+        "cases": [
+            {
+                "index": idx,
+                "id": case["id"],
+                "text": case["description"],
+                "steps_raw": [],
+                "steps_validated": [],
+                "issues": [],
+                "transitions": [f"T{idx % 7}"],
+            }
+            for idx, case in shards[s - 1]
+        ],
+    }
+    for s in range(1, 5)
+]
+
+merged = merge_partials(partials)
+print("MERGED IDS  :", [r["id"] for r in merged["records"]][:5], "...")
+print("COVERAGE    :", merged["coverage"]["total_transitions"], "transitions")
+
+try:
+    merge_partials(partials[:3])
+except ValueError as e:
+    print("MISSING SHARD:", e)
@@ -0,0 +1,55 @@
+# src/steps/actions.py
+
+from typing import Dict, Tuple
+
+# Canonical action vocabulary. Codes are positions in this tuple and are
+# stored in binary artifacts: append new actions, never reorder or remove.
+ACTIONS: Tuple[str, ...] = (
+    # NLP keyword actions
+    "SET_SPEED",
+    "APPLY_BRAKE",
+    "ACC_ON",
+    "ACC_OFF",
+    "LANE_CHANGE_LEFT",
+    "LANE_CHANGE_RIGHT",
+    # Reasoner enrichment
+    "INDICATOR_LEFT",
+    "INDICATOR_RIGHT",
+    # Remaining actions from src/rag/data/keywords.yaml
+    "SET_SPEED_RELATIVE",
+    "HOLD_SPEED",
+    "ACC_GAP_UP",
+    "ACC_GAP_DOWN",
+    "AEB_WARNING",
+    "AEB_BRAKE",
+    "FCW_WARNING",
+    "LKA_ON",
+    "LKA_OFF",
+    "STEER_LEFT",
+    "STEER_RIGHT",
+    "CENTER_LANE",
+    "ENGINE_ON",
+    "ENGINE_OFF",
+    "PARK",
+    "DRIVE",
+    "REVERSE",
+    "ENABLE_CAMERA",
+    "DISABLE_CAMERA",
+    "ENABLE_RADAR",
+    "DISABLE_RADAR",
+    "ENABLE_LIDAR",
+    "DISABLE_LIDAR",
+)
+
+ACTION_CODES: Dict[str, int] = {name: code for code, name in enumerate(ACTIONS)}
+
+
+def action_code(name: str) -> int:
+    """
+    Stable integer code of a canonical action; KeyError for unknown names.
+    """
+    return ACTION_CODES[name]
+
+
+def action_name(code: int) -> str:
+    return ACTIONS[code]
@@ -0,0 +1,316 @@
+# src/steps/sequence.py
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.steps.actions import ACTION_CODES
+from src.steps.step import Action, Step, as_step, make_step
+
+# Column dtypes: 7 bytes per step
+ACTION_DTYPE = np.uint8
+VALUE_DTYPE = np.int16
+CASE_DTYPE = np.int32
+
+# int16 sentinel for "no value"
+NO_VALUE = int(np.iinfo(VALUE_DTYPE).min)
+_VALUE_MAX = int(np.iinfo(VALUE_DTYPE).max)
+
+# Action code of rows kept verbatim in `extras` (unknown action, value that
+# is not an int16, or params other than {} / {"value": v})
+EXTRA = int(np.iinfo(ACTION_DTYPE).max)
+
+# Action member per code (ACTIONS order), padded to every uint8 code
+_MEMBERS: Tuple = tuple(Action) + (None,) * (EXTRA + 1 - len(Action))
+
+
+def _encode(step: Step) -> Tuple[int, int] | None:
+    code = ACTION_CODES.get(step.action)
+    value = step.value
+    if code is None or step.extra is not None:
+        return None
+    if value is None:
+        return code, NO_VALUE
+    if type(value) is int and NO_VALUE < value <= _VALUE_MAX:
+        return code, value
+    return None
+
+
+class StepSequence:
+    """
+    A campaign as parallel arrays: action code (uint8), value (int16) and
+    case id (int32) per step. Appends grow the buffers geometrically;
+    slices are zero-copy views. Rows never change once written, so views
+    and the sequence they came from stay consistent.
+
+    Iterating yields the shared Step objects (src/steps/step.py), so any
+    code that accepts Steps accepts a StepSequence.
+    """
+
+    __slots__ = ("_action", "_value", "_case", "_len", "extras")
+
+    def __init__(self, steps: Iterable = (), case: int | Iterable[int] = 0):
+        self._action = np.empty(0, dtype=ACTION_DTYPE)
+        self._value = np.empty(0, dtype=VALUE_DTYPE)
+        self._case = np.empty(0, dtype=CASE_DTYPE)
+        self._len = 0
+        # row → Step for rows that do not fit the columns (sparse)
+        self.extras: Dict[int, Step] = {}
+        self.extend(steps, case)
+
+    @classmethod
+    def from_cases(cls, cases: Iterable[Iterable], first_case: int = 0) -> "StepSequence":
+        """
+        One sequence for a suite; case ids number the cases from first_case.
+        """
+        steps: List = []
+        lengths: List[int] = []
+        for case in cases:
+            before = len(steps)
+            steps.extend(case)
+            lengths.append(len(steps) - before)
+        ids = np.repeat(np.arange(first_case, first_case + len(lengths)), lengths)
+        return cls(steps, ids)
+
+    @classmethod
+    def concatenate(cls, sequences: Iterable["StepSequence"]) -> "StepSequence":
+        sequences = list(sequences)
+        seq = cls()
+        offset = 0
+        for s in sequences:
+            seq.extras.update((row + offset, step) for row, step in s.extras.items())
+            offset += len(s)
+        seq._action = np.concatenate([s.action for s in sequences] or [seq._action])
+        seq._value = np.concatenate([s.value for s in sequences] or [seq._value])
+        seq._case = np.concatenate([s.case for s in sequences] or [seq._case])
+        seq._len = offset
+        return seq
+
+    @classmethod
+    def _view(cls, action, value, case, extras: Dict[int, Step]) -> "StepSequence":
+        seq = cls.__new__(cls)
+        seq._action, seq._value, seq._case = action, value, case
+        seq._len = len(action)
+        seq.extras = extras
+        return seq
+
+    # ---------------------------------------------------------
+    # COLUMNS (read-only views of the used part of the buffers)
+    # ---------------------------------------------------------
+    @property
+    def action(self) -> np.ndarray:
+        return self._readonly(self._action)
+
+    @property
+    def value(self) -> np.ndarray:
+        return self._readonly(self._value)
+
+    @property
+    def case(self) -> np.ndarray:
+        return self._readonly(self._case)
+
+    @property
+    def nbytes(self) -> int:
+        return self._len * (
+            self._action.itemsize + self._value.itemsize + self._case.itemsize
+        )
+
+    def _readonly(self, buffer: np.ndarray) -> np.ndarray:
+        view = buffer[: self._len]
+        view.flags.writeable = False
+        return view
+
+    # ---------------------------------------------------------
+    # APPEND / EXTEND
+    # ---------------------------------------------------------
+    def append(self, step, case: int = 0):
+        self.extend((step,), case)
+
+    def extend(self, steps: Iterable, case: int | Iterable[int] = 0):
+        """
+        Appends Steps / dict steps with case id `case` (one id, or one per
+        step) or, zero Python work per step, another StepSequence (keeping
+        its case ids).
+        """
+        if isinstance(steps, StepSequence):
+            self._extend_columns(steps.action, steps.value, steps.case, steps.extras)
+            return
+
+        codes: List[int] = []
+        values: List[int] = []
+        extras: Dict[int, Step] = {}
+        for row, step in enumerate(steps):
+            step = as_step(step)
+            encoded = _encode(step)
+            if encoded is None:
+                extras[row] = step
+                encoded = EXTRA, NO_VALUE
+            codes.append(encoded[0])
+            values.append(encoded[1])
+
+        self._extend_columns(
+            np.array(codes, dtype=ACTION_DTYPE),
+            np.array(values, dtype=VALUE_DTYPE),
+            np.full(len(codes), case, dtype=CASE_DTYPE)
+            if np.isscalar(case)
+            else np.asarray(case, dtype=CASE_DTYPE),
+            extras,
+        )
+
+    def _extend_columns(self, action, value, case, extras: Dict[int, Step]):
+        if not len(action):
+            return
+        start, stop = self._len, self._len + len(action)
+        if stop > len(self._action):
+            self._grow(stop)
+        self._action[start:stop] = action
+        self._value[start:stop] = value
+        self._case[start:stop] = case
+        self.extras.update((row + start, step) for row, step in extras.items())
+        self._len = stop
+
+    def _grow(self, needed: int):
+        # Fresh buffers: views handed out earlier keep the old ones
+        capacity = max(needed, 2 * len(self._action), 16)
+        for name in ("_action", "_value", "_case"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._len] = old[: self._len]
+            setattr(self, name, new)
+
+    # ---------------------------------------------------------
+    # ACCESS
+    # ---------------------------------------------------------
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, stride = key.indices(self._len)
+            if stride != 1:
+                return self.take(np.arange(start, stop, stride))
+            stop = max(start, stop)
+            extras = {
+                row - start: step for row, step in self.extras.items() if start <= row < stop
+            }
+            return self._view(
+                self.action[start:stop], self.value[start:stop], self.case[start:stop], extras
+            )
+
+        row = range(self._len)[key]
+        return self._step(row, int(self._action[row]), int(self._value[row]))
+
+    def __iter__(self) -> Iterator[Step]:
+        actions, values = self._columns()
+        steps = list(map(make_step, actions, values))
+        for row, step in self.extras.items():
+            steps[row] = step
+        return iter(steps)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StepSequence):
+            return NotImplemented
+        return (
+            np.array_equal(self.action, other.action)
+            and np.array_equal(self.value, other.value)
+            and np.array_equal(self.case, other.case)
+            and self.extras == other.extras
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"StepSequence({self._len} steps, {self.nbytes} bytes)"
+
+    def _step(self, row: int, code: int, value: int) -> Step:
+        if code == EXTRA:
+            return self.extras[row]
+        return make_step(_MEMBERS[code], None if value == NO_VALUE else value)
+
+    def pairs(self) -> Iterator[Tuple]:
+        """
+        (action, value) per step without building Steps: what the chaining,
+        optimizer and state machine rules read.
+        """
+        actions, values = self._columns()
+        for row, step in self.extras.items():
+            actions[row], values[row] = step.action, step.value
+        return zip(actions, values)
+
+    def _columns(self) -> Tuple[List, List]:
+        """
+        Action members and values (None for NO_VALUE) as Python lists.
+        """
+        actions = list(map(_MEMBERS.__getitem__, self.action.tolist()))
+        values = self.value.astype(object)
+        values[self.value == NO_VALUE] = None
+        return actions, values.tolist()
+
+    def runs(self) -> List[Tuple[int, int, int]]:
+        """
+        (case id, start, stop) per run of equal case ids.
+        """
+        if not self._len:
+            return []
+        case = self.case
+        bounds = (np.flatnonzero(case[1:] != case[:-1]) + 1).tolist()
+        starts = [0] + bounds
+        ids = case[starts].tolist()
+        return list(zip(ids, starts, bounds + [self._len]))
+
+    def cases(self) -> Iterator[Tuple[int, "StepSequence"]]:
+        """
+        (case id, zero-copy slice) per run of equal case ids.
+        """
+        for case_id, start, stop in self.runs():
+            yield case_id, self[start:stop]
+
+    # ---------------------------------------------------------
+    # SELECTION / CONVERSION
+    # ---------------------------------------------------------
+    def take(self, rows) -> "StepSequence":
+        """
+        Copy of the given rows (indices or boolean mask), in order.
+        """
+        rows = np.arange(self._len)[np.asarray(rows)]
+        extras = {}
+        if self.extras:
+            extras = {
+                new: self.extras[old]
+                for new, old in enumerate(rows.tolist())
+                if old in self.extras
+            }
+        return self._view(
+            self._action[rows], self._value[rows], self._case[rows], extras
+        )
+
+    def insert(self, rows, other: "StepSequence") -> "StepSequence":
+        """
+        Copy with other's steps inserted before the given rows (one row per
+        step of other, non-decreasing; np.insert semantics).
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        extras = {}
+        if self.extras:
+            # Original row r moves down by the number of inserts at or before it
+            shift = np.searchsorted(rows, list(self.extras), side="right")
+            extras = {
+                row + shift: step
+                for (row, step), shift in zip(self.extras.items(), shift.tolist())
+            }
+        extras.update((int(rows[k]) + k, step) for k, step in other.extras.items())
+        return self._view(
+            np.insert(self.action, rows, other.action),
+            np.insert(self.value, rows, other.value),
+            np.insert(self.case, rows, other.case),
+            extras,
+        )
+
+    def compress(self, keep: Iterable[bool]) -> "StepSequence":
+        return self.take(np.fromiter(keep, dtype=bool, count=self._len))
+
+    def to_steps(self) -> List[Step]:
+        return list(self)
+
+    def to_dicts(self) -> List[Dict]:
+        return [step.to_dict() for step in self]
@@ -0,0 +1,151 @@
+# src/steps/step.py
+
+import sys
+from enum import StrEnum
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.steps.actions import ACTION_CODES, ACTIONS
+
+
+class _Action(StrEnum):
+    @property
+    def code(self) -> int:
+        return ACTION_CODES[self]
+
+
+# Interned action enum over the canonical vocabulary. Members are str
+# subclasses (Action.SET_SPEED == "SET_SPEED"), so string comparisons,
+# dict lookups and JSON encoding keep working unchanged.
+Action = _Action("Action", [(name, name) for name in ACTIONS])
+
+_MEMBERS: Dict[str, Any] = {member.value: member for member in Action}
+
+# Shared instances per (action, value); bounded so free-form values
+# (e.g. every speed of a synthetic suite) cannot grow it without limit
+INTERN_LIMIT = 65536
+_INTERNED: Dict[Tuple, "Step"] = {}
+_INTERNABLE = (int, float, str, bool, type(None))
+
+
+def intern_action(name: str | None):
+    """
+    Canonical names → Action members; unknown names → interned str.
+    """
+    if name is None:
+        return None
+    member = _MEMBERS.get(name)
+    return member if member is not None else sys.intern(name)
+
+
+class Step:
+    """
+    One test step: action, the scalar "value" parameter (None when absent)
+    and, only for steps whose params are not {} / {"value": v}, the full
+    params dict in `extra`.
+
+    Steps built by make_step() / from_dict() are shared between sequences:
+    treat them as immutable.
+    """
+
+    __slots__ = ("action", "value", "extra")
+
+    def __init__(self, action, value=None, extra: Dict[str, Any] | None = None):
+        self.action = action
+        self.value = value
+        self.extra = extra
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """
+        Fresh params dict, as in the dict form.
+        """
+        if self.extra is not None:
+            return dict(self.extra)
+        return {} if self.value is None else {"value": self.value}
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        if self.action is None:
+            return {}
+        return {self.action: self.params}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Step):
+            return NotImplemented
+        return (
+            self.action == other.action
+            and self.value == other.value
+            and type(self.value) is type(other.value)
+            and self.extra == other.extra
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.action, self.value))
+
+    def __repr__(self) -> str:
+        action = None if self.action is None else str.__str__(self.action)
+        if self.extra is not None:
+            return f"Step({action!r}, params={self.extra!r})"
+        if self.value is not None:
+            return f"Step({action!r}, value={self.value!r})"
+        return f"Step({action!r})"
+
+    def __reduce__(self):
+        # Unpickle through the interning factory (process pools, shards)
+        if self.extra is not None:
+            return Step, (self.action, self.value, self.extra)
+        return make_step, (self.action, self.value)
+
+
+def make_step(action, value=None) -> Step:
+    """
+    Shared Step for (action, value); action may be a canonical name.
+    """
+    key = (action, value, type(value))
+    step = _INTERNED.get(key)
+    if step is None:
+        step = Step(intern_action(action), value)
+        if type(value) in _INTERNABLE and len(_INTERNED) < INTERN_LIMIT:
+            _INTERNED[key] = step
+    return step
+
+
+# ---------------------------------------------------------
+# Dict form converters ({"ACTION": {params}}) for I/O boundaries
+# ---------------------------------------------------------
+def from_dict(step: Dict[str, Dict[str, Any]]) -> Step:
+    if not step:
+        return make_step(None)
+    [(action, params)] = step.items()
+    if not params:
+        return make_step(action)
+    value = params.get("value")
+    if len(params) == 1 and value is not None and type(value) in _INTERNABLE:
+        return make_step(action, value)
+    return Step(intern_action(action), value, dict(params))
+
+
+def as_step(step) -> Step:
+    """
+    Accepts either form; Steps pass through untouched.
+    """
+    return step if type(step) is Step else from_dict(step)
+
+
+def to_steps(steps: Iterable) -> List[Step]:
+    return [step if type(step) is Step else from_dict(step) for step in steps]
+
+
+def to_dicts(steps: Iterable) -> List[Dict[str, Dict[str, Any]]]:
+    return [step.to_dict() if type(step) is Step else step for step in steps]
+
+
+def unpack(step) -> Tuple[Any, Dict[str, Any]]:
+    """
+    (action, params) of a Step or a dict step.
+    """
+    if type(step) is Step:
+        return step.action, step.params
+    if not step:
+        return None, {}
+    [(action, params)] = step.items()
+    return action, params or {}
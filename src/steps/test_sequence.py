@@ -0,0 +1,84 @@
+# src/steps/test_sequence.py
+
+import random
+
+import numpy as np
+
+from src.chaining.chaining_engine import ChainingEngine
+from src.optimizer.redundancy_optimizer import RedundancyOptimizer
+from src.state_machine.state_machine import StateMachine
+from src.steps.sequence import StepSequence
+from src.steps.step import to_dicts
+
+ACTIONS = ["ACC_ON", "ACC_OFF", "LANE_CHANGE_LEFT", "INDICATOR_LEFT", "APPLY_BRAKE"]
+
+
+def make_cases(num_cases: int = 2_000, seed: int = 5):
+    rng = random.Random(seed)
+    cases = []
+    for i in range(num_cases):
+        case = [{"SET_SPEED": {"value": rng.randrange(0, 181, 10)}}]
+        case += [{rng.choice(ACTIONS): {}} for _ in range(rng.randint(0, 6))]
+        if i % 500 == 7:
+            case.append({"SET_SPEED": {"value": 80, "unit": "km/h"}})  # kept in extras
+        cases.append(case if i % 250 else [])  # some empty cases
+    # Trailing empty cases: the first one still gets its ACC_OFF transition
+    return cases + [[{"ACC_ON": {}}], [], []]
+
+
+def main():
+    cases = make_cases()
+    seq = StepSequence.from_cases(cases)
+    flat = [step for case in cases for step in case]
+
+    print(seq, f"({seq.nbytes / len(seq):.0f} bytes/step, {len(seq.extras)} extra rows)")
+    assert seq.to_dicts() == flat
+
+    # Slices are views of the same buffers
+    part = seq[100:200]
+    assert np.shares_memory(part.action, seq.action) and part.to_dicts() == flat[100:200]
+    assert seq[-1].to_dict() == flat[-1]
+
+    # Appending never changes rows that views already expose
+    before = part.to_dicts()
+    part.append({"ACC_ON": {}}, case=-1)
+    seq.extend([{"APPLY_BRAKE": {}}] * 1000, case=len(cases))
+    assert part.to_dicts() == before + [{"ACC_ON": {}}] and seq[:100].to_dicts() == flat[:100]
+
+    halves = StepSequence.concatenate([seq[:500], seq[500:]])
+    assert halves == seq
+    print("[OK] Slices, append and concatenate")
+
+    # Engines give the same results on a sequence as on step lists
+    chained_list = ChainingEngine().chain_tests(cases)
+    chained_seq = ChainingEngine().chain_sequence(
+        StepSequence.from_cases(cases), num_cases=len(cases)
+    )
+    assert chained_seq.to_dicts() == to_dicts(chained_list)
+    assert (np.diff(chained_seq.case) >= 0).all()
+    assert chained_seq[-1].action == "ACC_OFF" and chained_seq.case[-1] == len(cases) - 2
+
+    # Case ids need not start at 0
+    offset = ChainingEngine().chain_sequence(
+        StepSequence.from_cases(cases, first_case=3), num_cases=len(cases), first_case=3
+    )
+    assert offset.to_dicts() == to_dicts(chained_list)
+    assert (offset.case == chained_seq.case + 3).all()
+
+    optimized_list = RedundancyOptimizer().optimize(chained_list)
+    optimized_seq = RedundancyOptimizer().optimize(chained_seq)
+    assert isinstance(optimized_seq, StepSequence)
+    assert optimized_seq.to_dicts() == to_dicts(optimized_list)
+
+    sm_list, sm_seq = StateMachine(), StateMachine()
+    results = [sm_list.apply_step(step) for step in optimized_list]
+    assert sm_seq.apply_sequence(optimized_seq) == results
+    assert sm_seq.get_state() == sm_list.get_state()
+    print(
+        f"[OK] Chain → optimize → state machine on a sequence: "
+        f"{len(chained_seq)} → {len(optimized_seq)} steps, same as lists"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# src/steps/test_step.py
+
+import json
+import pickle
+
+import src.steps.step as step_module
+from src.steps.step import (
+    INTERN_LIMIT,
+    Action,
+    Step,
+    from_dict,
+    make_step,
+    to_dicts,
+    to_steps,
+    unpack,
+)
+
+
+def main():
+    # Dict form round trips, including the edge cases
+    dict_steps = [
+        {"SET_SPEED": {"value": 80}},
+        {"SET_SPEED": {"value": 80.5}},
+        {"SET_SPEED": {"value": True}},
+        {"ACC_ON": {}},
+        {"APPLY_BRAKE": {"value": None}},
+        {"SET_SPEED": {"value": 80, "unit": "km/h"}},
+        {"OPEN_SUNROOF": {}},
+        {"OPEN_SUNROOF": {"value": "half"}},
+        {},
+    ]
+    for d in dict_steps:
+        step = from_dict(d)
+        assert step.to_dict() == d, (d, step.to_dict())
+        assert unpack(step) == unpack(d)
+    assert to_dicts(to_steps(dict_steps)) == dict_steps
+
+    assert from_dict({}).action is None
+    assert from_dict({"ACC_ON": {}}).action is Action.ACC_ON
+    assert from_dict({"OPEN_SUNROOF": {}}).action == "OPEN_SUNROOF"
+    assert from_dict({"SET_SPEED": {"value": 80, "unit": "km/h"}}).extra == {
+        "value": 80,
+        "unit": "km/h",
+    }
+    print("[OK] from_dict / to_dict round trips")
+
+    # bool and int values are different steps (True == 1 in Python)
+    assert from_dict({"SET_SPEED": {"value": True}}) != from_dict({"SET_SPEED": {"value": 1}})
+    assert make_step("SET_SPEED", True) is not make_step("SET_SPEED", 1)
+    assert type(make_step("SET_SPEED", True).value) is bool
+    assert type(from_dict({"SET_SPEED": {"value": 1.0}}).value) is float
+    print("[OK] bool / int / float values stay distinct")
+
+    # Interning: one shared instance per (action, value)
+    assert make_step("SET_SPEED", 50) is make_step(Action.SET_SPEED, 50)
+    assert from_dict({"ACC_ON": {}}) is make_step("ACC_ON")
+    assert from_dict({"SET_SPEED": {"value": 80, "unit": "km/h"}}) is not from_dict(
+        {"SET_SPEED": {"value": 80, "unit": "km/h"}}
+    )
+
+    # ...bounded by INTERN_LIMIT, past which steps are still built, not cached
+    interned = step_module._INTERNED
+    saved = dict(interned)
+    try:
+        interned.clear()
+        for value in range(INTERN_LIMIT + 100):
+            make_step("SET_SPEED", value)
+        assert len(interned) == INTERN_LIMIT
+        over = make_step("SET_SPEED", INTERN_LIMIT + 50)
+        assert over == make_step("SET_SPEED", INTERN_LIMIT + 50)
+        assert over is not make_step("SET_SPEED", INTERN_LIMIT + 50)
+    finally:
+        interned.clear()
+        interned.update(saved)
+    print(f"[OK] Interning, capped at {INTERN_LIMIT} entries")
+
+    # Pickling goes back through the interning factory
+    for d in dict_steps:
+        step = from_dict(d)
+        copy = pickle.loads(pickle.dumps(step))
+        assert copy == step and copy.to_dict() == d
+        if step.extra is None:
+            assert copy is step
+    assert pickle.loads(pickle.dumps(make_step("ACC_ON"))).action is Action.ACC_ON
+    print("[OK] Pickle round trips (interned steps unpickle to the shared instance)")
+
+    # Action members are str: JSON output is the plain dict form
+    steps = to_steps(dict_steps)
+    assert json.dumps(to_dicts(steps)) == json.dumps(dict_steps)
+    assert json.loads(json.dumps(make_step(Action.SET_SPEED, 30).to_dict())) == {
+        "SET_SPEED": {"value": 30}
+    }
+    assert repr(make_step("SET_SPEED", 30)) == "Step('SET_SPEED', value=30)"
+    assert isinstance(make_step("ACC_ON"), Step)
+    print("[OK] JSON output identical to the dict form")
+
+
+if __name__ == "__main__":
+    main()
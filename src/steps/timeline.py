@@ -0,0 +1,150 @@
+# src/steps/timeline.py
+
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from src.steps.actions import ACTION_CODES, ACTIONS
+
+# Timeline encodings (plots use the same numbers on their y axes)
+LANE_CODES: Dict[str, int] = {"RIGHT": 0, "CENTER": 1, "LEFT": 2}
+INDICATOR_CODES: Dict[str, int] = {"OFF": 0, "LEFT": 1, "RIGHT": 2}
+
+UNKNOWN_ACTION = -1
+SET_SPEED = ACTION_CODES["SET_SPEED"]
+
+
+def _event_table(events: Dict[str, int]) -> np.ndarray:
+    """
+    Lookup table code → new state (-1 = no change). One spare slot at the
+    end so UNKNOWN_ACTION (-1) indexes a "no change" entry.
+    """
+    table = np.full(len(ACTIONS) + 1, -1, dtype=np.int8)
+    for action, state in events.items():
+        table[ACTION_CODES[action]] = state
+    return table
+
+
+ACC_EVENTS = _event_table({"ACC_ON": 1, "ACC_OFF": 0})
+LANE_EVENTS = _event_table(
+    {"LANE_CHANGE_LEFT": LANE_CODES["LEFT"], "LANE_CHANGE_RIGHT": LANE_CODES["RIGHT"]}
+)
+INDICATOR_EVENTS = _event_table(
+    {"INDICATOR_LEFT": INDICATOR_CODES["LEFT"], "INDICATOR_RIGHT": INDICATOR_CODES["RIGHT"]}
+)
+
+
+class Timelines(NamedTuple):
+    """
+    Per-step vehicle signals after each step of a timeline.
+    speed: km/h, acc: 0/1, lane: LANE_CODES, indicator: INDICATOR_CODES.
+    """
+
+    speed: np.ndarray
+    acc: np.ndarray
+    lane: np.ndarray
+    indicator: np.ndarray
+
+
+def _fill(n: int, rows: np.ndarray, values: np.ndarray, initial, dtype) -> np.ndarray:
+    """
+    Piecewise-constant signal: `initial` until rows[0], then values[i] from
+    rows[i] up to the next row. Events are sparse, so np.repeat over the
+    segment lengths beats a per-step forward fill.
+    """
+    out = np.empty(n, dtype=dtype)
+    first = int(rows[0]) if len(rows) else n
+    out[:first] = initial
+    if len(rows):
+        out[first:] = np.repeat(values, np.diff(rows, append=n))
+    return out
+
+
+def _hold(codes: np.ndarray, events: np.ndarray, initial) -> np.ndarray:
+    """
+    State set by the actions of an event table, held until the next event.
+    """
+    changes = events[codes]
+    rows = np.flatnonzero(changes >= 0)
+    return _fill(len(codes), rows, changes[rows], initial, np.int8)
+
+
+def timelines_from_codes(
+    codes: np.ndarray, set_speed_rows: np.ndarray, set_speed_values: np.ndarray
+) -> Timelines:
+    """
+    Vectorised extraction from integer action codes (see src/steps/actions.py)
+    plus the rows / values of the SET_SPEED steps that carry a value.
+    """
+    codes = np.asarray(codes, dtype=np.intp)  # native index type: fastest table lookups
+    values = np.asarray(set_speed_values)
+    speed_dtype = np.result_type(values.dtype, np.int64) if len(values) else np.int64
+    return Timelines(
+        speed=_fill(len(codes), np.asarray(set_speed_rows, dtype=np.int64), values, 0, speed_dtype),
+        acc=_hold(codes, ACC_EVENTS, 0),
+        lane=_hold(codes, LANE_EVENTS, LANE_CODES["CENTER"]),
+        indicator=_hold(codes, INDICATOR_EVENTS, INDICATOR_CODES["OFF"]),
+    )
+
+
+def action_codes(steps: List[Dict]) -> np.ndarray:
+    """
+    The only per-step Python pass: formatted steps → int16 action codes.
+    """
+    actions = map(itemgetter("action"), steps)
+    return np.fromiter(
+        map(ACTION_CODES.get, actions, repeat(UNKNOWN_ACTION)), dtype=np.int16, count=len(steps)
+    )
+
+
+def extract_timelines(steps: List[Dict]) -> Timelines:
+    """
+    Speed, ACC, lane and indicator timelines of formatted steps
+    ({"index", "action", "params"}) in one pass over the step list; only
+    SET_SPEED steps are revisited for their values.
+    """
+    codes = action_codes(steps)
+    rows, values = [], []
+    for row in np.flatnonzero(codes == SET_SPEED).tolist():
+        value = steps[row]["params"].get("value")
+        if value is not None:
+            rows.append(row)
+            values.append(value)
+    return timelines_from_codes(codes, np.asarray(rows, dtype=np.int64), np.asarray(values))
+
+
+def timelines_from_table(table) -> Timelines:
+    """
+    Timelines straight from a memory-mapped columnar step table
+    (src/artifacts/columnar.py) without rebuilding step dicts.
+    """
+    from src.artifacts.columnar import NO_VALUE
+
+    # Table codes are per-file; map them onto the canonical vocabulary
+    remap = np.array([ACTION_CODES.get(a, UNKNOWN_ACTION) for a in table.actions], dtype=np.int16)
+    codes = remap[table.column("action")]
+    rows = np.flatnonzero(codes == SET_SPEED)
+    speeds = np.asarray(table.column("value"))[rows]
+
+    # Irregular SET_SPEED params (floats, big ints) live in the sparse extra map
+    irregular = {
+        int(r): p.get("value") if isinstance(p, dict) else None
+        for r, p in table.meta["extra"].items()
+        if codes[int(r)] == SET_SPEED
+    }
+    if not irregular:
+        keep = speeds != NO_VALUE
+        return timelines_from_codes(codes, rows[keep], speeds[keep])
+
+    pairs = [
+        (r, irregular[r] if r in irregular else (None if v == NO_VALUE else v))
+        for r, v in zip(rows.tolist(), speeds.tolist())
+    ]
+    pairs = [(r, v) for r, v in pairs if v is not None]
+    return timelines_from_codes(
+        codes,
+        np.array([r for r, _ in pairs], dtype=np.int64),
+        np.array([v for _, v in pairs]),
+    )
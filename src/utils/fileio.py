@@ -0,0 +1,44 @@
+# src/utils/fileio.py
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+
+
+# ---------------------------------------------------------
+# ATOMIC WRITES
+# ---------------------------------------------------------
+def atomic_write_text(path: str, text: str):
+    """
+    Writes to a temp file in the same folder, then renames it over `path`,
+    so readers never observe a half-written file.
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: int | None = None):
+    atomic_write_text(path, json.dumps(data, indent=indent))
+
+
+# ---------------------------------------------------------
+# HASHING
+# ---------------------------------------------------------
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -1,136 +1,243 @@
 # src/visualisation/visualisations.py
 
+import multiprocessing
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+from src.steps.timeline import extract_timelines
 
-# ---------------------------------------------------------
-# Extract speed values from formatted steps
-# ---------------------------------------------------------
-def extract_speed_profile(steps):
-    speeds = []
-    current_speed = 0
-
-    for step in steps:
-        action = step["action"]
-        params = step["params"]
-
-        if action == "SET_SPEED":
-            current_speed = params.get("value", current_speed)
+# Points drawn per plot; longer timelines are downsampled (shape-preserving).
+# 0 / None draws every step.
+PLOT_MAX_POINTS = 5000
+# Per-point markers only while they stay readable
+MARKER_MAX_POINTS = 200
+# Worker start-up (spawn + matplotlib import) costs ~1 s: below this many
+# drawn points per plot, rendering in-process is faster
+PARALLEL_MIN_POINTS = 200_000
 
-        speeds.append(current_speed)
 
-    return speeds
+# ---------------------------------------------------------
+# Plot specs (rich colours + legends)
+# ---------------------------------------------------------
+PLOTS: Dict[str, Dict] = {
+    "speed_profile": {
+        "signal": "speed",
+        "label": "speed profile",
+        "figsize": (10, 4),
+        "style": "line",
+        "color": "#1f77b4",
+        "title": "Speed Profile Over Steps",
+        "ylabel": "Speed (km/h)",
+        "legend": "Speed",
+        "ylim": None,
+    },
+    "acc_timeline": {
+        "signal": "acc",
+        "label": "ACC timeline",
+        "figsize": (10, 2.5),
+        "style": "step",
+        "color": "#2ca02c",
+        "title": "ACC Engagement Timeline",
+        "ylabel": "ACC (1=ON, 0=OFF)",
+        "legend": "ACC State",
+        "ylim": (-0.2, 1.2),
+    },
+    "lane_timeline": {
+        "signal": "lane",
+        "label": "lane timeline",
+        "figsize": (10, 3),
+        "style": "step",
+        "color": "#9467bd",
+        "title": "Lane Position Timeline",
+        "ylabel": "Lane (0=Right, 1=Center, 2=Left)",
+        "legend": "Lane Position",
+        "ylim": (-0.5, 2.5),
+    },
+}
 
 
 # ---------------------------------------------------------
-# Extract ACC ON/OFF timeline
+# Timelines: one fused pass (src/steps/timeline.py); the
+# per-signal helpers below are views of the same arrays
 # ---------------------------------------------------------
-def extract_acc_timeline(steps):
-    acc_state = []
-    acc_on = False
+def extract_speed_profile(steps):
+    return extract_timelines(steps).speed
 
-    for step in steps:
-        action = step["action"]
 
-        if action == "ACC_ON":
-            acc_on = True
-        elif action == "ACC_OFF":
-            acc_on = False
+def extract_acc_timeline(steps):
+    return extract_timelines(steps).acc
 
-        acc_state.append(1 if acc_on else 0)
 
-    return acc_state
+def extract_lane_timeline(steps):
+    return extract_timelines(steps).lane
 
 
 # ---------------------------------------------------------
-# Extract lane timeline
+# Downsampling
 # ---------------------------------------------------------
-def extract_lane_timeline(steps):
-    lane = "CENTER"
-    lane_map = {"LEFT": 2, "CENTER": 1, "RIGHT": 0}
-    timeline = []
-
-    for step in steps:
-        action = step["action"]
+def change_points(values: np.ndarray) -> np.ndarray:
+    """
+    Indices where a piecewise-constant signal changes, plus both ends.
+    Drawn with steps-post, these reproduce the signal exactly.
+    """
+    n = len(values)
+    if n == 0:
+        return np.arange(0)
+    changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+    return np.unique(np.concatenate(([0], changes, [n - 1])))
+
+
+def minmax_buckets(values: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max bucketing: each of max_points // 2 buckets keeps its min and max
+    (in trend order), so spikes and the envelope survive downsampling.
+    """
+    n = len(values)
+    buckets = max(1, max_points // 2)
+    starts = np.unique(np.linspace(0, n, buckets, endpoint=False).astype(np.int64))
+    ends = np.append(starts[1:], n) - 1
+
+    lows = np.minimum.reduceat(values, starts)
+    highs = np.maximum.reduceat(values, starts)
+    rising = values[starts] <= values[ends]
+
+    x = np.repeat(starts, 2)
+    y = np.empty(2 * len(starts), dtype=values.dtype)
+    y[0::2] = np.where(rising, lows, highs)
+    y[1::2] = np.where(rising, highs, lows)
+    return x, y
+
+
+def downsample(values: np.ndarray, max_points: int = PLOT_MAX_POINTS):
+    """
+    (x, y, reduced): every point when within budget, else the exact change
+    points, else min/max buckets.
+    """
+    values = np.asarray(values)
+    if not max_points or len(values) <= max_points:
+        return np.arange(len(values)), values, False
+
+    idx = change_points(values)
+    if len(idx) <= max_points:
+        return idx, values[idx], True
+    return (*minmax_buckets(values, max_points), True)
 
-        if action == "LANE_CHANGE_LEFT":
-            lane = "LEFT"
-        elif action == "LANE_CHANGE_RIGHT":
-            lane = "RIGHT"
 
-        timeline.append(lane_map[lane])
-
-    return timeline
+# ---------------------------------------------------------
+# Rendering (explicit Figure + Agg canvas, no pyplot state)
+# ---------------------------------------------------------
+def render_plot(name: str, values, out_dir: str, max_points: int = PLOT_MAX_POINTS):
+    """
+    Renders one plot of PLOTS to out_dir/<name>.png.
+    Returns (path, seconds, points drawn).
+    """
+    start = time.perf_counter()
+    spec = PLOTS[name]
+    x, y, reduced = downsample(values, max_points)
+
+    fig = Figure(figsize=spec["figsize"])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    if reduced:
+        ax.plot(x, y, drawstyle="steps-post", color=spec["color"], linewidth=1.5)
+    elif spec["style"] == "line":
+        marker = "o" if len(x) <= MARKER_MAX_POINTS else None
+        ax.plot(x, y, marker=marker, color=spec["color"], linewidth=2)
+    else:
+        ax.step(x, y, where="mid", color=spec["color"], linewidth=2)
+
+    title = spec["title"]
+    if reduced:
+        title += f" ({len(values):,} steps, {len(x):,} points drawn)"
+    ax.set_title(title)
+    ax.set_xlabel("Step Index")
+    ax.set_ylabel(spec["ylabel"])
+    if spec["ylim"]:
+        ax.set_ylim(*spec["ylim"])
+    ax.grid(True)
+    ax.legend([spec["legend"]], loc="upper left")
+
+    path = os.path.join(out_dir, f"{name}.png")
+    fig.savefig(path)
+    return path, time.perf_counter() - start, len(x)
+
+
+def _plot(name: str, steps, out_dir: str, timelines=None, max_points: int = PLOT_MAX_POINTS):
+    if timelines is None:
+        timelines = extract_timelines(steps)
+    path, _, _ = render_plot(name, getattr(timelines, PLOTS[name]["signal"]), out_dir, max_points)
+    print(f"[OK] Saved {PLOTS[name]['label']} → {path}")
 
 
 # ---------------------------------------------------------
 # Plot 1: Speed Profile
 # ---------------------------------------------------------
-def plot_speed_profile(steps, out_dir):
-    speeds = extract_speed_profile(steps)
-
-    plt.figure(figsize=(10, 4))
-    plt.plot(speeds, marker="o", color="#1f77b4", linewidth=2)
-    plt.title("Speed Profile Over Steps")
-    plt.xlabel("Step Index")
-    plt.ylabel("Speed (km/h)")
-    plt.grid(True)
-    plt.legend(["Speed"], loc="upper left")
-
-    path = os.path.join(out_dir, "speed_profile.png")
-    plt.savefig(path)
-    plt.close()
-    print(f"[OK] Saved speed profile → {path}")
+def plot_speed_profile(steps, out_dir, timelines=None, max_points=PLOT_MAX_POINTS):
+    _plot("speed_profile", steps, out_dir, timelines, max_points)
 
 
 # ---------------------------------------------------------
 # Plot 2: ACC Timeline
 # ---------------------------------------------------------
-def plot_acc_timeline(steps, out_dir):
-    acc = extract_acc_timeline(steps)
-
-    plt.figure(figsize=(10, 2.5))
-    plt.step(range(len(acc)), acc, where="mid", color="#2ca02c", linewidth=2)
-    plt.title("ACC Engagement Timeline")
-    plt.xlabel("Step Index")
-    plt.ylabel("ACC (1=ON, 0=OFF)")
-    plt.ylim(-0.2, 1.2)
-    plt.grid(True)
-    plt.legend(["ACC State"], loc="upper left")
-
-    path = os.path.join(out_dir, "acc_timeline.png")
-    plt.savefig(path)
-    plt.close()
-    print(f"[OK] Saved ACC timeline → {path}")
+def plot_acc_timeline(steps, out_dir, timelines=None, max_points=PLOT_MAX_POINTS):
+    _plot("acc_timeline", steps, out_dir, timelines, max_points)
 
 
 # ---------------------------------------------------------
 # Plot 3: Lane Timeline
 # ---------------------------------------------------------
-def plot_lane_timeline(steps, out_dir):
-    lane = extract_lane_timeline(steps)
+def plot_lane_timeline(steps, out_dir, timelines=None, max_points=PLOT_MAX_POINTS):
+    _plot("lane_timeline", steps, out_dir, timelines, max_points)
 
-    plt.figure(figsize=(10, 3))
-    plt.step(range(len(lane)), lane, where="mid", color="#9467bd", linewidth=2)
-    plt.title("Lane Position Timeline")
-    plt.xlabel("Step Index")
-    plt.ylabel("Lane (0=Right, 1=Center, 2=Left)")
-    plt.ylim(-0.5, 2.5)
-    plt.grid(True)
-    plt.legend(["Lane Position"], loc="upper left")
 
-    path = os.path.join(out_dir, "lane_timeline.png")
-    plt.savefig(path)
-    plt.close()
-    print(f"[OK] Saved lane timeline → {path}")
+def available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
 
 
 # ---------------------------------------------------------
 # Combined function to generate all visualisations
 # ---------------------------------------------------------
-def generate_all_visualisations(steps, out_dir):
-    plot_speed_profile(steps, out_dir)
-    plot_acc_timeline(steps, out_dir)
-    plot_lane_timeline(steps, out_dir)
+def generate_all_visualisations(
+    steps,
+    out_dir,
+    max_points: int = PLOT_MAX_POINTS,
+    workers: int | None = None,
+    timelines=None,
+) -> Dict[str, float]:
+    """
+    Renders every plot; workers=None picks worker processes only when
+    several CPUs are free and the plots draw enough points to pay for the
+    worker start-up (1 = in-process). Returns seconds per plot.
+    """
+    if timelines is None:
+        timelines = extract_timelines(steps)
+    jobs = [(name, getattr(timelines, spec["signal"])) for name, spec in PLOTS.items()]
+
+    if workers is None:
+        drawn = min(len(timelines.speed), max_points or len(timelines.speed))
+        workers = min(len(jobs), available_cpus()) if drawn >= PARALLEL_MIN_POINTS else 1
+
+    if workers > 1:
+        # spawn: the parent may hold model / BLAS threads that fork would copy
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as pool:
+            futures = [pool.submit(render_plot, name, values, out_dir, max_points) for name, values in jobs]
+            results = [f.result() for f in futures]
+    else:
+        results = [render_plot(name, values, out_dir, max_points) for name, values in jobs]
+
+    timings = {}
+    for (name, values), (path, seconds, points) in zip(jobs, results):
+        timings[name] = seconds
+        drawn = f", {points:,}/{len(values):,} points" if points < len(values) else ""
+        print(f"[OK] Saved {PLOTS[name]['label']} → {path} ({seconds:.2f} s{drawn})")
+    return timings